@@ -0,0 +1,63 @@
+"""Add composite indexes for advertisement listings
+
+Revision ID: add_advertisement_listing_indexes
+Revises: add_advertisement_trgm_indexes
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = 'add_advertisement_listing_indexes'
+down_revision = 'add_advertisement_trgm_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create indexes that return each listing already in (created_at, id) DESC order."""
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_advertisement_user_created', 'advertisements',
+            ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'idx_advertisement_pending_created', 'advertisements',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_where=sa.text("status = 'pending'"),
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'idx_advertisement_created_id', 'advertisements',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        # Covered by the leading column of idx_advertisement_user_created
+        op.drop_index('idx_advertisement_user', table_name='advertisements', postgresql_concurrently=True, if_exists=True)
+        # Covered by the leading column of idx_advertisement_created_id
+        op.drop_index('idx_advertisement_created', table_name='advertisements', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Restore the single-column user and created_at indexes and drop the listing indexes."""
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_advertisement_user', 'advertisements', ['user_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'idx_advertisement_created', 'advertisements', ['created_at'],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.drop_index('idx_advertisement_created_id', table_name='advertisements', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_advertisement_pending_created', table_name='advertisements', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_advertisement_user_created', table_name='advertisements', postgresql_concurrently=True, if_exists=True)
@@ -49,19 +49,27 @@ def upgrade() -> None:
         nullable=False
     )
     
-    # Create indexes
-    op.create_index('idx_advertisement_user', 'advertisements', ['user_id'])
-    op.create_index('idx_advertisement_status', 'advertisements', ['status'])
-    op.create_index('idx_advertisement_created', 'advertisements', ['created_at'])
+    # Create indexes without blocking writes (CONCURRENTLY cannot run in a transaction)
+    with op.get_context().autocommit_block():
+        op.create_index('idx_advertisement_user', 'advertisements', ['user_id'],
+            postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_advertisement_status', 'advertisements', ['status'],
+            postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_advertisement_created', 'advertisements', ['created_at'],
+            postgresql_concurrently=True, if_not_exists=True)
 
 
 def downgrade() -> None:
     """Remove the added columns and indexes."""
     
     # Drop indexes
-    op.drop_index('idx_advertisement_created', table_name='advertisements')
-    op.drop_index('idx_advertisement_status', table_name='advertisements')
-    op.drop_index('idx_advertisement_user', table_name='advertisements')
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_advertisement_created', table_name='advertisements',
+            postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_advertisement_status', table_name='advertisements',
+            postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_advertisement_user', table_name='advertisements',
+            postgresql_concurrently=True, if_exists=True)
     
     # Drop columns
     op.drop_column('advertisements', 'reviewed_at')
@@ -0,0 +1,44 @@
+"""Add trigram indexes for advertisement search
+
+Revision ID: add_advertisement_trgm_indexes
+Revises: add_unique_lookup_names
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+# revision identifiers
+revision = 'add_advertisement_trgm_indexes'
+down_revision = 'add_unique_lookup_names'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create pg_trgm GIN indexes so ILIKE '%term%' search avoids a sequential scan."""
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_advertisement_title_trgm', 'advertisements', ['title'],
+            postgresql_using='gin',
+            postgresql_ops={'title': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'idx_advertisement_description_trgm', 'advertisements', ['description'],
+            postgresql_using='gin',
+            postgresql_ops={'description': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    """Drop the trigram indexes, leaving the extension installed."""
+
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_advertisement_description_trgm', table_name='advertisements', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_advertisement_title_trgm', table_name='advertisements', postgresql_concurrently=True, if_exists=True)
@@ -30,15 +30,25 @@ def upgrade() -> None:
         'users',
         sa.Column('google_id', sa.String(), nullable=True)
     )
-    op.create_unique_constraint('uq_users_google_id', 'users', ['google_id'])
-    op.create_index('idx_users_google_id', 'users', ['google_id'])
+
+    # A unique index enforces the same rule as a unique constraint but can be
+    # built CONCURRENTLY, which is not allowed inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index('uq_users_google_id', 'users', ['google_id'], unique=True,
+            postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_users_google_id', 'users', ['google_id'],
+            postgresql_concurrently=True, if_not_exists=True)
 
 
 def downgrade() -> None:
     """Remove google_id and restore hashed_password as NOT NULL."""
 
-    op.drop_index('idx_users_google_id', table_name='users')
-    op.drop_constraint('uq_users_google_id', 'users', type_='unique')
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_users_google_id', table_name='users',
+            postgresql_concurrently=True, if_exists=True)
+
+    # Dropping the column also drops uq_users_google_id, whether it was
+    # created as a unique index or as a constraint by an older revision
     op.drop_column('users', 'google_id')
 
     op.alter_column(
@@ -0,0 +1,35 @@
+"""Add a location index for help request radius search
+
+Revision ID: add_help_location_index
+Revises: add_pet_keyset_indexes
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = 'add_help_location_index'
+down_revision = 'add_pet_keyset_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create an index that serves the bounding box of a radius search."""
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_help_location', 'pet_help_requests',
+            ['location_lat', 'location_lng'],
+            postgresql_where=sa.text('location_lat IS NOT NULL AND location_lng IS NOT NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    """Drop the location index."""
+
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_help_location', table_name='pet_help_requests', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,42 @@
+"""Add (created_at, id) indexes for keyset pagination
+
+Revision ID: add_keyset_pagination_indexes
+Revises: add_stats_partial_indexes
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = 'add_keyset_pagination_indexes'
+down_revision = 'add_stats_partial_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create composite indexes matching the newest-first admin listings."""
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_pets_created_id', 'pets',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_where=sa.text('deleted_at IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'idx_users_created_id', 'users',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination indexes."""
+
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_users_created_id', table_name='users', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_pets_created_id', table_name='pets', postgresql_concurrently=True, if_exists=True)
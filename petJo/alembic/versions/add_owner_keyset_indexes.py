@@ -0,0 +1,41 @@
+"""Add owner keyset indexes for breeding requests and missing animals
+
+Revision ID: add_owner_keyset_indexes
+Revises: add_search_trgm_indexes
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = 'add_owner_keyset_indexes'
+down_revision = 'add_search_trgm_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create indexes that return an owner's records already in (created_at, id) DESC order."""
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_breeding_owner_created', 'breeding_requests',
+            ['owner_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'idx_missing_owner_created', 'missing_animals',
+            ['owner_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    """Drop the owner keyset indexes."""
+
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_missing_owner_created', table_name='missing_animals', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_breeding_owner_created', table_name='breeding_requests', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,49 @@
+"""Add keyset indexes for pet and help request listings
+
+Revision ID: add_pet_keyset_indexes
+Revises: add_owner_keyset_indexes
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = 'add_pet_keyset_indexes'
+down_revision = 'add_owner_keyset_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create indexes that return pet and help request listings already in (created_at, id) DESC order."""
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_pets_owner_created_id', 'pets',
+            ['owner_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_where=sa.text('deleted_at IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'idx_help_created_id', 'pet_help_requests',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'idx_help_owner_created_id', 'pet_help_requests',
+            ['owner_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    """Drop the keyset indexes."""
+
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_help_owner_created_id', table_name='pet_help_requests', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_help_created_id', table_name='pet_help_requests', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_pets_owner_created_id', table_name='pets', postgresql_concurrently=True, if_exists=True)
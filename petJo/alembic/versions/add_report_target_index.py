@@ -0,0 +1,34 @@
+"""Add an index for listing the reports of a target
+
+Revision ID: add_report_target_index
+Revises: add_user_email_lower_index
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = 'add_report_target_index'
+down_revision = 'add_user_email_lower_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create an index that serves the target filter and its newest-first order."""
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_report_target_created', 'reports',
+            ['target_type', 'target_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    """Drop the report target index."""
+
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_report_target_created', table_name='reports', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,92 @@
+"""Add trigram indexes for breeding request and missing animal search
+
+Revision ID: add_search_trgm_indexes
+Revises: add_advertisement_listing_indexes
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+# revision identifiers
+revision = 'add_search_trgm_indexes'
+down_revision = 'add_advertisement_listing_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create pg_trgm GIN indexes on the columns matched by the search endpoints."""
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_breeding_title_trgm', 'breeding_requests', ['title'],
+            postgresql_using='gin',
+            postgresql_ops={'title': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'idx_breeding_description_trgm', 'breeding_requests', ['description'],
+            postgresql_using='gin',
+            postgresql_ops={'description': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'idx_breeding_preferred_breed_trgm', 'breeding_requests', ['preferred_breed'],
+            postgresql_using='gin',
+            postgresql_ops={'preferred_breed': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'idx_missing_pet_name_trgm', 'missing_animals', ['pet_name'],
+            postgresql_using='gin',
+            postgresql_ops={'pet_name': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'idx_missing_breed_trgm', 'missing_animals', ['breed'],
+            postgresql_using='gin',
+            postgresql_ops={'breed': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'idx_missing_color_trgm', 'missing_animals', ['color'],
+            postgresql_using='gin',
+            postgresql_ops={'color': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'idx_missing_description_trgm', 'missing_animals', ['description'],
+            postgresql_using='gin',
+            postgresql_ops={'description': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'idx_missing_features_trgm', 'missing_animals', ['distinguishing_features'],
+            postgresql_using='gin',
+            postgresql_ops={'distinguishing_features': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    """Drop the trigram indexes, leaving the extension installed."""
+
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_missing_features_trgm', table_name='missing_animals', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_missing_description_trgm', table_name='missing_animals', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_missing_color_trgm', table_name='missing_animals', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_missing_breed_trgm', table_name='missing_animals', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_missing_pet_name_trgm', table_name='missing_animals', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_breeding_preferred_breed_trgm', table_name='breeding_requests', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_breeding_description_trgm', table_name='breeding_requests', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_breeding_title_trgm', table_name='breeding_requests', postgresql_concurrently=True, if_exists=True)
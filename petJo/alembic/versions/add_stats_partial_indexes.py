@@ -0,0 +1,73 @@
+"""Add partial indexes backing the admin stats filters
+
+Revision ID: add_stats_partial_indexes
+Revises: add_google_oauth
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = 'add_stats_partial_indexes'
+down_revision = 'add_google_oauth'
+branch_labels = None
+depends_on = None
+
+AD_STATUSES = ('pending', 'approved', 'rejected')
+
+
+def upgrade() -> None:
+    """Create partial indexes for live pets and per-status advertisements."""
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_pet_status_alive', 'pets', ['status'],
+            postgresql_where=sa.text('deleted_at IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'idx_pet_deleted_at_null', 'pets', ['id'],
+            postgresql_where=sa.text('deleted_at IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+        for ad_status in AD_STATUSES:
+            op.create_index(
+                f'idx_advertisement_status_{ad_status}', 'advertisements', ['id'],
+                postgresql_where=sa.text(f"status = '{ad_status}'"),
+                postgresql_concurrently=True,
+                if_not_exists=True
+            )
+
+        op.drop_index(
+            'idx_advertisement_status',
+            table_name='advertisements',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
+
+
+def downgrade() -> None:
+    """Restore the plain advertisement status index and drop the partial ones."""
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_advertisement_status', 'advertisements', ['status'],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+        for ad_status in AD_STATUSES:
+            op.drop_index(
+                f'idx_advertisement_status_{ad_status}',
+                table_name='advertisements',
+                postgresql_concurrently=True,
+                if_exists=True
+            )
+
+        op.drop_index('idx_pet_deleted_at_null', table_name='pets', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_pet_status_alive', table_name='pets', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,65 @@
+"""Add unique constraints on category and city names
+
+Revision ID: add_unique_lookup_names
+Revises: add_user_delete_cascades
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = 'add_unique_lookup_names'
+down_revision = 'add_user_delete_cascades'
+branch_labels = None
+depends_on = None
+
+# (table, constraint) pairs; each constraint adopts a concurrently built index
+_LOOKUP_TABLES = (
+    ('categories', 'categories_name_key'),
+    ('cities', 'cities_name_key'),
+)
+
+
+def upgrade() -> None:
+    """
+    Enforce unique names so inserts can use ON CONFLICT (name).
+
+    Duplicate names are referenced by pets and advertisements, so they must be
+    merged by hand first; the upgrade stops before building anything if any
+    remain. The indexes are built concurrently and then attached as the
+    constraints, so the tables are never locked for a full build.
+    """
+
+    bind = op.get_bind()
+    for table, _ in _LOOKUP_TABLES:
+        duplicates = bind.execute(sa.text(
+            f"SELECT name FROM {table} WHERE name IS NOT NULL "
+            "GROUP BY name HAVING count(*) > 1 LIMIT 10"
+        )).scalars().all()
+        if duplicates:
+            raise RuntimeError(
+                f"Duplicate names in {table}; merge them before upgrading: "
+                f"{', '.join(duplicates)}"
+            )
+
+    with op.get_context().autocommit_block():
+        for table, constraint in _LOOKUP_TABLES:
+            op.create_index(
+                constraint, table, ['name'],
+                unique=True,
+                postgresql_concurrently=True,
+                if_not_exists=True
+            )
+
+    for table, constraint in _LOOKUP_TABLES:
+        op.execute(
+            f'ALTER TABLE {table} ADD CONSTRAINT {constraint} UNIQUE USING INDEX {constraint}'
+        )
+
+
+def downgrade() -> None:
+    """Drop the unique name constraints along with their indexes."""
+
+    for table, constraint in reversed(_LOOKUP_TABLES):
+        op.drop_constraint(constraint, table, type_='unique')
@@ -0,0 +1,56 @@
+"""Enforce user and pet delete cascades in the database
+
+Revision ID: add_user_delete_cascades
+Revises: add_keyset_pagination_indexes
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = 'add_user_delete_cascades'
+down_revision = 'add_keyset_pagination_indexes'
+branch_labels = None
+depends_on = None
+
+# (table, column, referred table, ON DELETE action)
+FOREIGN_KEYS = (
+    ('pets', 'owner_id', 'users', 'CASCADE'),
+    ('favorites', 'user_id', 'users', 'CASCADE'),
+    ('favorites', 'pet_id', 'pets', 'CASCADE'),
+    ('pet_photos', 'pet_id', 'pets', 'CASCADE'),
+    ('advertisements', 'user_id', 'users', 'CASCADE'),
+    ('push_tokens', 'user_id', 'users', 'CASCADE'),
+    ('pet_help_requests', 'owner_id', 'users', 'CASCADE'),
+    ('reports', 'reporter_id', 'users', 'SET NULL'),
+    ('reports', 'reported_user_id', 'users', 'SET NULL'),
+)
+
+
+def _replace_foreign_key(table: str, column: str, referred_table: str, ondelete) -> None:
+    """Recreate the foreign key on ``table.column`` with the given ON DELETE action."""
+    inspector = sa.inspect(op.get_bind())
+    for fk in inspector.get_foreign_keys(table):
+        if fk['constrained_columns'] == [column] and fk['referred_table'] == referred_table:
+            op.drop_constraint(fk['name'], table, type_='foreignkey')
+
+    op.create_foreign_key(
+        f'{table}_{column}_fkey', table, referred_table,
+        [column], ['id'],
+        ondelete=ondelete
+    )
+
+
+def upgrade() -> None:
+    """Let Postgres cascade deletes instead of the ORM loading every child row."""
+
+    for table, column, referred_table, ondelete in FOREIGN_KEYS:
+        _replace_foreign_key(table, column, referred_table, ondelete)
+
+
+def downgrade() -> None:
+    """Restore foreign keys without ON DELETE actions."""
+
+    for table, column, referred_table, _ in FOREIGN_KEYS:
+        _replace_foreign_key(table, column, referred_table, None)
@@ -0,0 +1,49 @@
+"""Add a case-insensitive unique index on user emails
+
+Revision ID: add_user_email_lower_index
+Revises: add_help_location_index
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = 'add_user_email_lower_index'
+down_revision = 'add_help_location_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Reject addresses that differ from an existing one only by case.
+
+    Accounts whose emails already differ only by case must be merged or
+    renamed first; a failed concurrent build would leave an INVALID index.
+    """
+
+    duplicates = op.get_bind().execute(sa.text(
+        "SELECT lower(email) FROM users GROUP BY lower(email) HAVING count(*) > 1 LIMIT 10"
+    )).scalars().all()
+    if duplicates:
+        raise RuntimeError(
+            "Emails used by several accounts differing only by case; "
+            f"resolve them before upgrading: {', '.join(duplicates)}"
+        )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_user_email_lower', 'users',
+            [sa.text('lower(email)')],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    """Drop the case-insensitive email index."""
+
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_user_email_lower', table_name='users', postgresql_concurrently=True, if_exists=True)
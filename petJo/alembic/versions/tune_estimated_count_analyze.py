@@ -0,0 +1,36 @@
+"""Analyze the tables behind estimated admin totals more often
+
+Revision ID: tune_estimated_count_analyze
+Revises: add_report_target_index
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+# revision identifiers
+revision = 'tune_estimated_count_analyze'
+down_revision = 'add_report_target_index'
+branch_labels = None
+depends_on = None
+
+# The admin stats read the unfiltered users and advertisements totals from
+# pg_class.reltuples, which only moves when the table is analyzed. The default
+# scale factor (10% of the table) lets the estimate drift far on large tables.
+_ESTIMATED_TABLES = ('users', 'advertisements')
+_ANALYZE_SCALE_FACTOR = 0.02
+
+
+def upgrade() -> None:
+    """Lower autovacuum_analyze_scale_factor so reltuples stays close to the real count."""
+
+    for table in _ESTIMATED_TABLES:
+        op.execute(
+            f'ALTER TABLE {table} SET (autovacuum_analyze_scale_factor = {_ANALYZE_SCALE_FACTOR})'
+        )
+
+
+def downgrade() -> None:
+    """Restore the server default analyze scale factor."""
+
+    for table in _ESTIMATED_TABLES:
+        op.execute(f'ALTER TABLE {table} RESET (autovacuum_analyze_scale_factor)')
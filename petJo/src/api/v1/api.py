@@ -1,38 +1,44 @@
+from collections import Counter
+from importlib import import_module
+
 from fastapi import APIRouter
+from fastapi.routing import APIRoute
+
 
-from api.v1.endpoints import (
-    admin,
-    advertisements,
-    auth,
-    breeding,
-    favorites,
-    heroes,
-    missing_animals,
-    pet_help,
-    pet_photos,
-    pets,
-    profiles,
-    public,
-    reports,
-    upload,
-    users,
+# (endpoint module, URL prefix, OpenAPI tag), in registration order
+ROUTES = (
+    ("auth", "/auth", "auth"),
+    ("users", "/users", "users"),
+    ("profiles", "/profiles", "profiles"),
+    ("pets", "/pets", "pets"),
+    ("pet_photos", "/pets", "pet-photos"),
+    ("favorites", "/favorites", "favorites"),
+    ("heroes", "/heroes", "heroes"),
+    ("pet_help", "/pet-help", "pet-help"),
+    ("breeding", "/breeding", "breeding"),
+    ("missing_animals", "/missing-animals", "missing-animals"),
+    ("reports", "/reports", "reports"),
+    ("advertisements", "/advertisements", "advertisements"),
+    ("upload", "/upload", "upload"),
+    ("public", "/public", "public"),
+    ("admin", "/admin", "admin"),
 )
 
 
 api_router = APIRouter()
 
-api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
-api_router.include_router(users.router, prefix="/users", tags=["users"])
-api_router.include_router(profiles.router, prefix="/profiles", tags=["profiles"])
-api_router.include_router(pets.router, prefix="/pets", tags=["pets"])
-api_router.include_router(pet_photos.router, prefix="/pets", tags=["pet-photos"])
-api_router.include_router(favorites.router, prefix="/favorites", tags=["favorites"])
-api_router.include_router(heroes.router, prefix="/heroes", tags=["heroes"])
-api_router.include_router(pet_help.router, prefix="/pet-help", tags=["pet-help"])
-api_router.include_router(breeding.router, prefix="/breeding", tags=["breeding"])
-api_router.include_router(missing_animals.router, prefix="/missing-animals", tags=["missing-animals"])
-api_router.include_router(reports.router, prefix="/reports", tags=["reports"])
-api_router.include_router(advertisements.router, prefix="/advertisements", tags=["advertisements"])
-api_router.include_router(upload.router, prefix="/upload", tags=["upload"])
-api_router.include_router(public.router, prefix="/public", tags=["public"])
-api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
+for module_name, prefix, tag in ROUTES:
+    module = import_module(f"api.v1.endpoints.{module_name}")
+    api_router.include_router(module.router, prefix=prefix, tags=[tag])
+
+# Fail at startup if a module is registered twice or two endpoints claim the same route
+_duplicates = [
+    route for route, count in Counter(
+        (method, route.path)
+        for route in api_router.routes if isinstance(route, APIRoute)
+        for method in route.methods
+    ).items()
+    if count > 1
+]
+if _duplicates:
+    raise RuntimeError(f"Duplicate API routes registered: {sorted(_duplicates)}")
@@ -1,21 +1,24 @@
 """Admin-only endpoints for system management."""
 import logging
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
-from sqlalchemy import and_, func, select
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile, status
+from sqlalchemy import delete, exists, func, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
-from db.session import get_db
+from db.session import get_db, get_db_readonly
 from dependencies import get_current_superuser, get_hero_service, get_user_service
-from exceptions import UserNotFoundException
+from exceptions import UserNotFoundException, ValidationException
 from models.advertisement import Advertisement
 from models.category import Category
 from models.city import City
 from models.pet import Pet, PetStatus
 from models.user import User
+from repositories.base import count_subquery, estimated_row_count
 from schemas.category import Category as CategorySchema
 from schemas.category import CategoryCreate, CategoryUpdate
 from schemas.city import City as CitySchema
@@ -27,39 +30,53 @@ from schemas.pet import Pet as PetSchema
 from schemas.user import User as UserSchema
 from services.hero_service import HeroService
 from services.user_service import UserService
+from core.cache import LOOKUP_CACHE_TTL, cached, clear_cache, get_from_cache, set_to_cache
 from core.storage import get_storage_service
 from api.v1.endpoints.upload import validate_image
+from utils.pagination import CursorPage, cursor_page, decode_cursor
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+_PET_STATUS_VALUES = frozenset(s.value for s in PetStatus)
+_PET_STATUS_DETAIL = f"Invalid status. Must be one of: {', '.join(s.value for s in PetStatus)}"
+
+# Dashboards poll the stats endpoint; a few seconds of staleness is acceptable
+ADMIN_STATS_CACHE_TTL = 10
+
+# Only the columns the user list schema exposes (skips hashed_password, google_id)
+_USER_LIST_COLUMNS = [getattr(User, field) for field in UserSchema.model_fields if hasattr(User, field)]
+
 
 @router.get(
     "/users",
-    response_model=ApiResponse[List[UserSchema]],
+    response_model=ApiResponse[CursorPage[UserSchema]],
     summary="Get all users (Admin only)",
-    description="Retrieve all users in the system. Requires super admin access."
+    description="Retrieve all users in the system, newest first. Requires super admin access."
 )
 async def get_all_users(
-    skip: int = 0,
-    limit: int = 100,
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="Cursor returned by the previous page"),
+    limit: int = Query(100, ge=1, le=100),
+    db: AsyncSession = Depends(get_db_readonly),
     current_user: User = Depends(get_current_superuser)
 ):
     """Get all users. Admin only."""
-    logger.info(f"Admin {current_user.email} fetching all users")
+    logger.info("Admin %s fetching all users", current_user.email)
     
-    result = await db.execute(
-        select(User)
-        .offset(skip)
-        .limit(limit)
-    )
-    users = result.scalars().all()
+    query = select(User).options(load_only(*_USER_LIST_COLUMNS))
+    
+    if cursor:
+        query = query.where(tuple_(User.created_at, User.id) < tuple_(*decode_cursor(cursor)))
+    
+    query = query.order_by(User.created_at.desc(), User.id.desc()).limit(limit + 1)
+    
+    result = await db.execute(query)
+    page = cursor_page(result.scalars().all(), limit)
     
     return ApiResponse(
         success=True,
-        data=users,
-        message=f"Retrieved {len(users)} users"
+        data=page,
+        message=f"Retrieved {len(page.items)} users"
     )
 
 
@@ -68,67 +85,56 @@ async def get_all_users(
     summary="Get system statistics (Admin only)",
     description="Get overall system statistics. Requires super admin access."
 )
+@cached(ttl_seconds=ADMIN_STATS_CACHE_TTL, key_prefix="admin", key_builder=lambda *args, **kwargs: "stats")
 async def get_system_stats(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_readonly),
     current_user: User = Depends(get_current_superuser)
 ):
     """Get system statistics. Admin only."""
-    logger.info(f"Admin {current_user.email} fetching system stats")
+    logger.info("Admin %s fetching system stats", current_user.email)
     
-    # Get user counts
-    total_users = await db.scalar(select(func.count()).select_from(User))
-    active_users = await db.scalar(
-        select(func.count()).select_from(User).where(User.is_active == True)
-    )
-    
-    # Get pet counts
-    total_pets = await db.scalar(select(func.count()).select_from(Pet).where(Pet.deleted_at.is_(None)))
-    available_pets = await db.scalar(
-        select(func.count()).select_from(Pet).where(
-            and_(Pet.status == PetStatus.AVAILABLE.value, Pet.deleted_at.is_(None))
-        )
-    )
-    adopted_pets = await db.scalar(
-        select(func.count()).select_from(Pet).where(
-            and_(Pet.status == PetStatus.ADOPTED.value, Pet.deleted_at.is_(None))
+    # Unfiltered totals of the large tables come from planner statistics; every
+    # filtered count is its own scalar subquery so it can use a partial index
+    # instead of sharing one sequential scan. Active and inactive users are both
+    # counted exactly rather than derived from the estimate. All of it is a single
+    # round-trip.
+    result = await db.execute(
+        select(
+            estimated_row_count(User).label("users_total"),
+            count_subquery(User, User.is_active == True).label("users_active"),
+            count_subquery(User, User.is_active == False).label("users_inactive"),
+            count_subquery(Pet, Pet.deleted_at.is_(None)).label("pets_total"),
+            count_subquery(Pet, Pet.status == PetStatus.AVAILABLE.value, Pet.deleted_at.is_(None)).label("pets_available"),
+            count_subquery(Pet, Pet.status == PetStatus.ADOPTED.value, Pet.deleted_at.is_(None)).label("pets_adopted"),
+            estimated_row_count(Advertisement).label("ads_total"),
+            count_subquery(Advertisement, Advertisement.status == "pending").label("ads_pending"),
+            count_subquery(Advertisement, Advertisement.status == "approved").label("ads_approved"),
+            count_subquery(Advertisement, Advertisement.status == "rejected").label("ads_rejected"),
+            count_subquery(Category).label("categories"),
+            count_subquery(City).label("cities"),
         )
     )
-    
-    # Get category and city counts
-    total_categories = await db.scalar(select(func.count()).select_from(Category))
-    total_cities = await db.scalar(select(func.count()).select_from(City))
-    
-    # Get advertisement counts
-    total_ads = await db.scalar(select(func.count()).select_from(Advertisement))
-    pending_ads = await db.scalar(
-        select(func.count()).select_from(Advertisement).where(Advertisement.status == "pending")
-    )
-    approved_ads = await db.scalar(
-        select(func.count()).select_from(Advertisement).where(Advertisement.status == "approved")
-    )
-    rejected_ads = await db.scalar(
-        select(func.count()).select_from(Advertisement).where(Advertisement.status == "rejected")
-    )
+    counts = result.one()
     
     stats = {
         "users": {
-            "total": total_users,
-            "active": active_users,
-            "inactive": total_users - active_users,
+            "total": counts.users_total,
+            "active": counts.users_active,
+            "inactive": counts.users_inactive,
         },
         "pets": {
-            "total": total_pets,
-            "available": available_pets,
-            "adopted": adopted_pets,
+            "total": counts.pets_total,
+            "available": counts.pets_available,
+            "adopted": counts.pets_adopted,
         },
         "advertisements": {
-            "total": total_ads,
-            "pending": pending_ads,
-            "approved": approved_ads,
-            "rejected": rejected_ads,
+            "total": counts.ads_total,
+            "pending": counts.ads_pending,
+            "approved": counts.ads_approved,
+            "rejected": counts.ads_rejected,
         },
-        "categories": total_categories,
-        "cities": total_cities,
+        "categories": counts.categories,
+        "cities": counts.cities,
     }
     
     return ApiResponse(
@@ -145,16 +151,14 @@ async def get_system_stats(
     description="Activate a user account. Requires super admin access."
 )
 async def activate_user(
-    user_id: str,
+    user_id: UUID,
     user_service: UserService = Depends(get_user_service),
     current_user: User = Depends(get_current_superuser)
 ):
     """Activate a user. Admin only."""
-    from uuid import UUID
-    
-    logger.info(f"Admin {current_user.email} activating user {user_id}")
+    logger.info("Admin %s activating user %s", current_user.email, user_id)
     
-    user = await user_service.activate_user(UUID(user_id))
+    user = await user_service.activate_user(user_id)
     
     if not user:
         raise UserNotFoundException()
@@ -173,16 +177,14 @@ async def activate_user(
     description="Deactivate a user account. Requires super admin access."
 )
 async def deactivate_user(
-    user_id: str,
+    user_id: UUID,
     user_service: UserService = Depends(get_user_service),
     current_user: User = Depends(get_current_superuser)
 ):
     """Deactivate a user. Admin only."""
-    from uuid import UUID
+    logger.info("Admin %s deactivating user %s", current_user.email, user_id)
     
-    logger.info(f"Admin {current_user.email} deactivating user {user_id}")
-    
-    user = await user_service.deactivate_user(UUID(user_id))
+    user = await user_service.deactivate_user(user_id)
     
     if not user:
         raise UserNotFoundException()
@@ -201,34 +203,38 @@ async def deactivate_user(
     description="Permanently delete a user account. Requires super admin access."
 )
 async def delete_user(
-    user_id: str,
+    user_id: UUID,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_superuser)
 ):
     """Delete a user. Admin only."""
-    from uuid import UUID
-    
-    logger.warning(f"Admin {current_user.email} deleting user {user_id}")
+    logger.warning("Admin %s deleting user %s", current_user.email, user_id)
     
+    # Self and superuser guards live in the WHERE clause so the happy path is one statement
     result = await db.execute(
-        select(User).where(User.id == UUID(user_id))
+        delete(User)
+        .where(
+            User.id == user_id,
+            User.id != current_user.id,
+            User.is_superuser.is_(False)
+        )
+        .returning(User.id)
     )
-    user = result.scalar_one_or_none()
+    deleted_id = result.scalar_one_or_none()
     
-    if not user:
-        raise UserNotFoundException()
-    
-    # Prevent deleting yourself
-    if user.id == current_user.id:
-        from exceptions import ValidationException
-        raise ValidationException("Cannot delete your own account")
-    
-    # Prevent deleting other superusers
-    if user.is_superuser:
-        from exceptions import ValidationException
+    if deleted_id is None:
+        is_superuser = await db.scalar(
+            select(User.is_superuser).where(User.id == user_id)
+        )
+        
+        if is_superuser is None:
+            raise UserNotFoundException()
+        
+        if user_id == current_user.id:
+            raise ValidationException("Cannot delete your own account")
+        
         raise ValidationException("Cannot delete other superuser accounts")
     
-    await db.delete(user)
     await db.commit()
     
     return None
@@ -238,38 +244,41 @@ async def delete_user(
 
 @router.get(
     "/pets",
-    response_model=ApiResponse[List[PetSchema]],
+    response_model=ApiResponse[CursorPage[PetSchema]],
     summary="Get all pets (Admin only)",
-    description="Retrieve all pets including deleted ones. Requires super admin access."
+    description="Retrieve all pets including deleted ones, newest first. Requires super admin access."
 )
 async def get_all_pets(
-    skip: int = 0,
-    limit: int = 100,
-    status: str = None,
+    cursor: Optional[str] = Query(None, description="Cursor returned by the previous page"),
+    limit: int = Query(100, ge=1, le=100),
+    status_filter: Optional[str] = Query(None, alias="status"),
     include_deleted: bool = False,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_readonly),
     current_user: User = Depends(get_current_superuser)
 ):
     """Get all pets. Admin only."""
-    logger.info(f"Admin {current_user.email} fetching all pets")
+    logger.info("Admin %s fetching all pets", current_user.email)
     
     query = select(Pet)
     
     if not include_deleted:
         query = query.where(Pet.deleted_at.is_(None))
     
-    if status:
-        query = query.where(Pet.status == status)
+    if status_filter:
+        query = query.where(Pet.status == status_filter)
+    
+    if cursor:
+        query = query.where(tuple_(Pet.created_at, Pet.id) < tuple_(*decode_cursor(cursor)))
     
-    query = query.offset(skip).limit(limit).order_by(Pet.created_at.desc())
+    query = query.order_by(Pet.created_at.desc(), Pet.id.desc()).limit(limit + 1)
     
     result = await db.execute(query)
-    pets = result.scalars().all()
+    page = cursor_page(result.scalars().all(), limit)
     
     return ApiResponse(
         success=True,
-        data=pets,
-        message=f"Retrieved {len(pets)} pets"
+        data=page,
+        message=f"Retrieved {len(page.items)} pets"
     )
 
 
@@ -280,25 +289,27 @@ async def get_all_pets(
     description="Update pet status. Requires super admin access."
 )
 async def update_pet_status(
-    pet_id: str,
-    status: str,
+    pet_id: UUID,
+    new_status: str = Query(..., alias="status"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_superuser)
 ):
     """Update pet status. Admin only."""
-    logger.info(f"Admin {current_user.email} updating pet {pet_id} status to {status}")
+    logger.info("Admin %s updating pet %s status to %s", current_user.email, pet_id, new_status)
     
     # Validate status
-    try:
-        PetStatus(status)
-    except ValueError:
+    if new_status not in _PET_STATUS_VALUES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid status. Must be one of: {', '.join([s.value for s in PetStatus])}"
+            detail=_PET_STATUS_DETAIL
         )
     
     result = await db.execute(
-        select(Pet).where(Pet.id == UUID(pet_id))
+        update(Pet)
+        .where(Pet.id == pet_id)
+        .values(status=new_status, updated_at=func.now())
+        .returning(Pet)
+        .execution_options(synchronize_session=False)
     )
     pet = result.scalar_one_or_none()
     
@@ -308,15 +319,12 @@ async def update_pet_status(
             detail="Pet not found"
         )
     
-    pet.status = status
-    pet.updated_at = datetime.utcnow()
     await db.commit()
-    await db.refresh(pet)
     
     return ApiResponse(
         success=True,
         data=pet,
-        message=f"Pet status updated to {status}"
+        message=f"Pet status updated to {new_status}"
     )
 
 
@@ -327,16 +335,16 @@ async def update_pet_status(
     description="Soft delete a pet. Requires super admin access."
 )
 async def delete_pet_admin(
-    pet_id: str,
+    pet_id: UUID,
     permanent: bool = False,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_superuser)
 ):
     """Delete pet. Admin only."""
-    logger.warning(f"Admin {current_user.email} deleting pet {pet_id} (permanent={permanent})")
+    logger.warning("Admin %s deleting pet %s (permanent=%s)", current_user.email, pet_id, permanent)
     
     result = await db.execute(
-        select(Pet).where(Pet.id == UUID(pet_id))
+        select(Pet).where(Pet.id == pet_id)
     )
     pet = result.scalar_one_or_none()
     
@@ -371,14 +379,17 @@ async def delete_pet_admin(
     description="Retrieve all categories. Requires super admin access."
 )
 async def get_all_categories(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_readonly),
     current_user: User = Depends(get_current_superuser)
 ):
     """Get all categories. Admin only."""
-    logger.info(f"Admin {current_user.email} fetching all categories")
+    logger.info("Admin %s fetching all categories", current_user.email)
     
-    result = await db.execute(select(Category))
-    categories = result.scalars().all()
+    categories = await get_from_cache("categories:all")
+    if categories is None:
+        result = await db.execute(select(Category))
+        categories = [CategorySchema.model_validate(c).model_dump() for c in result.scalars()]
+        await set_to_cache("categories:all", categories, LOOKUP_CACHE_TTL)
     
     return ApiResponse(
         success=True,
@@ -400,24 +411,25 @@ async def create_category(
     current_user: User = Depends(get_current_superuser)
 ):
     """Create category. Admin only."""
-    logger.info(f"Admin {current_user.email} creating category: {category_data.name}")
+    logger.info("Admin %s creating category: %s", current_user.email, category_data.name)
     
-    # Check if category already exists
+    # The unique constraint on name makes the insert itself the existence check
     result = await db.execute(
-        select(Category).where(Category.name == category_data.name)
+        pg_insert(Category)
+        .values(**category_data.model_dump())
+        .on_conflict_do_nothing(index_elements=["name"])
+        .returning(Category)
     )
-    existing = result.scalar_one_or_none()
+    category = result.scalar_one_or_none()
     
-    if existing:
+    if not category:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Category with this name already exists"
         )
     
-    category = Category(**category_data.dict())
-    db.add(category)
     await db.commit()
-    await db.refresh(category)
+    await clear_cache("categories")
     
     return ApiResponse(
         success=True,
@@ -439,11 +451,22 @@ async def update_category(
     current_user: User = Depends(get_current_superuser)
 ):
     """Update category. Admin only."""
-    logger.info(f"Admin {current_user.email} updating category {category_id}")
+    logger.info("Admin %s updating category %s", current_user.email, category_id)
     
-    result = await db.execute(
-        select(Category).where(Category.id == category_id)
-    )
+    update_data = category_data.model_dump(exclude_unset=True)
+    
+    if update_data:
+        query = (
+            update(Category)
+            .where(Category.id == category_id)
+            .values(**update_data)
+            .returning(Category)
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        query = select(Category).where(Category.id == category_id)
+    
+    result = await db.execute(query)
     category = result.scalar_one_or_none()
     
     if not category:
@@ -452,13 +475,8 @@ async def update_category(
             detail="Category not found"
         )
     
-    # Update fields
-    update_data = category_data.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(category, field, value)
-    
     await db.commit()
-    await db.refresh(category)
+    await clear_cache("categories")
     
     return ApiResponse(
         success=True,
@@ -479,7 +497,7 @@ async def delete_category(
     current_user: User = Depends(get_current_superuser)
 ):
     """Delete category. Admin only."""
-    logger.warning(f"Admin {current_user.email} deleting category {category_id}")
+    logger.warning("Admin %s deleting category %s", current_user.email, category_id)
     
     result = await db.execute(
         select(Category).where(Category.id == category_id)
@@ -493,18 +511,19 @@ async def delete_category(
         )
     
     # Check if category is used by pets
-    pets_count = await db.scalar(
-        select(func.count()).select_from(Pet).where(Pet.category_id == category_id)
+    in_use = await db.scalar(
+        select(exists().where(Pet.category_id == category_id))
     )
     
-    if pets_count > 0:
+    if in_use:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Cannot delete category. It is used by {pets_count} pets"
+            detail="Cannot delete category. It is used by pets"
         )
     
     await db.delete(category)
     await db.commit()
+    await clear_cache("categories")
     
     return ApiResponse(
         success=True,
@@ -522,14 +541,17 @@ async def delete_category(
     description="Retrieve all cities. Requires super admin access."
 )
 async def get_all_cities(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_readonly),
     current_user: User = Depends(get_current_superuser)
 ):
     """Get all cities. Admin only."""
-    logger.info(f"Admin {current_user.email} fetching all cities")
+    logger.info("Admin %s fetching all cities", current_user.email)
     
-    result = await db.execute(select(City))
-    cities = result.scalars().all()
+    cities = await get_from_cache("cities:all")
+    if cities is None:
+        result = await db.execute(select(City))
+        cities = [CitySchema.model_validate(c).model_dump() for c in result.scalars()]
+        await set_to_cache("cities:all", cities, LOOKUP_CACHE_TTL)
     
     return ApiResponse(
         success=True,
@@ -551,24 +573,25 @@ async def create_city(
     current_user: User = Depends(get_current_superuser)
 ):
     """Create city. Admin only."""
-    logger.info(f"Admin {current_user.email} creating city: {city_data.name}")
+    logger.info("Admin %s creating city: %s", current_user.email, city_data.name)
     
-    # Check if city already exists
+    # The unique constraint on name makes the insert itself the existence check
     result = await db.execute(
-        select(City).where(City.name == city_data.name)
+        pg_insert(City)
+        .values(**city_data.model_dump())
+        .on_conflict_do_nothing(index_elements=["name"])
+        .returning(City)
     )
-    existing = result.scalar_one_or_none()
+    city = result.scalar_one_or_none()
     
-    if existing:
+    if not city:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="City with this name already exists"
         )
     
-    city = City(**city_data.dict())
-    db.add(city)
     await db.commit()
-    await db.refresh(city)
+    await clear_cache("cities")
     
     return ApiResponse(
         success=True,
@@ -590,11 +613,22 @@ async def update_city(
     current_user: User = Depends(get_current_superuser)
 ):
     """Update city. Admin only."""
-    logger.info(f"Admin {current_user.email} updating city {city_id}")
+    logger.info("Admin %s updating city %s", current_user.email, city_id)
     
-    result = await db.execute(
-        select(City).where(City.id == city_id)
-    )
+    update_data = city_data.model_dump(exclude_unset=True)
+    
+    if update_data:
+        query = (
+            update(City)
+            .where(City.id == city_id)
+            .values(**update_data)
+            .returning(City)
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        query = select(City).where(City.id == city_id)
+    
+    result = await db.execute(query)
     city = result.scalar_one_or_none()
     
     if not city:
@@ -603,13 +637,8 @@ async def update_city(
             detail="City not found"
         )
     
-    # Update fields
-    update_data = city_data.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(city, field, value)
-    
     await db.commit()
-    await db.refresh(city)
+    await clear_cache("cities")
     
     return ApiResponse(
         success=True,
@@ -630,7 +659,7 @@ async def delete_city(
     current_user: User = Depends(get_current_superuser)
 ):
     """Delete city. Admin only."""
-    logger.warning(f"Admin {current_user.email} deleting city {city_id}")
+    logger.warning("Admin %s deleting city %s", current_user.email, city_id)
     
     result = await db.execute(
         select(City).where(City.id == city_id)
@@ -643,22 +672,25 @@ async def delete_city(
             detail="City not found"
         )
     
-    # Check if city is used by pets or users
-    pets_count = await db.scalar(
-        select(func.count()).select_from(Pet).where(Pet.city_id == city_id)
-    )
-    users_count = await db.scalar(
-        select(func.count()).select_from(User).where(User.city == city_id)
+    # Check if city is used by pets or users (users.city is a text column)
+    in_use = await db.scalar(
+        select(
+            or_(
+                exists().where(Pet.city_id == city_id),
+                exists().where(User.city == str(city_id))
+            )
+        )
     )
     
-    if pets_count > 0 or users_count > 0:
+    if in_use:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Cannot delete city. It is used by {pets_count} pets and {users_count} users"
+            detail="Cannot delete city. It is used by pets or users"
         )
     
     await db.delete(city)
     await db.commit()
+    await clear_cache("cities")
     
     return ApiResponse(
         success=True,
@@ -683,7 +715,7 @@ async def get_all_heroes(
     current_user: User = Depends(get_current_superuser)
 ):
     """Get all hero items. Admin only."""
-    logger.info(f"Admin {current_user.email} fetching all heroes")
+    logger.info("Admin %s fetching all heroes", current_user.email)
     
     heroes = await hero_service.get_all_heroes(skip, limit)
     
@@ -706,7 +738,7 @@ async def get_hero_by_id(
     current_user: User = Depends(get_current_superuser)
 ):
     """Get hero by ID. Admin only."""
-    logger.info(f"Admin {current_user.email} fetching hero {hero_id}")
+    logger.info("Admin %s fetching hero %s", current_user.email, hero_id)
     
     hero = await hero_service.get(hero_id)
     
@@ -736,7 +768,7 @@ async def create_hero(
     current_user: User = Depends(get_current_superuser)
 ):
     """Create new hero item with image upload. Admin only."""
-    logger.info(f"Admin {current_user.email} creating hero item")
+    logger.info("Admin %s creating hero item", current_user.email)
     
     # Validate and upload image
     validate_image(image)
@@ -753,6 +785,7 @@ async def create_hero(
         hero_data["link"] = link
     
     hero = await hero_service.create(hero_data)
+    await clear_cache("heroes")
     
     return ApiResponse(
         success=True,
@@ -775,19 +808,20 @@ async def update_hero(
     current_user: User = Depends(get_current_superuser)
 ):
     """Update hero item. Admin only."""
-    logger.info(f"Admin {current_user.email} updating hero {hero_id}")
-    
-    hero = await hero_service.get(hero_id)
-    if not hero:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Hero item not found"
-        )
+    logger.info("Admin %s updating hero %s", current_user.email, hero_id)
     
     update_data = {}
     
     # Upload new image if provided
     if image and image.filename:
+        # The old image path is only needed when it is being replaced
+        hero = await hero_service.get(hero_id)
+        if not hero:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Hero item not found"
+            )
+        
         validate_image(image)
         storage = get_storage_service()
         
@@ -796,7 +830,7 @@ async def update_hero(
             try:
                 await storage.delete_file(hero.img_path)
             except Exception as e:
-                logger.warning(f"Failed to delete old hero image: {e}")
+                logger.warning("Failed to delete old hero image: %s", e)
         
         img_url = await storage.upload_file(
             file=image.file,
@@ -810,13 +844,27 @@ async def update_hero(
         update_data["link"] = link
     
     if not update_data:
+        hero = await hero_service.get(hero_id)
+        if not hero:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Hero item not found"
+            )
+        
         return ApiResponse(
             success=True,
             data=hero,
             message="No changes provided"
         )
     
-    updated_hero = await hero_service.update(hero_id, update_data)
+    updated_hero = await hero_service.update_returning(hero_id, update_data)
+    
+    if not updated_hero:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Hero item not found"
+        )
+    await clear_cache("heroes")
     
     return ApiResponse(
         success=True,
@@ -837,14 +885,15 @@ async def delete_hero(
     current_user: User = Depends(get_current_superuser)
 ):
     """Delete hero item. Admin only."""
-    logger.warning(f"Admin {current_user.email} deleting hero {hero_id}")
+    logger.warning("Admin %s deleting hero %s", current_user.email, hero_id)
     
-    hero = await hero_service.get(hero_id)
+    hero = await hero_service.delete_returning(hero_id)
     if not hero:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Hero item not found"
         )
+    await clear_cache("heroes")
     
     # Delete image from bucket
     if hero.img_path:
@@ -852,15 +901,7 @@ async def delete_hero(
             storage = get_storage_service()
             await storage.delete_file(hero.img_path)
         except Exception as e:
-            logger.warning(f"Failed to delete hero image from storage: {e}")
-    
-    success = await hero_service.delete(hero_id)
-    
-    if not success:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete hero item"
-        )
+            logger.warning("Failed to delete hero image from storage: %s", e)
     
     return MessageResponse(
         success=True,
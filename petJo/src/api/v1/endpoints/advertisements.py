@@ -1,10 +1,14 @@
 """Advertisement endpoints for users and admins."""
-from typing import List, Optional
+from typing import Optional
 from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+import orjson
 
-from db.session import get_db
+from core.cache import clear_cache, get_from_cache, set_to_cache
+from db.session import AsyncSessionLocal, get_db
 from dependencies import get_current_user, get_current_superuser
+from exceptions import ForbiddenException
 from models.user import User
 from schemas.advertisement import (
     Advertisement,
@@ -13,11 +17,58 @@ from schemas.advertisement import (
     AdvertisementWithUser,
     AdvertisementReview
 )
+from repositories.advertisement_repository import AdvertisementRepository
 from schemas.common import ApiResponse, PaginatedResponse
 from services.advertisement_service import AdvertisementService
+from utils.pagination import decode_cursor, encode_cursor
+from utils.responses import fast_response
 
 router = APIRouter()
 
+# Advertisements change rarely once reviewed; every write clears the whole namespace
+ADS_CACHE_NAMESPACE = "ads"
+ADS_CACHE_TTL = 60
+
+
+_AD_FIELDS = tuple(Advertisement.model_fields)
+
+
+def _construct(ad) -> Advertisement:
+    """Wrap an advertisement, skipping validation of trusted DB values."""
+    return Advertisement.model_construct(**{field: getattr(ad, field) for field in _AD_FIELDS})
+
+
+def _with_user(ads: list) -> list:
+    """Wrap advertisements with their loaded user, skipping validation of trusted DB values."""
+    return [
+        AdvertisementWithUser.model_construct(
+            **{field: getattr(ad, field) for field in _AD_FIELDS},
+            user_email=ad.user.email,
+            user_name=ad.user.full_name
+        )
+        for ad in ads
+    ]
+
+
+def _paginated(
+    items: list,
+    last_ad,
+    page: int,
+    page_size: int,
+    has_next: bool,
+    total: Optional[int] = None
+) -> PaginatedResponse:
+    """Build a page whose cursor points after its last advertisement."""
+    return PaginatedResponse(
+        items=items,
+        total=total,
+        page=page,
+        page_size=page_size,
+        pages=(total + page_size - 1) // page_size if total is not None else None,
+        has_next=has_next,
+        next_cursor=encode_cursor(last_ad.created_at, last_ad.id) if has_next else None
+    )
+
 
 @router.post(
     "/",
@@ -47,6 +98,7 @@ async def create_advertisement(
         description=ad_data.description,
         contact_phone=ad_data.contact_phone
     )
+    await clear_cache(ADS_CACHE_NAMESPACE)
     
     return ApiResponse(
         success=True,
@@ -57,41 +109,42 @@ async def create_advertisement(
 
 @router.get(
     "/my-requests",
-    response_model=ApiResponse[List[Advertisement]],
+    response_model=None,
+    responses={200: {"model": ApiResponse[PaginatedResponse[Advertisement]]}},
     summary="Get my advertisement requests"
 )
 async def get_my_advertisements(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page (replaces page)"),
+    include_total: bool = Query(False, description="Also count all matching items"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Get all advertisement requests submitted by the current user.
     
-    Returns a paginated list of your advertisement requests.
+    Returns a paginated list of your advertisement requests. Pass the
+    `next_cursor` of a page as `cursor` to fetch the following one.
     """
     service = AdvertisementService(db)
-    skip = (page - 1) * page_size
+    after = decode_cursor(cursor, int) if cursor else None
+    skip = 0 if after else (page - 1) * page_size
     
     ads = await service.get_user_advertisements(
         user_id=current_user.id,
         skip=skip,
-        limit=page_size
+        limit=page_size + 1,
+        after=after
     )
+    has_next = len(ads) > page_size
+    ads = ads[:page_size]
     
-    total = await service.count_user_advertisements(current_user.id)
+    total = await service.count_user_advertisements(current_user.id) if include_total else None
     
-    return ApiResponse(
-        success=True,
-        data=PaginatedResponse(
-            items=ads,
-            total=total,
-            page=page,
-            page_size=page_size,
-            pages=(total + page_size - 1) // page_size
-        ),
-        message=f"Found {len(ads)} advertisement requests"
+    return fast_response(
+        _paginated([_construct(ad) for ad in ads], ads[-1] if ads else None, page, page_size, has_next, total),
+        f"Found {len(ads)} advertisement requests"
     )
 
 
@@ -105,6 +158,8 @@ async def search_advertisements(
     status: Optional[str] = Query(None, description="Filter by status: pending, approved, rejected"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page (replaces page)"),
+    include_total: bool = Query(False, description="Also count all matching items"),
     current_user: User = Depends(get_current_superuser),
     db: AsyncSession = Depends(get_db)
 ):
@@ -112,26 +167,24 @@ async def search_advertisements(
     Search advertisements by title or description with status filter (admin only).
     """
     service = AdvertisementService(db)
-    skip = (page - 1) * page_size
+    after = decode_cursor(cursor, int) if cursor else None
+    skip = 0 if after else (page - 1) * page_size
     
     ads = await service.search_advertisements(
         search_term=q,
         status=status,
         skip=skip,
-        limit=page_size
+        limit=page_size + 1,
+        after=after
     )
+    has_next = len(ads) > page_size
+    ads = ads[:page_size]
     
-    total = await service.count_all()
+    total = await service.count_search_results(q, status) if include_total else None
     
     return ApiResponse(
         success=True,
-        data=PaginatedResponse(
-            items=ads,
-            total=total,
-            page=page,
-            page_size=page_size,
-            pages=(total + page_size - 1) // page_size
-        ),
+        data=_paginated(ads, ads[-1] if ads else None, page, page_size, has_next, total),
         message=f"Found {len(ads)} advertisements"
     )
 
@@ -151,12 +204,18 @@ async def get_advertisement(
     
     Users can only view their own advertisements unless they are admins.
     """
-    service = AdvertisementService(db)
-    ad = await service.get_advertisement_by_id(ad_id)
+    cache_key = f"{ADS_CACHE_NAMESPACE}:item:{ad_id}"
+    cached_ad = await get_from_cache(cache_key)
+    
+    if cached_ad is not None:
+        ad = Advertisement.model_validate(cached_ad)
+    else:
+        service = AdvertisementService(db)
+        ad = Advertisement.model_validate(await service.get_advertisement_by_id(ad_id))
+        await set_to_cache(cache_key, ad.model_dump(), ADS_CACHE_TTL)
     
     # Check if user can view (owner or admin)
     if ad.user_id != current_user.id and not current_user.is_superuser:
-        from exceptions import ForbiddenException
         raise ForbiddenException("You can only view your own advertisements")
     
     return ApiResponse(
@@ -184,14 +243,12 @@ async def update_advertisement(
     """
     service = AdvertisementService(db)
     
-    # Filter out None values
-    update_dict = update_data.model_dump(exclude_unset=True)
-    
     ad = await service.update_advertisement(
         ad_id=ad_id,
         user_id=current_user.id,
-        update_data=update_dict
+        update_data=update_data
     )
+    await clear_cache(ADS_CACHE_NAMESPACE)
     
     return ApiResponse(
         success=True,
@@ -221,6 +278,7 @@ async def delete_advertisement(
         ad_id=ad_id,
         user_id=current_user.id
     )
+    await clear_cache(ADS_CACHE_NAMESPACE)
     
     return ApiResponse(
         success=True,
@@ -232,64 +290,64 @@ async def delete_advertisement(
 # Admin endpoints
 @router.get(
     "/admin/pending",
-    response_model=ApiResponse[PaginatedResponse[Advertisement]],
+    response_model=ApiResponse[PaginatedResponse[AdvertisementWithUser]],
     summary="Get pending advertisements (Admin)"
 )
 async def admin_get_pending_advertisements(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page (replaces page)"),
+    include_total: bool = Query(False, description="Also count all matching items"),
     current_user: User = Depends(get_current_superuser),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Get all pending advertisement requests awaiting review (admin only).
     """
-    service = AdvertisementService(db)
-    skip = (page - 1) * page_size
-    
-    ads_with_users = await service.get_pending_with_users(skip=skip, limit=page_size)
-    total = await service.count_pending()
-    
-    # Transform to response format with user info
-    ads_response = []
-    for ad, user_email, user_name in ads_with_users:
-        ad_dict = {
-            "id": ad.id,
-            "user_id": ad.user_id,
-            "title": ad.title,
-            "description": ad.description,
-            "contact_phone": ad.contact_phone,
-            "status": ad.status,
-            "admin_notes": ad.admin_notes,
-            "created_at": ad.created_at,
-            "updated_at": ad.updated_at,
-            "reviewed_at": ad.reviewed_at,
-            "user_email": user_email,
-            "user_name": user_name
-        }
-        ads_response.append(ad_dict)
+    cache_key = f"{ADS_CACHE_NAMESPACE}:pending:{page}:{page_size}:{cursor}:{include_total}"
+    data = await get_from_cache(cache_key)
+    
+    if data is None:
+        service = AdvertisementService(db)
+        after = decode_cursor(cursor, int) if cursor else None
+        skip = 0 if after else (page - 1) * page_size
+    
+        # The window total counts rows from the cursor onwards, so it is only used on offset pages
+        ads, total = await service.get_pending_with_users(
+            skip=skip,
+            limit=page_size + 1,
+            after=after,
+            with_total=include_total and after is None
+        )
+        has_next = len(ads) > page_size
+        ads = ads[:page_size]
+        if include_total and total is None:
+            total = await service.count_pending()
+    
+        ads_response = _with_user(ads)
+    
+        last_ad = ads[-1] if ads else None
+        data = _paginated(ads_response, last_ad, page, page_size, has_next, total).model_dump()
+        await set_to_cache(cache_key, data, ADS_CACHE_TTL)
     
     return ApiResponse(
         success=True,
-        data=PaginatedResponse(
-            items=ads_response,
-            total=total,
-            page=page,
-            page_size=page_size,
-            pages=(total + page_size - 1) // page_size
-        ),
-        message=f"Found {total} pending advertisement requests"
+        data=data,
+        message=f"Found {len(data['items'])} pending advertisement requests"
     )
 
 
 @router.get(
     "/admin/all",
-    response_model=ApiResponse[PaginatedResponse[Advertisement]],
+    response_model=None,
+    responses={200: {"model": ApiResponse[PaginatedResponse[AdvertisementWithUser]]}},
     summary="Get all advertisements (Admin)"
 )
 async def admin_get_all_advertisements(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page (replaces page)"),
+    include_total: bool = Query(False, description="Also count all matching items"),
     current_user: User = Depends(get_current_superuser),
     db: AsyncSession = Depends(get_db)
 ):
@@ -298,44 +356,69 @@ async def admin_get_all_advertisements(
     
     Returns a paginated list of all advertisement requests from all users.
     """
-    service = AdvertisementService(db)
-    skip = (page - 1) * page_size
-    
-    # Get with user information
-    ads_with_users = await service.get_all_with_users(skip=skip, limit=page_size)
-    
-    # Transform to response format
-    ads_response = []
-    for ad, user_email, user_name in ads_with_users:
-        ad_dict = {
-            "id": ad.id,
-            "user_id": ad.user_id,
-            "title": ad.title,
-            "description": ad.description,
-            "contact_phone": ad.contact_phone,
-            "status": ad.status,
-            "admin_notes": ad.admin_notes,
-            "created_at": ad.created_at,
-            "updated_at": ad.updated_at,
-            "reviewed_at": ad.reviewed_at,
-            "user_email": user_email,
-            "user_name": user_name
-        }
-        ads_response.append(ad_dict)
-    
-    total = await service.count_all()
+    cache_key = f"{ADS_CACHE_NAMESPACE}:all:{page}:{page_size}:{cursor}:{include_total}"
+    data = await get_from_cache(cache_key)
+    
+    if data is None:
+        service = AdvertisementService(db)
+        after = decode_cursor(cursor, int) if cursor else None
+        skip = 0 if after else (page - 1) * page_size
+    
+        # Get with user information
+        ads, total = await service.get_all_with_users(
+            skip=skip,
+            limit=page_size + 1,
+            after=after,
+            with_total=include_total and after is None
+        )
+        has_next = len(ads) > page_size
+        ads = ads[:page_size]
+        if include_total and total is None:
+            total = await service.count_all()
+    
+        ads_response = _with_user(ads)
+    
+        last_ad = ads[-1] if ads else None
+        data = _paginated(ads_response, last_ad, page, page_size, has_next, total).model_dump()
+        await set_to_cache(cache_key, data, ADS_CACHE_TTL)
+    
+    return fast_response(data, f"Found {len(data['items'])} advertisement requests")
+
+
+@router.get(
+    "/admin/all.ndjson",
+    response_class=StreamingResponse,
+    summary="Stream all advertisements as NDJSON (Admin)"
+)
+async def admin_stream_all_advertisements(
+    limit: int = Query(1000, ge=1, le=10000, description="Maximum number of advertisements"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page"),
+    current_user: User = Depends(get_current_superuser)
+):
+    """
+    Stream advertisement requests with user information, one JSON object per line (admin only).
     
-    return ApiResponse(
-        success=True,
-        data=PaginatedResponse(
-            items=ads_response,
-            total=total,
-            page=page,
-            page_size=page_size,
-            pages=(total + page_size - 1) // page_size
-        ),
-        message=f"Found {total} advertisement requests"
-    )
+    Rows are written as they are read, so large exports never hold a whole page in memory.
+    The last line is `{"next_cursor": ...}`, null once the export is complete; pass it
+    back as `cursor` to resume.
+    """
+    after = decode_cursor(cursor, int) if cursor else None
+    
+    async def rows():
+        # The request session is closed before the body is sent, so the stream owns its own
+        async with AsyncSessionLocal() as session:
+            # One extra row tells whether another page follows
+            result = await AdvertisementRepository(session).stream_with_user(limit + 1, after)
+            sent, last, next_cursor = 0, None, None
+            async for row in result:
+                if sent == limit:
+                    next_cursor = encode_cursor(last["created_at"], last["id"])
+                    break
+                yield orjson.dumps(dict(row)) + b"\n"
+                sent, last = sent + 1, row
+            yield orjson.dumps({"next_cursor": next_cursor}) + b"\n"
+    
+    return StreamingResponse(rows(), media_type="application/x-ndjson")
 
 
 @router.post(
@@ -362,6 +445,7 @@ async def admin_review_advertisement(
         status=review_data.status,
         admin_notes=review_data.admin_notes
     )
+    await clear_cache(ADS_CACHE_NAMESPACE)
     
     return ApiResponse(
         success=True,
@@ -390,6 +474,7 @@ async def admin_delete_advertisement(
         user_id=current_user.id,
         is_admin=True
     )
+    await clear_cache(ADS_CACHE_NAMESPACE)
     
     return ApiResponse(
         success=True,
@@ -1,6 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
 import logging
+import time
+from uuid import UUID
 
 from db.session import get_db
 from schemas.auth import Token, LoginRequest, RefreshTokenRequest, ResetPasswordRequest, ChangePasswordRequest, GoogleLoginRequest
@@ -9,7 +12,7 @@ from schemas.common import ApiResponse
 from dependencies import get_user_service, get_current_user_id
 from services.user_service import UserService
 from core.security import create_access_token, create_refresh_token, decode_token
-from core.token_blacklist import blacklist_refresh_token, blacklist_token, is_token_blacklisted
+from core.token_blacklist import blacklist_refresh_token, blacklist_token, consume_refresh_token
 from core.rate_limit import limiter, RATE_LIMITS
 from core.config import settings
 from exceptions import (
@@ -22,6 +25,15 @@ from exceptions import (
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Minimum response time of /reset-password, so it does not reveal whether the email exists
+RESET_PASSWORD_MIN_SECONDS = 0.2
+
+
+def send_password_reset_email(email: str):
+    """Send password reset instructions; runs after the response is sent."""
+    # TODO: Implement actual email sending logic
+    logger.info("Password reset instructions queued for: %s", email)
+
 
 @router.post(
     "/register",
@@ -115,11 +127,6 @@ async def refresh_token(request: Request, refresh_data: RefreshTokenRequest):
     logger.info("Token refresh attempt")
     
     try:
-        # Check if refresh token is blacklisted
-        if await is_token_blacklisted(refresh_data.refresh_token):
-            logger.warning("Attempt to use blacklisted refresh token")
-            raise AuthenticationException("Token has been revoked")
-        
         payload = decode_token(refresh_data.refresh_token)
         
         if payload.get("type") != "refresh":
@@ -132,7 +139,9 @@ async def refresh_token(request: Request, refresh_data: RefreshTokenRequest):
             raise AuthenticationException("Invalid token")
         
         # Blacklist the old refresh token (single-use refresh tokens)
-        await blacklist_refresh_token(user_id, refresh_data.refresh_token)
+        if not await consume_refresh_token(user_id, refresh_data.refresh_token):
+            logger.warning("Attempt to use blacklisted refresh token")
+            raise AuthenticationException("Token has been revoked")
         
         # Create new tokens
         access_token = create_access_token(data={"sub": user_id})
@@ -167,7 +176,7 @@ async def refresh_token(request: Request, refresh_data: RefreshTokenRequest):
 async def logout(
     request: Request,
     refresh_data: RefreshTokenRequest,
-    user_id: str = Depends(get_current_user_id)
+    user_id: UUID = Depends(get_current_user_id)
 ):
     """Logout and blacklist refresh token."""
     logger.info(f"Logout attempt for user: {user_id}")
@@ -249,16 +258,23 @@ async def google_login(
 async def reset_password(
     request: Request,
     reset_data: ResetPasswordRequest,
+    background_tasks: BackgroundTasks,
     user_service: UserService = Depends(get_user_service)
 ):
     """Request a password reset by email.
     
     Always returns success to prevent email enumeration.
     """
-    logger.info(f"Password reset requested for: {reset_data.email}")
+    started = time.perf_counter()
+    logger.info("Password reset requested for: %s", reset_data.email)
     
-    # Always return success even if email doesn't exist (prevent enumeration)
-    # TODO: Implement actual email sending logic
+    user = await user_service.get_by_email(reset_data.email)
+    if user and user.is_active:
+        background_tasks.add_task(send_password_reset_email, user.email)
+    
+    # Always return success even if email doesn't exist (prevent enumeration),
+    # and take the same time either way
+    await asyncio.sleep(max(0.0, RESET_PASSWORD_MIN_SECONDS - (time.perf_counter() - started)))
     
     return ApiResponse(
         success=True,
@@ -277,15 +293,14 @@ async def reset_password(
 async def change_password(
     request: Request,
     password_data: ChangePasswordRequest,
-    user_id: str = Depends(get_current_user_id),
+    user_id: UUID = Depends(get_current_user_id),
     user_service: UserService = Depends(get_user_service)
 ):
     """Change the authenticated user's password."""
     logger.info(f"Password change attempt for user: {user_id}")
     
-    from uuid import UUID
     success = await user_service.change_password(
-        user_id=UUID(user_id),
+        user_id=user_id,
         old_password=password_data.current_password,
         new_password=password_data.new_password
     )
@@ -18,15 +18,27 @@ from schemas.breeding_request import (
     BreedingRequestUpdate
 )
 from services.breeding_request_service import BreedingRequestService
-from utils.pagination import PaginatedResponse, PaginationParams, paginate
+from utils.pagination import (
+    CursorPage,
+    PaginatedResponse,
+    PaginationParams,
+    cursor_page,
+    decode_cursor,
+    paginate,
+    pagination_params,
+)
+from utils.responses import fast_response, items_serializer
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+_public_items = items_serializer(BreedingRequestPublic)
+
 
 @router.get(
     "/search",
-    response_model=ApiResponse[PaginatedResponse[BreedingRequestPublic]],
+    response_model=None,
+    responses={200: {"model": ApiResponse[PaginatedResponse[BreedingRequestPublic]]}},
     summary="Search breeding requests",
     description="Search for active breeding requests with filters"
 )
@@ -37,7 +49,7 @@ async def search_breeding_requests(
     is_pedigree: Optional[bool] = Query(None, description="Filter pedigree pets"),
     has_papers: Optional[bool] = Query(None, description="Filter pets with papers"),
     health_certified: Optional[bool] = Query(None, description="Filter health certified pets"),
-    pagination: PaginationParams = Depends(),
+    pagination: PaginationParams = Depends(pagination_params),
     service: BreedingRequestService = Depends(get_breeding_request_service)
 ):
     """Search breeding requests with advanced filtering."""
@@ -51,7 +63,7 @@ async def search_breeding_requests(
         "status": "active"
     }
     
-    logger.info(f"Searching breeding requests with filters: {filters}")
+    logger.info("Searching breeding requests with filters: %s", filters)
     
     requests, total = await service.search_requests(
         filters=filters,
@@ -59,13 +71,9 @@ async def search_breeding_requests(
         limit=pagination.limit
     )
     
-    paginated = paginate(requests, total, pagination.page, pagination.page_size)
+    paginated = paginate(_public_items(requests), total, pagination.page, pagination.page_size)
     
-    return ApiResponse(
-        success=True,
-        data=paginated,
-        message=f"Found {total} breeding requests"
-    )
+    return fast_response(paginated.model_dump(), f"Found {total} breeding requests")
 
 
 @router.post(
@@ -81,7 +89,7 @@ async def create_breeding_request(
     service: BreedingRequestService = Depends(get_breeding_request_service)
 ):
     """Create a new breeding request."""
-    logger.info(f"Creating breeding request for pet {request_in.pet_id} by user {current_user.id}")
+    logger.info("Creating breeding request for pet %s by user %s", request_in.pet_id, current_user.id)
     
     request_data = request_in.model_dump()
     request_data["owner_id"] = current_user.id
@@ -98,53 +106,54 @@ async def create_breeding_request(
 
 @router.get(
     "/",
-    response_model=ApiResponse[PaginatedResponse[BreedingRequestPublic]],
+    response_model=None,
+    responses={200: {"model": ApiResponse[PaginatedResponse[BreedingRequestPublic]]}},
     summary="List active breeding requests",
     description="Get all active breeding requests"
 )
 async def list_breeding_requests(
-    pagination: PaginationParams = Depends(),
+    pagination: PaginationParams = Depends(pagination_params),
     category_id: Optional[int] = Query(None, description="Filter by category"),
     city_id: Optional[int] = Query(None, description="Filter by city"),
     service: BreedingRequestService = Depends(get_breeding_request_service)
 ):
     """List all active breeding requests."""
-    logger.info(f"Listing breeding requests")
+    logger.info("Listing breeding requests")
     
-    requests = await service.get_active_requests(
+    requests, total = await service.get_active_requests_with_total(
         skip=pagination.skip,
         limit=pagination.limit,
         category_id=category_id,
         city_id=city_id
     )
     
-    total = await service.count({"status": "active"})
-    paginated = paginate(requests, total, pagination.page, pagination.page_size)
+    paginated = paginate(_public_items(requests), total, pagination.page, pagination.page_size)
     
-    return ApiResponse(success=True, data=paginated)
+    return fast_response(paginated.model_dump())
 
 
 @router.get(
     "/my-requests",
-    response_model=ApiResponse[List[BreedingRequest]],
+    response_model=ApiResponse[CursorPage[BreedingRequest]],
     summary="Get my breeding requests",
-    description="Get all breeding requests created by current user"
+    description="Get the breeding requests created by current user, newest first"
 )
 async def list_my_breeding_requests(
-    pagination: PaginationParams = Depends(),
+    cursor: Optional[str] = Query(None, description="Cursor returned by the previous page"),
+    limit: int = Query(20, ge=1, le=100, description="Items per page"),
     current_user: User = Depends(get_current_active_user),
     service: BreedingRequestService = Depends(get_breeding_request_service)
 ):
     """Get current user's breeding requests."""
-    logger.info(f"Listing breeding requests for user {current_user.id}")
+    logger.info("Listing breeding requests for user %s", current_user.id)
     
     requests = await service.get_user_requests(
         owner_id=current_user.id,
-        skip=pagination.skip,
-        limit=pagination.limit
+        limit=limit + 1,
+        after=decode_cursor(cursor, int) if cursor else None
     )
     
-    return ApiResponse(success=True, data=requests)
+    return ApiResponse(success=True, data=cursor_page(requests, limit))
 
 
 @router.get(
@@ -158,7 +167,7 @@ async def get_breeding_request(
     service: BreedingRequestService = Depends(get_breeding_request_service)
 ):
     """Get a specific breeding request with details."""
-    logger.info(f"Getting breeding request {request_id}")
+    logger.info("Getting breeding request %s", request_id)
     
     breeding_request = await service.get_request_with_details(request_id)
     
@@ -170,7 +179,8 @@ async def get_breeding_request(
 
 @router.get(
     "/{request_id}/matches",
-    response_model=ApiResponse[List[BreedingRequestPublic]],
+    response_model=None,
+    responses={200: {"model": ApiResponse[List[BreedingRequestPublic]]}},
     summary="Find matches",
     description="Find potential breeding matches for a request"
 )
@@ -180,7 +190,7 @@ async def find_breeding_matches(
     service: BreedingRequestService = Depends(get_breeding_request_service)
 ):
     """Find potential breeding matches for a request."""
-    logger.info(f"Finding matches for breeding request {request_id}")
+    logger.info("Finding matches for breeding request %s", request_id)
     
     # Verify request exists
     breeding_request = await service.get_by_id(request_id)
@@ -189,11 +199,7 @@ async def find_breeding_matches(
     
     matches = await service.find_matches(request_id, skip=0, limit=limit)
     
-    return ApiResponse(
-        success=True,
-        data=matches,
-        message=f"Found {len(matches)} potential matches"
-    )
+    return fast_response(_public_items(matches), f"Found {len(matches)} potential matches")
 
 
 @router.put(
@@ -209,17 +215,13 @@ async def update_breeding_request(
     service: BreedingRequestService = Depends(get_breeding_request_service)
 ):
     """Update a breeding request."""
-    logger.info(f"Updating breeding request {request_id}")
-    
-    # Verify ownership
-    if not await service.verify_owner(request_id, current_user.id):
-        raise PermissionDeniedException("update this breeding request")
+    logger.info("Updating breeding request %s", request_id)
     
     update_data = request_in.model_dump(exclude_unset=True)
-    breeding_request = await service.update(request_id, update_data)
+    breeding_request = await service.update_if_owner(request_id, current_user.id, update_data)
     
     if not breeding_request:
-        raise NotFoundException("Breeding request")
+        raise PermissionDeniedException("update this breeding request")
     
     return ApiResponse(
         success=True,
@@ -241,7 +243,7 @@ async def update_breeding_request_status(
     service: BreedingRequestService = Depends(get_breeding_request_service)
 ):
     """Update breeding request status."""
-    logger.info(f"Updating status of breeding request {request_id} to {status_update.status}")
+    logger.info("Updating status of breeding request %s to %s", request_id, status_update.status)
     
     breeding_request = await service.update_status(
         request_id,
@@ -271,17 +273,11 @@ async def delete_breeding_request(
     service: BreedingRequestService = Depends(get_breeding_request_service)
 ):
     """Delete a breeding request."""
-    logger.info(f"Deleting breeding request {request_id}")
+    logger.info("Deleting breeding request %s", request_id)
     
-    # Verify ownership
-    if not await service.verify_owner(request_id, current_user.id):
+    if not await service.delete_if_owner(request_id, current_user.id):
         raise PermissionDeniedException("delete this breeding request")
     
-    success = await service.delete(request_id)
-    
-    if not success:
-        raise NotFoundException("Breeding request")
-    
     return ApiResponse(
         success=True,
         data={"message": "Breeding request deleted successfully"},
@@ -10,14 +10,18 @@ from models.user import User
 from schemas.common import ApiResponse, MessageResponse
 from schemas.favorite import Favorite, FavoriteCreate, FavoriteWithPet
 from services.favorite_service import FavoriteService
+from utils.responses import fast_response, items_serializer
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+_favorite_items = items_serializer(FavoriteWithPet)
+
 
 @router.get(
     "/",
-    response_model=ApiResponse[List[FavoriteWithPet]],
+    response_model=None,
+    responses={200: {"model": ApiResponse[List[FavoriteWithPet]]}},
     summary="Get my favorites",
     description="Get all favorite pets for the current user"
 )
@@ -26,15 +30,11 @@ async def get_my_favorites(
     favorite_service: FavoriteService = Depends(get_favorite_service)
 ):
     """Get current user's favorite pets."""
-    logger.info(f"Getting favorites for user {current_user.id}")
+    logger.info("Getting favorites for user %s", current_user.id)
     
     favorites = await favorite_service.get_user_favorites(current_user.id)
     
-    return ApiResponse(
-        success=True,
-        data=favorites,
-        message=f"Retrieved {len(favorites)} favorites"
-    )
+    return fast_response(_favorite_items(favorites), f"Retrieved {len(favorites)} favorites")
 
 
 @router.post(
@@ -50,7 +50,7 @@ async def add_favorite(
     favorite_service: FavoriteService = Depends(get_favorite_service)
 ):
     """Add pet to favorites."""
-    logger.info(f"User {current_user.id} adding pet {favorite_in.pet_id} to favorites")
+    logger.info("User %s adding pet %s to favorites", current_user.id, favorite_in.pet_id)
     
     favorite = await favorite_service.add_favorite(current_user.id, favorite_in.pet_id)
     
@@ -73,7 +73,7 @@ async def remove_favorite(
     favorite_service: FavoriteService = Depends(get_favorite_service)
 ):
     """Remove pet from favorites."""
-    logger.info(f"User {current_user.id} removing pet {pet_id} from favorites")
+    logger.info("User %s removing pet %s from favorites", current_user.id, pet_id)
     
     success = await favorite_service.remove_favorite(current_user.id, pet_id)
     
@@ -101,7 +101,7 @@ async def check_favorite(
     favorite_service: FavoriteService = Depends(get_favorite_service)
 ):
     """Check if pet is favorited."""
-    logger.info(f"Checking if user {current_user.id} favorited pet {pet_id}")
+    logger.info("Checking if user %s favorited pet %s", current_user.id, pet_id)
     
     is_favorited = await favorite_service.is_favorited(current_user.id, pet_id)
     
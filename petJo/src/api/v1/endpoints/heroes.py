@@ -4,6 +4,7 @@ from typing import List
 
 from fastapi import APIRouter, Depends
 
+from core.cache import get_from_cache, set_to_cache
 from dependencies import get_hero_service
 from schemas.common import ApiResponse
 from schemas.hero import Hero as HeroSchema
@@ -12,6 +13,9 @@ from services.hero_service import HeroService
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Cleared by the admin hero endpoints on every change
+HEROES_CACHE_TTL = 120
+
 
 @router.get(
     "/",
@@ -27,7 +31,15 @@ async def get_all_heroes(
     """Get all hero items (public endpoint)."""
     logger.info("Fetching all hero items")
     
-    heroes = await hero_service.get_all_heroes(skip, limit)
+    cache_key = f"heroes:{skip}:{limit}"
+    heroes = await get_from_cache(cache_key)
+    
+    if heroes is None:
+        heroes = [
+            HeroSchema.model_validate(hero).model_dump()
+            for hero in await hero_service.get_all_heroes(skip, limit)
+        ]
+        await set_to_cache(cache_key, heroes, HEROES_CACHE_TTL)
     
     return ApiResponse(
         success=True,
@@ -1,10 +1,17 @@
 """API endpoints for missing animal reports."""
+import hashlib
 import logging
 from typing import List, Optional
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, File, Form, Query, Request, UploadFile, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
-from core.storage import get_storage_service
+from core.cache import clear_cache, get_from_cache, set_to_cache
+from core.storage import accepted_photos, upload_photos
+from db.session import AsyncSessionLocal
+from repositories.missing_animal_repository import MissingAnimalRepository
 from schemas.missing_animal import (
     MissingAnimalCreate,
     MissingAnimalUpdate,
@@ -14,11 +21,68 @@ from schemas.missing_animal import (
 from schemas.common import ApiResponse, PaginatedResponse
 from dependencies import get_missing_animal_service, get_current_user_id
 from services.missing_animal_service import MissingAnimalService
-from core.rate_limit import limiter, RATE_LIMITS
+from utils.pagination import CursorPage, cursor_page, decode_cursor
+from core.rate_limit import count_cache_hit, limiter, served_from_cache, RATE_LIMITS
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Statistics and search results are cached briefly and cleared whenever a report changes
+MISSING_STATS_NAMESPACE = "missing_stats"
+MISSING_STATS_CACHE_TTL = 60
+MISSING_SEARCH_NAMESPACE = "missing_search"
+MISSING_SEARCH_CACHE_TTL = 45
+
+# Compiled once at import; validate trusted ORM rows straight from their attributes
+_public = TypeAdapter(MissingAnimalPublic)
+# A whole page in one pass instead of one model_validate per row
+_public_list = TypeAdapter(List[MissingAnimalPublic])
+
+
+def _statistics_cache_key(city_id: Optional[int]) -> str:
+    """Cache key of the statistics for one city, or for all cities."""
+    return f"{MISSING_STATS_NAMESPACE}:{city_id or 'all'}"
+
+
+def _search_cache_key(q: str, page: int, page_size: int, city_id: Optional[int]) -> str:
+    """Cache key of one search page; the search is case-insensitive, so equivalent queries share it."""
+    normalized = q.strip().lower()
+    digest = hashlib.blake2b(
+        f"{normalized}|{page}|{page_size}|{city_id}".encode(), digest_size=16
+    ).hexdigest()
+    return f"{MISSING_SEARCH_NAMESPACE}:{digest}"
+
+
+async def _cached_statistics(
+    request: Request,
+    city_id: Optional[int] = Query(None, description="Filter by city")
+) -> Optional[dict]:
+    """Look up cached statistics; a hit is rate limited in-process only."""
+    stats = await get_from_cache(_statistics_cache_key(city_id))
+    if stats is not None:
+        count_cache_hit(request, RATE_LIMITS["public"])
+    return stats
+
+
+async def _cached_search(
+    request: Request,
+    q: str = Query(..., min_length=2, description="Search query"),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    city_id: Optional[int] = Query(None, description="Filter by city")
+) -> Optional[dict]:
+    """Look up a cached search page; a hit is rate limited in-process only."""
+    data = await get_from_cache(_search_cache_key(q, page, page_size, city_id))
+    if data is not None:
+        count_cache_hit(request, RATE_LIMITS["search"])
+    return data
+
+
+async def _invalidate_report_caches():
+    """Drop cached statistics and search results after a report changes."""
+    await clear_cache(MISSING_STATS_NAMESPACE)
+    await clear_cache(MISSING_SEARCH_NAMESPACE)
+
 
 @router.post(
     "/",
@@ -44,44 +108,19 @@ async def create_missing_report(
     contact_email: Optional[str] = Form(None),
     reward_amount: Optional[float] = Form(None),
     photos: Optional[List[UploadFile]] = File(None, description="Photos of the missing animal (max 5)"),
-    user_id: str = Depends(get_current_user_id),
+    user_id: UUID = Depends(get_current_user_id),
     service: MissingAnimalService = Depends(get_missing_animal_service)
 ):
     """Report a missing animal with optional photo uploads."""
-    logger.info(f"Creating missing animal report for user: {user_id}")
-    
-    # Upload photos if provided
-    photo_url = None
-    if photos:
-        storage = get_storage_service()
-        
-        for photo in photos[:5]:  # Max 5 photos
-            try:
-                photo.file.seek(0, 2)
-                photo.file.seek(0)
-                
-                url = await storage.upload_file(
-                    file=photo.file,
-                    filename=photo.filename,
-                    content_type=photo.content_type,
-                    folder="missing-animals"
-                )
-                
-                if not photo_url:
-                    photo_url = url  # Use first photo as main
-                
-                logger.info(f"Uploaded missing animal photo: {url}")
-            except Exception as e:
-                logger.error(f"Failed to upload photo {photo.filename}: {e}")
-                continue
+    logger.info("Creating missing animal report for user: %s", user_id)
     
     # Create report data
     report_data = MissingAnimalCreate(
-        animal_name=animal_name,
+        pet_name=animal_name,
         animal_type=animal_type,
         breed=breed,
         color=color,
-        age=age,
+        age_approximate=age,
         gender=gender,
         city_id=city_id,
         last_seen_location=last_seen_location,
@@ -89,15 +128,21 @@ async def create_missing_report(
         description=description,
         contact_phone=contact_phone,
         contact_email=contact_email,
-        reward_amount=reward_amount,
-        photo_url=photo_url
+        reward_offered=reward_amount is not None,
+        reward_amount=str(reward_amount) if reward_amount is not None else None
     )
     
-    report = await service.create_report(owner_id=user_id, report_data=report_data)
+    photos = accepted_photos(photos, limit=5)  # Max 5 photos
+    
+    # Upload first, so the report is inserted once with its photos
+    photo_urls = await upload_photos(photos, folder="missing-animals") if photos else []
+    report = await service.create_report(owner_id=user_id, report_data=report_data, photo_urls=photo_urls)
+    
+    await _invalidate_report_caches()
     
     return ApiResponse(
         success=True,
-        data=MissingAnimalPublic.model_validate(report),
+        data=_public.validate_python(report, from_attributes=True),
         message="Missing animal report created successfully"
     )
 
@@ -121,7 +166,7 @@ async def list_missing_reports(
     """List active missing animal reports."""
     skip = (page - 1) * page_size
     
-    reports = await service.get_public_reports(
+    reports, total = await service.get_public_reports_with_total(
         skip=skip,
         limit=page_size,
         city_id=city_id,
@@ -129,16 +174,10 @@ async def list_missing_reports(
         status=status
     )
     
-    total = await service.count_reports(
-        city_id=city_id,
-        animal_type=animal_type,
-        status=status
-    )
-    
     return ApiResponse(
         success=True,
         data=PaginatedResponse(
-            items=[MissingAnimalPublic.model_validate(r) for r in reports],
+            items=_public_list.validate_python(reports, from_attributes=True),
             total=total,
             page=page,
             page_size=page_size,
@@ -147,61 +186,103 @@ async def list_missing_reports(
     )
 
 
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    summary="Stream missing animals",
+    description="Stream active missing animal reports as NDJSON, one report per line"
+)
+@limiter.limit(RATE_LIMITS["public"])
+async def stream_missing_reports(
+    request: Request,
+    limit: int = Query(1000, ge=1, le=10000, description="Maximum number of reports"),
+    city_id: Optional[int] = Query(None, description="Filter by city"),
+    animal_type: Optional[str] = Query(None, description="Filter by animal type (dog, cat, etc.)"),
+    status: Optional[str] = Query(None, description="Filter by status")
+):
+    """Stream active missing animal reports without building the whole list in memory."""
+    async def reports():
+        # The request session is closed before the body is sent, so the stream owns its own
+        async with AsyncSessionLocal() as session:
+            result = await MissingAnimalRepository(session).stream_active_reports(
+                limit=limit,
+                city_id=city_id,
+                animal_type=animal_type,
+                status=status
+            )
+            async for report in result:
+                yield _public.dump_json(_public.validate_python(report, from_attributes=True)) + b"\n"
+    
+    return StreamingResponse(reports(), media_type="application/x-ndjson")
+
+
 @router.get(
     "/search",
     response_model=ApiResponse[PaginatedResponse[MissingAnimalPublic]],
     summary="Search missing animals",
     description="Search missing animal reports by keywords"
 )
-@limiter.limit(RATE_LIMITS["search"])
+@limiter.limit(RATE_LIMITS["search"], exempt_when=served_from_cache)
 async def search_missing_reports(
     request: Request,
     q: str = Query(..., min_length=2, description="Search query"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     city_id: Optional[int] = Query(None, description="Filter by city"),
+    data: Optional[dict] = Depends(_cached_search),
     service: MissingAnimalService = Depends(get_missing_animal_service)
 ):
     """Search missing animal reports."""
-    skip = (page - 1) * page_size
-    
-    reports = await service.search_reports(
-        search_term=q,
-        skip=skip,
-        limit=page_size,
-        city_id=city_id
-    )
+    if data is None:
+        skip = (page - 1) * page_size
+        
+        reports, total = await service.search_reports(
+            search_term=q,
+            skip=skip,
+            limit=page_size,
+            city_id=city_id
+        )
+        
+        data = PaginatedResponse(
+            items=_public_list.validate_python(reports, from_attributes=True),
+            total=total,
+            page=page,
+            page_size=page_size,
+            pages=(total + page_size - 1) // page_size,
+            has_next=skip + len(reports) < total
+        ).model_dump()
+        await set_to_cache(_search_cache_key(q, page, page_size, city_id), data, MISSING_SEARCH_CACHE_TTL)
     
     return ApiResponse(
         success=True,
-        data=PaginatedResponse(
-            items=[MissingAnimalPublic.model_validate(r) for r in reports],
-            total=len(reports),
-            page=page,
-            page_size=page_size,
-            pages=1  # Search doesn't have total count
-        )
+        data=data
     )
 
 
 @router.get(
     "/my-reports",
-    response_model=ApiResponse[List[MissingAnimalPublic]],
+    response_model=ApiResponse[CursorPage[MissingAnimalPublic]],
     summary="Get my missing reports",
-    description="Get all missing animal reports created by current user"
+    description="Get the missing animal reports created by current user, newest first"
 )
 @limiter.limit(RATE_LIMITS["default"])
 async def get_my_reports(
     request: Request,
-    user_id: str = Depends(get_current_user_id),
+    cursor: Optional[str] = Query(None, description="Cursor returned by the previous page"),
+    limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    user_id: UUID = Depends(get_current_user_id),
     service: MissingAnimalService = Depends(get_missing_animal_service)
 ):
     """Get user's missing animal reports."""
-    reports = await service.get_user_reports(owner_id=user_id)
+    reports = await service.get_user_reports(
+        owner_id=user_id,
+        limit=limit + 1,
+        after=decode_cursor(cursor, int) if cursor else None
+    )
     
     return ApiResponse(
         success=True,
-        data=[MissingAnimalPublic.model_validate(r) for r in reports]
+        data=cursor_page(reports, limit)
     )
 
 
@@ -224,7 +305,7 @@ async def get_recent_reports(
     
     return ApiResponse(
         success=True,
-        data=[MissingAnimalPublic.model_validate(r) for r in reports]
+        data=_public_list.validate_python(reports, from_attributes=True)
     )
 
 
@@ -234,14 +315,17 @@ async def get_recent_reports(
     summary="Get missing animals statistics",
     description="Get statistics about missing animal reports"
 )
-@limiter.limit(RATE_LIMITS["public"])
+@limiter.limit(RATE_LIMITS["public"], exempt_when=served_from_cache)
 async def get_statistics(
     request: Request,
     city_id: Optional[int] = Query(None, description="Filter by city"),
+    stats: Optional[dict] = Depends(_cached_statistics),
     service: MissingAnimalService = Depends(get_missing_animal_service)
 ):
     """Get missing animal statistics."""
-    stats = await service.get_statistics(city_id=city_id)
+    if stats is None:
+        stats = await service.get_statistics(city_id=city_id)
+        await set_to_cache(_statistics_cache_key(city_id), stats, MISSING_STATS_CACHE_TTL)
     
     return ApiResponse(
         success=True,
@@ -266,7 +350,7 @@ async def get_missing_report(
     
     return ApiResponse(
         success=True,
-        data=MissingAnimalPublic.model_validate(report)
+        data=_public.validate_python(report, from_attributes=True)
     )
 
 
@@ -281,7 +365,7 @@ async def update_missing_report(
     request: Request,
     report_id: int,
     update_data: MissingAnimalUpdate,
-    user_id: str = Depends(get_current_user_id),
+    user_id: UUID = Depends(get_current_user_id),
     service: MissingAnimalService = Depends(get_missing_animal_service)
 ):
     """Update a missing animal report."""
@@ -290,10 +374,11 @@ async def update_missing_report(
         owner_id=user_id,
         update_data=update_data
     )
+    await _invalidate_report_caches()
     
     return ApiResponse(
         success=True,
-        data=MissingAnimalPublic.model_validate(report),
+        data=_public.validate_python(report, from_attributes=True),
         message="Missing animal report updated successfully"
     )
 
@@ -309,7 +394,7 @@ async def update_report_status(
     request: Request,
     report_id: int,
     status_data: MissingAnimalStatusUpdate,
-    user_id: str = Depends(get_current_user_id),
+    user_id: UUID = Depends(get_current_user_id),
     service: MissingAnimalService = Depends(get_missing_animal_service)
 ):
     """Update missing animal report status."""
@@ -318,10 +403,11 @@ async def update_report_status(
         owner_id=user_id,
         new_status=status_data.status
     )
+    await _invalidate_report_caches()
     
     return ApiResponse(
         success=True,
-        data=MissingAnimalPublic.model_validate(report),
+        data=_public.validate_python(report, from_attributes=True),
         message=f"Report status updated to: {status_data.status}"
     )
 
@@ -336,11 +422,12 @@ async def update_report_status(
 async def close_missing_report(
     request: Request,
     report_id: int,
-    user_id: str = Depends(get_current_user_id),
+    user_id: UUID = Depends(get_current_user_id),
     service: MissingAnimalService = Depends(get_missing_animal_service)
 ):
     """Close a missing animal report."""
     await service.deactivate_report(report_id=report_id, owner_id=user_id)
+    await _invalidate_report_caches()
     
     return ApiResponse(
         success=True,
@@ -3,9 +3,9 @@ import logging
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Request, UploadFile, status
 
-from core.storage import get_storage_service
+from core.storage import accepted_photos, upload_photos
 from dependencies import get_current_active_user, get_current_user_id, get_pet_help_service
 from exceptions import PermissionDeniedException
 from models.user import User
@@ -17,11 +17,21 @@ from schemas.pet_help import (
     PetHelpRequestUpdate,
 )
 from services.pet_help_service import PetHelpRequestService
-from utils.pagination import PaginatedResponse, PaginationParams, paginate
+from utils.etag import etag_response
+from utils.pagination import (
+    CursorPage,
+    CursorPaginationParams,
+    cursor_page,
+    cursor_pagination_params,
+    decode_cursor,
+)
+from utils.responses import fast_response, items_serializer
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+_public_items = items_serializer(PetHelpRequestPublic, exclude_none=True)
+
 
 @router.post(
     "/",
@@ -44,32 +54,12 @@ async def create_help_request(
     help_service: PetHelpRequestService = Depends(get_pet_help_service)
 ):
     """Create a new pet help request with optional photo uploads."""
-    logger.info(f"Creating help request for user {current_user.id}")
+    logger.info("Creating help request for user %s", current_user.id)
     
     # Upload photos if provided
-    photo_url = None
-    if photos:
-        storage = get_storage_service()
-        
-        for photo in photos[:3]:  # Max 3 photos
-            try:
-                photo.file.seek(0, 2)
-                photo.file.seek(0)
-                
-                url = await storage.upload_file(
-                    file=photo.file,
-                    filename=photo.filename,
-                    content_type=photo.content_type,
-                    folder="help-requests"
-                )
-                
-                if not photo_url:
-                    photo_url = url  # Use first photo
-                
-                logger.info(f"Uploaded help request photo: {url}")
-            except Exception as e:
-                logger.error(f"Failed to upload photo {photo.filename}: {e}")
-                continue
+    photos = accepted_photos(photos, limit=3)  # Max 3 photos
+    photo_urls = await upload_photos(photos, folder="help-requests") if photos else []
+    photo_url = photo_urls[0] if photo_urls else None  # Use first photo
     
     # Create help request data
     help_data = {
@@ -107,7 +97,7 @@ async def create_help_request_json(
     help_service: PetHelpRequestService = Depends(get_pet_help_service)
 ):
     """Create a new pet help request from JSON."""
-    logger.info(f"Creating help request (JSON) for user {current_user.id}")
+    logger.info("Creating help request (JSON) for user %s", current_user.id)
 
     help_data = help_in.model_dump()
     help_data["owner_id"] = current_user.id
@@ -123,94 +113,97 @@ async def create_help_request_json(
 
 @router.get(
     "/",
-    response_model=ApiResponse[PaginatedResponse[PetHelpRequestPublic]],
+    response_model=None,
+    responses={200: {"model": ApiResponse[CursorPage[PetHelpRequestPublic]]}},
     summary="List all help requests",
-    description="Get a paginated list of all pet help requests"
+    description="Get all pet help requests, newest first, one cursor page at a time"
 )
 async def list_help_requests(
-    pagination: PaginationParams = Depends(),
+    pagination: CursorPaginationParams = Depends(cursor_pagination_params),
     help_service: PetHelpRequestService = Depends(get_pet_help_service)
 ):
-    """Get all help requests with pagination."""
-    logger.info(f"Listing help requests (page {pagination.page})")
+    """Get all help requests with keyset pagination."""
+    logger.info("Listing help requests")
     
     help_requests = await help_service.get_all_public_requests(
-        skip=pagination.skip,
-        limit=pagination.limit
+        limit=pagination.limit + 1,
+        after=decode_cursor(pagination.cursor, int) if pagination.cursor else None
     )
+    page = cursor_page(help_requests, pagination.limit)
     
-    total = await help_service.count({})
-    paginated = paginate(help_requests, total, pagination.page, pagination.page_size)
-    
-    return ApiResponse(success=True, data=paginated)
+    return fast_response({"items": _public_items(page.items), "next_cursor": page.next_cursor})
 
 
 @router.get(
     "/search",
-    response_model=ApiResponse[List[PetHelpRequestPublic]],
+    response_model=None,
+    responses={200: {"model": ApiResponse[CursorPage[PetHelpRequestPublic]]}},
     summary="Search help requests by location",
-    description="Search for help requests within a radius of a location"
+    description="Search for help requests within a radius of a location, newest first"
 )
 async def search_help_requests_by_location(
     lat: float = Query(..., ge=-90, le=90, description="Latitude"),
     lng: float = Query(..., ge=-180, le=180, description="Longitude"),
     radius: float = Query(10.0, ge=0.1, le=100, description="Search radius in kilometers"),
-    pagination: PaginationParams = Depends(),
+    pagination: CursorPaginationParams = Depends(cursor_pagination_params),
     help_service: PetHelpRequestService = Depends(get_pet_help_service)
 ):
     """Search help requests by location."""
-    logger.info(f"Searching help requests near ({lat}, {lng}) within {radius}km")
+    logger.info("Searching help requests near (%s, %s) within %skm", lat, lng, radius)
     
     help_requests = await help_service.search_by_location(
         lat=lat,
         lng=lng,
         radius_km=radius,
-        skip=pagination.skip,
-        limit=pagination.limit
+        limit=pagination.limit + 1,
+        after=decode_cursor(pagination.cursor, int) if pagination.cursor else None
     )
+    page = cursor_page(help_requests, pagination.limit)
     
-    return ApiResponse(
-        success=True,
-        data=help_requests,
-        message=f"Found {len(help_requests)} help requests"
+    return fast_response(
+        {"items": _public_items(page.items), "next_cursor": page.next_cursor},
+        f"Found {len(page.items)} help requests"
     )
 
 
 @router.get(
     "/my-requests",
-    response_model=ApiResponse[List[PetHelpRequest]],
+    response_model=ApiResponse[CursorPage[PetHelpRequest]],
+    response_model_exclude_none=True,
     summary="Get my help requests",
-    description="Get all help requests created by the current user"
+    description="Get the help requests created by the current user, newest first"
 )
 async def list_my_help_requests(
-    pagination: PaginationParams = Depends(),
+    pagination: CursorPaginationParams = Depends(cursor_pagination_params),
     current_user: User = Depends(get_current_active_user),
     help_service: PetHelpRequestService = Depends(get_pet_help_service)
 ):
     """Get current user's help requests."""
-    logger.info(f"Listing help requests for user {current_user.id}")
+    logger.info("Listing help requests for user %s", current_user.id)
     
     help_requests = await help_service.get_user_help_requests(
         owner_id=current_user.id,
-        skip=pagination.skip,
-        limit=pagination.limit
+        limit=pagination.limit + 1,
+        after=decode_cursor(pagination.cursor, int) if pagination.cursor else None
     )
     
-    return ApiResponse(success=True, data=help_requests)
+    return ApiResponse(success=True, data=cursor_page(help_requests, pagination.limit))
 
 
 @router.get(
     "/{help_id}",
-    response_model=ApiResponse[PetHelpRequest],
+    response_model=None,
+    responses={200: {"model": ApiResponse[PetHelpRequest]}, 304: {"description": "Not modified"}},
     summary="Get help request by ID",
     description="Get detailed information about a specific help request"
 )
 async def get_help_request(
     help_id: int,
+    request: Request,
     help_service: PetHelpRequestService = Depends(get_pet_help_service)
 ):
     """Get help request by ID with full details."""
-    logger.info(f"Getting help request {help_id}")
+    logger.info("Getting help request %s", help_id)
     
     help_request = await help_service.get_help_request_with_details(help_id)
     
@@ -220,7 +213,9 @@ async def get_help_request(
             detail="Help request not found"
         )
     
-    return ApiResponse(success=True, data=help_request)
+    # Help requests have no updated_at, so the tag is derived from the body
+    detail = PetHelpRequest.model_validate(help_request).model_dump(mode="json")
+    return etag_response(request, ApiResponse.model_construct(success=True, data=detail).model_dump())
 
 
 @router.patch(
@@ -232,24 +227,18 @@ async def get_help_request(
 async def update_help_request(
     help_id: int,
     help_update: PetHelpRequestUpdate,
-    current_user_id: str = Depends(get_current_user_id),
+    current_user_id: UUID = Depends(get_current_user_id),
     help_service: PetHelpRequestService = Depends(get_pet_help_service)
 ):
     """Update a help request."""
-    logger.info(f"Updating help request {help_id}")
-    
-    # Verify ownership
-    if not await help_service.verify_owner(help_id, UUID(current_user_id)):
-        raise PermissionDeniedException("update this help request")
+    logger.info("Updating help request %s", help_id)
     
+    # Ownership is checked by the UPDATE itself; no row means missing or not ours
     update_data = help_update.model_dump(exclude_unset=True)
-    help_request = await help_service.update(help_id, update_data)
+    help_request = await help_service.update_if_owner(help_id, current_user_id, update_data)
     
     if not help_request:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Help request not found"
-        )
+        raise PermissionDeniedException("update this help request")
     
     return ApiResponse(
         success=True,
@@ -267,22 +256,13 @@ async def update_help_request(
 )
 async def delete_help_request(
     help_id: int,
-    current_user_id: str = Depends(get_current_user_id),
+    current_user_id: UUID = Depends(get_current_user_id),
     help_service: PetHelpRequestService = Depends(get_pet_help_service)
 ):
     """Delete a help request."""
-    logger.info(f"Deleting help request {help_id}")
+    logger.info("Deleting help request %s", help_id)
     
-    # Verify ownership
-    if not await help_service.verify_owner(help_id, UUID(current_user_id)):
+    if not await help_service.delete_if_owner(help_id, current_user_id):
         raise PermissionDeniedException("delete this help request")
     
-    success = await help_service.delete(help_id)
-    
-    if not success:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Help request not found"
-        )
-    
     return MessageResponse(success=True, message="Help request deleted successfully")
@@ -5,11 +5,10 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
-from dependencies import get_current_user_id, get_pet_photo_service, get_pet_service
+from dependencies import get_current_user_id, get_pet_photo_service
 from schemas.common import ApiResponse, MessageResponse
 from schemas.pet_photo import PetPhoto, PetPhotoCreate
 from services.pet_photo_service import PetPhotoService
-from services.pet_service import PetService
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -19,14 +18,14 @@ router = APIRouter()
     "/{pet_id}/photos",
     response_model=ApiResponse[List[PetPhoto]],
     summary="Get pet photos",
-    description="Get all photos for a specific pet"
+    description="Get all photos for a specific pet. Deprecated for pet pages: GET /pets/{pet_id} already includes the photos"
 )
 async def get_pet_photos(
     pet_id: UUID,
     pet_photo_service: PetPhotoService = Depends(get_pet_photo_service)
 ):
     """Get all photos for a pet."""
-    logger.info(f"Getting photos for pet {pet_id}")
+    logger.info("Getting photos for pet %s", pet_id)
     
     photos = await pet_photo_service.get_pet_photos(pet_id)
     
@@ -47,25 +46,20 @@ async def get_pet_photos(
 async def add_pet_photo(
     pet_id: UUID,
     photo_in: PetPhotoCreate,
-    current_user_id: str = Depends(get_current_user_id),
-    pet_service: PetService = Depends(get_pet_service),
+    current_user_id: UUID = Depends(get_current_user_id),
     pet_photo_service: PetPhotoService = Depends(get_pet_photo_service)
 ):
     """Add photo to pet."""
-    logger.info(f"Adding photo to pet {pet_id}")
+    logger.info("Adding photo to pet %s", pet_id)
     
-    # Verify ownership
-    if not await pet_service.verify_owner(pet_id, current_user_id):
+    photo = await pet_photo_service.add_if_pet_owner(pet_id, current_user_id, photo_in.url)
+    
+    if not photo:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to add photos to this pet"
         )
     
-    photo_data = photo_in.model_dump()
-    photo_data["pet_id"] = pet_id
-    
-    photo = await pet_photo_service.create(photo_data)
-    
     return ApiResponse(
         success=True,
         data=photo,
@@ -82,23 +76,14 @@ async def add_pet_photo(
 async def delete_pet_photo(
     pet_id: UUID,
     photo_id: int,
-    current_user_id: str = Depends(get_current_user_id),
-    pet_service: PetService = Depends(get_pet_service),
+    current_user_id: UUID = Depends(get_current_user_id),
     pet_photo_service: PetPhotoService = Depends(get_pet_photo_service)
 ):
     """Delete pet photo."""
-    logger.info(f"Deleting photo {photo_id} from pet {pet_id}")
-    
-    # Verify ownership
-    if not await pet_service.verify_owner(pet_id, current_user_id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to delete photos from this pet"
-        )
-    
-    success = await pet_photo_service.delete(photo_id)
+    logger.info("Deleting photo %s from pet %s", photo_id, pet_id)
     
-    if not success:
+    # Not found and not owned are indistinguishable to the DELETE
+    if not await pet_photo_service.delete_if_pet_owner(photo_id, pet_id, current_user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Photo not found"
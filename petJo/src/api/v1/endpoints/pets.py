@@ -3,72 +3,71 @@ import logging
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, Query, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, Request, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.storage import get_storage_service
+from core.storage import accepted_photos, upload_photos
 from db.session import get_db
-from dependencies import get_current_active_user, get_current_user_id, get_pet_service
+from dependencies import (
+    get_current_active_user,
+    get_current_user_id,
+    get_pet_photo_service,
+    get_pet_service,
+)
 from exceptions import PetNotFoundException, PermissionDeniedException
-from models.pet_photo import PetPhoto
 from models.user import User
 from schemas.common import ApiResponse, MessageResponse
-from schemas.pet import Pet, PetCreate, PetPublic, PetUpdate
+from schemas.pet import Pet, PetCreate, PetDetail, PetPublic, PetUpdate
+from services.pet_photo_service import PetPhotoService
 from services.pet_service import PetService
-from utils.filters import PetFilter
-from utils.pagination import PaginatedResponse, PaginationParams, paginate
+from utils.etag import etag_response
+from utils.filters import PetFilter, PetSearchFilters, pet_filter_params, pet_search_params
+from utils.pagination import (
+    CursorPage,
+    CursorPaginationParams,
+    PaginatedResponse,
+    PaginationParams,
+    cursor_page,
+    cursor_pagination_params,
+    decode_cursor,
+    paginate,
+    pagination_params,
+)
+from utils.responses import fast_response, items_serializer
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+_public_items = items_serializer(PetPublic, exclude_none=True)
+
 
 @router.get(
     "/search",
-    response_model=ApiResponse[PaginatedResponse[PetPublic]],
+    response_model=None,
+    responses={200: {"model": ApiResponse[PaginatedResponse[PetPublic]]}},
     summary="Search pets",
     description="Advanced search for pets with multiple filters and text search"
 )
 async def search_pets(
-    q: Optional[str] = Query(None, description="Search query for name, breed, or description"),
-    category_id: Optional[int] = Query(None, description="Filter by category ID"),
-    city_id: Optional[int] = Query(None, description="Filter by city ID"),
-    status: Optional[str] = Query(None, description="Filter by status (available, adopted, lost, found, help)"),
-    gender: Optional[str] = Query(None, description="Filter by gender (male, female)"),
-    min_age: Optional[int] = Query(None, ge=0, description="Minimum age in months"),
-    max_age: Optional[int] = Query(None, ge=0, description="Maximum age in months"),
-    vaccinated: Optional[bool] = Query(None, description="Filter by vaccination status"),
-    spayed: Optional[bool] = Query(None, description="Filter by spayed/neutered status"),
-    pagination: PaginationParams = Depends(),
+    filters: PetSearchFilters = Depends(pet_search_params),
+    pagination: PaginationParams = Depends(pagination_params),
     pet_service: PetService = Depends(get_pet_service)
 ):
     """Search pets with advanced filtering."""
-    filters = {
-        "search_term": q,
-        "category_id": category_id,
-        "city_id": city_id,
-        "status": status,
-        "gender": gender,
-        "min_age": min_age,
-        "max_age": max_age,
-        "vaccinated": vaccinated,
-        "spayed": spayed
-    }
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Searching pets with filters: %s", filters.model_dump(exclude_none=True))
     
-    logger.info(f"Searching pets with filters: {filters}")
-    
-    pets, total = await pet_service.advanced_search(
+    pets, has_more = await pet_service.advanced_search(
         filters=filters,
         skip=pagination.skip,
         limit=pagination.limit
     )
     
-    paginated = paginate(pets, total, pagination.page, pagination.page_size)
-    
-    return ApiResponse(
-        success=True,
-        data=paginated,
-        message=f"Found {total} pets matching your search"
+    paginated = paginate(
+        _public_items(pets), None, pagination.page, pagination.page_size, has_more=has_more
     )
+    
+    return fast_response(paginated.model_dump(), f"Found {len(pets)} pets matching your search")
 
 
 @router.post(
@@ -91,10 +90,11 @@ async def create_pet(
     spayed: Optional[bool] = Form(None),
     photos: List[UploadFile] = File(default=[]),
     current_user: User = Depends(get_current_active_user),
-    pet_service: PetService = Depends(get_pet_service)
+    pet_service: PetService = Depends(get_pet_service),
+    pet_photo_service: PetPhotoService = Depends(get_pet_photo_service)
 ):
     """Create a new pet listing with optional photo uploads."""
-    logger.info(f"Creating pet for user {current_user.id}")
+    logger.info("Creating pet for user %s", current_user.id)
     
     pet_data = {
         "name": name,
@@ -111,27 +111,8 @@ async def create_pet(
     }
     
     # Upload photos if provided
-    uploaded_photo_urls = []
-    if photos:
-        storage = get_storage_service()
-        
-        for photo in photos[:5]:  # Max 5 photos
-            try:
-                photo.file.seek(0, 2)
-                photo.file.seek(0)
-                
-                url = await storage.upload_file(
-                    file=photo.file,
-                    filename=photo.filename,
-                    content_type=photo.content_type,
-                    folder="pets"
-                )
-                
-                uploaded_photo_urls.append(url)
-                logger.info(f"Uploaded photo: {url}")
-            except Exception as e:
-                logger.error(f"Failed to upload photo {photo.filename}: {e}")
-                continue
+    photos = accepted_photos(photos, limit=5)  # Max 5 photos
+    uploaded_photo_urls = await upload_photos(photos, folder="pets") if photos else []
     
     # Set main photo if available
     if uploaded_photo_urls:
@@ -139,21 +120,10 @@ async def create_pet(
     
     pet = await pet_service.create(pet_data)
     
-    # Create PetPhoto records for uploaded photos
+    # Create PetPhoto records for uploaded photos; the response schema does not
+    # include them, so there is nothing to re-fetch
     if uploaded_photo_urls:
-        async for db in get_db():
-            for photo_url in uploaded_photo_urls:
-                pet_photo = PetPhoto(
-                    pet_id=pet.id,
-                    url=photo_url
-                )
-                db.add(pet_photo)
-            
-            await db.commit()
-            break
-        
-        # Re-fetch pet with photos
-        pet = await pet_service.get_pet_with_details(pet.id)
+        await pet_photo_service.add_photos(pet.id, uploaded_photo_urls)
     
     return ApiResponse(success=True, data=pet, message="Pet created successfully")
 
@@ -171,7 +141,7 @@ async def create_pet_json(
     pet_service: PetService = Depends(get_pet_service)
 ):
     """Create a new pet listing from JSON. Photos can be uploaded separately."""
-    logger.info(f"Creating pet (JSON) for user {current_user.id}")
+    logger.info("Creating pet (JSON) for user %s", current_user.id)
 
     pet_data = pet_in.model_dump()
     pet_data["owner_id"] = current_user.id
@@ -183,74 +153,78 @@ async def create_pet_json(
 
 @router.get(
     "/",
-    response_model=ApiResponse[PaginatedResponse[PetPublic]],
+    response_model=None,
+    responses={200: {"model": ApiResponse[CursorPage[PetPublic]]}},
     summary="List all pets",
-    description="Get a paginated list of available pets with optional filters"
+    description="Get available pets with optional filters, newest first, one cursor page at a time"
 )
 async def list_pets(
-    pagination: PaginationParams = Depends(),
-    filters: PetFilter = Depends(),
+    pagination: CursorPaginationParams = Depends(cursor_pagination_params),
+    filters: PetFilter = Depends(pet_filter_params),
     pet_service: PetService = Depends(get_pet_service)
 ):
-    """Get all available pets with filters and pagination."""
-    logger.info(f"Listing pets with filters: {filters.model_dump()}")
+    """Get all available pets with filters and keyset pagination."""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Listing pets with filters: %s", filters.model_dump(exclude_none=True))
     
     pets = await pet_service.search_available_pets(
-        skip=pagination.skip,
-        limit=pagination.limit,
+        limit=pagination.limit + 1,
         city_id=filters.city_id,
         category_id=filters.category_id,
-        search_term=filters.search
+        search_term=filters.search,
+        after=decode_cursor(pagination.cursor) if pagination.cursor else None
     )
+    page = cursor_page(pets, pagination.limit)
     
-    total = await pet_service.count(filters.to_dict())
-    paginated = paginate(pets, total, pagination.page, pagination.page_size)
-    
-    return ApiResponse(success=True, data=paginated)
+    return fast_response({"items": _public_items(page.items), "next_cursor": page.next_cursor})
 
 
 @router.get(
     "/my-pets",
-    response_model=ApiResponse[List[Pet]],
+    response_model=ApiResponse[CursorPage[Pet]],
+    response_model_exclude_none=True,
     summary="Get my pets",
-    description="Get all pets belonging to the current user"
+    description="Get the pets belonging to the current user, newest first"
 )
 async def list_my_pets(
-    pagination: PaginationParams = Depends(),
+    pagination: CursorPaginationParams = Depends(cursor_pagination_params),
     current_user: User = Depends(get_current_active_user),
     pet_service: PetService = Depends(get_pet_service)
 ):
     """Get current user's pets."""
-    logger.info(f"Listing pets for user {current_user.id}")
+    logger.info("Listing pets for user %s", current_user.id)
     
     pets = await pet_service.get_user_pets(
         owner_id=current_user.id,
-        skip=pagination.skip,
-        limit=pagination.limit
+        limit=pagination.limit + 1,
+        after=decode_cursor(pagination.cursor) if pagination.cursor else None
     )
     
-    return ApiResponse(success=True, data=pets)
+    return ApiResponse(success=True, data=cursor_page(pets, pagination.limit))
 
 
 @router.get(
     "/{pet_id}",
-    response_model=ApiResponse[Pet],
+    response_model=None,
+    responses={200: {"model": ApiResponse[PetDetail]}, 304: {"description": "Not modified"}},
     summary="Get pet by ID",
-    description="Get detailed information about a specific pet"
+    description="Get detailed information about a specific pet, including its category, city and photos"
 )
 async def get_pet(
     pet_id: UUID,
+    request: Request,
     pet_service: PetService = Depends(get_pet_service)
 ):
     """Get pet by ID with full details."""
-    logger.info(f"Getting pet {pet_id}")
+    logger.info("Getting pet %s", pet_id)
     
     pet = await pet_service.get_pet_with_details(pet_id)
     
     if not pet:
         raise PetNotFoundException()
     
-    return ApiResponse(success=True, data=pet)
+    detail = PetDetail.model_validate(pet).model_dump(mode="json")
+    return etag_response(request, ApiResponse.model_construct(success=True, data=detail).model_dump())
 
 
 @router.patch(
@@ -262,22 +236,19 @@ async def get_pet(
 async def update_pet(
     pet_id: UUID,
     pet_update: PetUpdate,
-    current_user_id: str = Depends(get_current_user_id),
+    current_user_id: UUID = Depends(get_current_user_id),
     pet_service: PetService = Depends(get_pet_service),
     db: AsyncSession = Depends(get_db)
 ):
     """Update a pet listing."""
-    logger.info(f"Updating pet {pet_id}")
-    
-    # Verify ownership
-    if not await pet_service.verify_owner(pet_id, current_user_id):
-        raise PermissionDeniedException("update this pet")
+    logger.info("Updating pet %s", pet_id)
     
+    # Ownership is checked by the UPDATE itself; no row means missing or not ours
     update_data = pet_update.model_dump(exclude_unset=True)
-    pet = await pet_service.update(pet_id, update_data)
+    pet = await pet_service.update_if_owner(pet_id, current_user_id, update_data)
     
     if not pet:
-        raise PetNotFoundException()
+        raise PermissionDeniedException("update this pet")
     
     return ApiResponse(success=True, data=pet, message="Pet updated successfully")
 
@@ -291,21 +262,15 @@ async def update_pet(
 )
 async def delete_pet(
     pet_id: UUID,
-    current_user_id: str = Depends(get_current_user_id),
+    current_user_id: UUID = Depends(get_current_user_id),
     pet_service: PetService = Depends(get_pet_service)
 ):
     """Soft delete a pet listing."""
-    logger.info(f"Deleting pet {pet_id}")
+    logger.info("Deleting pet %s", pet_id)
     
-    # Verify ownership
-    if not await pet_service.verify_owner(pet_id, current_user_id):
+    if not await pet_service.delete_if_owner(pet_id, current_user_id):
         raise PermissionDeniedException("delete this pet")
     
-    pet = await pet_service.soft_delete(pet_id)
-    
-    if not pet:
-        raise PetNotFoundException()
-    
     return MessageResponse(success=True, message="Pet deleted successfully")
 
 
@@ -317,11 +282,11 @@ async def delete_pet(
 )
 async def publish_pet(
     pet_id: UUID,
-    current_user_id: str = Depends(get_current_user_id),
+    current_user_id: UUID = Depends(get_current_user_id),
     pet_service: PetService = Depends(get_pet_service)
 ):
     """Make a pet listing public."""
-    logger.info(f"Publishing pet {pet_id}")
+    logger.info("Publishing pet %s", pet_id)
     
     pet = await pet_service.publish_pet(pet_id, current_user_id)
     
@@ -339,11 +304,11 @@ async def publish_pet(
 )
 async def unpublish_pet(
     pet_id: UUID,
-    current_user_id: str = Depends(get_current_user_id),
+    current_user_id: UUID = Depends(get_current_user_id),
     pet_service: PetService = Depends(get_pet_service)
 ):
     """Make a pet listing private."""
-    logger.info(f"Unpublishing pet {pet_id}")
+    logger.info("Unpublishing pet %s", pet_id)
     
     pet = await pet_service.unpublish_pet(pet_id, current_user_id)
     
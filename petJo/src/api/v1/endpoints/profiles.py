@@ -1,22 +1,33 @@
 """User profile endpoints."""
+import asyncio
 import logging
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
-from sqlalchemy import select
+from PIL import Image
+from sqlalchemy import exists, func, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.config import settings
-from core.security import get_current_user_id, get_password_hash
+from core.security import get_current_user_id, hash_password
 from core.storage import get_storage_service
-from db.session import get_db
+from db.session import get_db, get_db_readonly
 from models.user import User as UserModel
 from schemas.common import ApiResponse
-from schemas.user import Profile, ProfileUpdate, ProfilePublic
+from schemas.user import EmailUpdate, PasswordUpdate, Profile, ProfileUpdate, ProfilePublic
+from utils.images import to_webp
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Avatars are stored as WebP, downscaled to fit this many pixels per side
+AVATAR_SIZE = 256
+AVATAR_TYPES = frozenset({"image/jpeg", "image/jpg", "image/png", "image/webp"})
+
+# Only the columns the public profile exposes, read as plain rows
+_PUBLIC_PROFILE_COLUMNS = [getattr(UserModel, field) for field in ProfilePublic.model_fields]
+
 
 @router.get(
     "/me",
@@ -24,14 +35,11 @@ router = APIRouter()
     summary="Get current user profile",
 )
 async def get_my_profile(
-    current_user_id: str = Depends(get_current_user_id),
+    current_user_id: UUID = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db),
 ):
     """Return the authenticated user's profile."""
-    result = await db.execute(
-        select(UserModel).where(UserModel.id == UUID(current_user_id))
-    )
-    user = result.scalar_one_or_none()
+    user = await db.get(UserModel, current_user_id)
 
     if not user:
         raise HTTPException(
@@ -53,14 +61,11 @@ async def get_my_profile(
 )
 async def update_my_profile(
     profile_update: ProfileUpdate,
-    current_user_id: str = Depends(get_current_user_id),
+    current_user_id: UUID = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db),
 ):
     """Update the authenticated user's profile fields."""
-    result = await db.execute(
-        select(UserModel).where(UserModel.id == UUID(current_user_id))
-    )
-    user = result.scalar_one_or_none()
+    user = await db.get(UserModel, current_user_id)
 
     if not user:
         raise HTTPException(
@@ -89,14 +94,11 @@ async def update_my_profile(
 )
 async def upload_avatar(
     file: UploadFile = File(..., description="Avatar image file"),
-    current_user_id: str = Depends(get_current_user_id),
+    current_user_id: UUID = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db),
 ):
     """Upload and set the user's avatar image."""
-    result = await db.execute(
-        select(UserModel).where(UserModel.id == UUID(current_user_id))
-    )
-    user = result.scalar_one_or_none()
+    user = await db.get(UserModel, current_user_id)
 
     if not user:
         raise HTTPException(
@@ -105,19 +107,26 @@ async def upload_avatar(
         )
 
     # Validate file type
-    allowed_types = {"image/jpeg", "image/jpg", "image/png", "image/webp"}
-    if file.content_type not in allowed_types:
+    if file.content_type not in AVATAR_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid file type. Allowed: JPEG, PNG, WebP",
         )
 
+    try:
+        avatar = await asyncio.to_thread(to_webp, file.file, AVATAR_SIZE)
+    except (OSError, Image.DecompressionBombError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Could not read the avatar image",
+        )
+
     storage = get_storage_service()
     try:
         url = await storage.upload_file(
-            file=file.file,
-            filename=file.filename,
-            content_type=file.content_type,
+            file=avatar,
+            filename="avatar.webp",
+            content_type="image/webp",
             folder="avatars",
         )
     except Exception as e:
@@ -144,45 +153,44 @@ async def upload_avatar(
     summary="Update profile email",
 )
 async def update_email(
-    payload: dict,
-    current_user_id: str = Depends(get_current_user_id),
+    payload: EmailUpdate,
+    current_user_id: UUID = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db),
 ):
     """Update the user's email address."""
-    new_email = payload.get("email")
-    if not new_email:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email is required",
-        )
+    new_email = payload.email
 
-    # Check uniqueness
-    existing = await db.execute(
-        select(UserModel).where(
-            UserModel.email == new_email,
-            UserModel.id != UUID(current_user_id),
-        )
+    # Set the address only if no other account holds it, in one statement
+    email_taken = exists().where(
+        func.lower(UserModel.email) == new_email.lower(),
+        UserModel.id != current_user_id,
     )
-    if existing.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Email already in use",
+    try:
+        result = await db.execute(
+            update(UserModel)
+            .where(UserModel.id == current_user_id, ~email_taken)
+            .values(email=new_email)
+            .returning(UserModel)
+            .execution_options(synchronize_session=False, populate_existing=True)
         )
+        user = result.scalar_one_or_none()
+        await db.commit()
+    except IntegrityError:
+        # Another account claimed the address between the check and the write
+        await db.rollback()
+        user = None
 
-    result = await db.execute(
-        select(UserModel).where(UserModel.id == UUID(current_user_id))
-    )
-    user = result.scalar_one_or_none()
     if not user:
+        if await db.get(UserModel, current_user_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found",
+            )
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Email already in use",
         )
 
-    user.email = new_email
-    await db.commit()
-    await db.refresh(user)
-
     return ApiResponse(
         success=True,
         data=user,
@@ -196,29 +204,19 @@ async def update_email(
     summary="Update profile password",
 )
 async def update_password(
-    payload: dict,
-    current_user_id: str = Depends(get_current_user_id),
+    payload: PasswordUpdate,
+    current_user_id: UUID = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db),
 ):
     """Update the user's password."""
-    new_password = payload.get("new_password")
-    if not new_password or len(new_password) < 8:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Password must be at least 8 characters",
-        )
-
-    result = await db.execute(
-        select(UserModel).where(UserModel.id == UUID(current_user_id))
-    )
-    user = result.scalar_one_or_none()
+    user = await db.get(UserModel, current_user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
 
-    user.hashed_password = get_password_hash(new_password)
+    user.hashed_password = await hash_password(payload.new_password)
     await db.commit()
 
     return ApiResponse(
@@ -235,14 +233,14 @@ async def update_password(
 )
 async def get_profile_by_id(
     user_id: UUID,
-    current_user_id: str = Depends(get_current_user_id),
-    db: AsyncSession = Depends(get_db),
+    current_user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db_readonly),
 ):
     """Get a user's public profile by their ID."""
     result = await db.execute(
-        select(UserModel).where(UserModel.id == user_id)
+        select(*_PUBLIC_PROFILE_COLUMNS).where(UserModel.id == user_id)
     )
-    user = result.scalar_one_or_none()
+    user = result.mappings().one_or_none()
 
     if not user:
         raise HTTPException(
@@ -252,6 +250,6 @@ async def get_profile_by_id(
 
     return ApiResponse(
         success=True,
-        data=user,
+        data=dict(user),
         message="Profile retrieved successfully",
     )
@@ -2,24 +2,34 @@
 import logging
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from db.session import get_db
+from core.cache import LOOKUP_CACHE_TTL, cached, get_from_cache, set_to_cache
+from db.session import get_db, get_db_readonly
 from models.advertisement import Advertisement
 from models.category import Category
 from models.city import City
 from models.pet import Pet, PetStatus
 from models.pet_help_request import PetHelpRequest
 from models.user import User
+from repositories.base import count_subquery
 from schemas.category import Category as CategorySchema
 from schemas.city import City as CitySchema
 from schemas.common import ApiResponse
+from utils.etag import etag_response
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# The landing page polls the stats; a minute of staleness is acceptable
+PUBLIC_STATS_CACHE_TTL = 60
+
+# Lookup lists are read as plain rows of just the columns their schemas expose
+_CATEGORY_COLUMNS = [getattr(Category, field) for field in CategorySchema.model_fields]
+_CITY_COLUMNS = [getattr(City, field) for field in CitySchema.model_fields]
+
 
 # ==================== Statistics Endpoint ====================
 
@@ -29,49 +39,37 @@ router = APIRouter()
     summary="Get public statistics",
     description="Get public statistics about the platform"
 )
+@cached(ttl_seconds=PUBLIC_STATS_CACHE_TTL, key_prefix="public", key_builder=lambda *args, **kwargs: "stats")
 async def get_public_stats(
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_readonly)
 ):
     """Get public statistics."""
     logger.info("Fetching public statistics")
     
-    # Get counts
-    total_pets = await db.scalar(
-        select(func.count()).select_from(Pet).where(Pet.deleted_at.is_(None))
-    )
-    available_pets = await db.scalar(
-        select(func.count()).select_from(Pet).where(
-            Pet.deleted_at.is_(None),
-            Pet.status == PetStatus.AVAILABLE
-        )
-    )
-    adopted_pets = await db.scalar(
-        select(func.count()).select_from(Pet).where(
-            Pet.deleted_at.is_(None),
-            Pet.status == PetStatus.ADOPTED
+    # One round-trip; each count is its own subquery so it can use a partial index
+    result = await db.execute(
+        select(
+            count_subquery(Pet, Pet.deleted_at.is_(None)).label("pets_total"),
+            count_subquery(Pet, Pet.status == PetStatus.AVAILABLE.value, Pet.deleted_at.is_(None)).label("pets_available"),
+            count_subquery(Pet, Pet.status == PetStatus.ADOPTED.value, Pet.deleted_at.is_(None)).label("pets_adopted"),
+            count_subquery(PetHelpRequest).label("help_requests"),
+            count_subquery(Category).label("categories"),
+            count_subquery(City).label("cities"),
         )
     )
-    help_requests = await db.scalar(
-        select(func.count()).select_from(PetHelpRequest)
-    )
-    categories = await db.scalar(
-        select(func.count()).select_from(Category)
-    )
-    cities = await db.scalar(
-        select(func.count()).select_from(City)
-    )
+    counts = result.one()
     
     return ApiResponse(
         success=True,
         data={
             "pets": {
-                "total": total_pets,
-                "available": available_pets,
-                "adopted": adopted_pets
+                "total": counts.pets_total,
+                "available": counts.pets_available,
+                "adopted": counts.pets_adopted
             },
-            "help_requests": help_requests,
-            "categories": categories,
-            "cities": cities
+            "help_requests": counts.help_requests,
+            "categories": counts.categories,
+            "cities": counts.cities
         },
         message="Public statistics retrieved"
     )
@@ -82,24 +80,30 @@ async def get_public_stats(
 
 @router.get(
     "/categories",
-    response_model=ApiResponse[List[CategorySchema]],
+    response_model=None,
+    responses={200: {"model": ApiResponse[List[CategorySchema]]}, 304: {"description": "Not modified"}},
     summary="Get all categories",
     description="Retrieve all pet categories"
 )
 async def get_all_categories(
+    request: Request,
     db: AsyncSession = Depends(get_db)
 ):
     """Get all categories (public endpoint)."""
     logger.info("Fetching all categories")
     
-    result = await db.execute(select(Category))
-    categories = result.scalars().all()
+    # Shared with the admin listing, which clears it on every category write
+    categories = await get_from_cache("categories:all")
+    if categories is None:
+        result = await db.execute(select(*_CATEGORY_COLUMNS))
+        categories = [dict(row) for row in result.mappings()]
+        await set_to_cache("categories:all", categories, LOOKUP_CACHE_TTL)
     
-    return ApiResponse(
+    return etag_response(request, ApiResponse.model_construct(
         success=True,
-        data=list(categories),
+        data=categories,
         message=f"Retrieved {len(categories)} categories"
-    )
+    ).model_dump())
 
 
 @router.get(
@@ -137,24 +141,30 @@ async def get_category_by_id(
 
 @router.get(
     "/cities",
-    response_model=ApiResponse[List[CitySchema]],
+    response_model=None,
+    responses={200: {"model": ApiResponse[List[CitySchema]]}, 304: {"description": "Not modified"}},
     summary="Get all cities",
     description="Retrieve all cities"
 )
 async def get_all_cities(
+    request: Request,
     db: AsyncSession = Depends(get_db)
 ):
     """Get all cities (public endpoint)."""
     logger.info("Fetching all cities")
     
-    result = await db.execute(select(City))
-    cities = result.scalars().all()
+    # Shared with the admin listing, which clears it on every city write
+    cities = await get_from_cache("cities:all")
+    if cities is None:
+        result = await db.execute(select(*_CITY_COLUMNS))
+        cities = [dict(row) for row in result.mappings()]
+        await set_to_cache("cities:all", cities, LOOKUP_CACHE_TTL)
     
-    return ApiResponse(
+    return etag_response(request, ApiResponse.model_construct(
         success=True,
-        data=list(cities),
+        data=cities,
         message=f"Retrieved {len(cities)} cities"
-    )
+    ).model_dump())
 
 
 @router.get(
@@ -9,10 +9,13 @@ from models.user import User
 from schemas.common import ApiResponse
 from schemas.report import Report, ReportCreate
 from services.report_service import ReportService
+from utils.responses import fast_response, items_serializer
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+_report_items = items_serializer(Report)
+
 
 @router.post(
     "/",
@@ -46,7 +49,8 @@ async def create_report(
 
 @router.get(
     "/",
-    response_model=ApiResponse[List[Report]],
+    response_model=None,
+    responses={200: {"model": ApiResponse[List[Report]]}},
     summary="Get all reports (Admin only)",
     description="Get all reports for moderation"
 )
@@ -61,16 +65,13 @@ async def get_all_reports(
     
     reports = await report_service.get_all_reports(skip, limit)
     
-    return ApiResponse(
-        success=True,
-        data=reports,
-        message=f"Retrieved {len(reports)} reports"
-    )
+    return fast_response(_report_items(reports), f"Retrieved {len(reports)} reports")
 
 
 @router.get(
     "/{target_type}/{target_id}",
-    response_model=ApiResponse[List[Report]],
+    response_model=None,
+    responses={200: {"model": ApiResponse[List[Report]]}},
     summary="Get reports for target (Admin only)",
     description="Get all reports for a specific target"
 )
@@ -91,8 +92,7 @@ async def get_reports_by_target(
     
     reports = await report_service.get_reports_by_target(target_type, target_id)
     
-    return ApiResponse(
-        success=True,
-        data=reports,
-        message=f"Retrieved {len(reports)} reports for {target_type} {target_id}"
+    return fast_response(
+        _report_items(reports),
+        f"Retrieved {len(reports)} reports for {target_type} {target_id}"
     )
@@ -5,7 +5,7 @@ from typing import List
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 
 from core.config import settings
-from core.storage import get_storage_service
+from core.storage import get_storage_service, upload_each
 from dependencies import get_current_user
 from models.user import User
 from schemas.common import ApiResponse
@@ -15,17 +15,16 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 # Allowed image types
-# Allowed image types
-ALLOWED_IMAGE_TYPES = {
+ALLOWED_IMAGE_TYPES = frozenset({
     "image/jpeg",
     "image/jpg",
     "image/png",
     "image/webp",
     "image/heic"
-}
+})
 
 # Allowed extensions
-ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".heic"}
+ALLOWED_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".webp", ".heic"})
 
 
 def validate_image(file: UploadFile) -> None:
@@ -38,28 +37,25 @@ def validate_image(file: UploadFile) -> None:
     Raises:
         HTTPException: If validation fails
     """
-    from pathlib import Path
-    
     # Check content type
     if file.content_type not in ALLOWED_IMAGE_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid file type. Allowed types: {', '.join(ALLOWED_IMAGE_TYPES)}"
+            detail=f"Invalid file type. Allowed types: {', '.join(sorted(ALLOWED_IMAGE_TYPES))}"
         )
     
     # Check file extension
     if file.filename:
-        ext = Path(file.filename).suffix.lower()
+        _, dot, suffix = file.filename.rpartition(".")
+        ext = f".{suffix.lower()}" if dot else ""
         if ext not in ALLOWED_EXTENSIONS:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid file extension. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
+                detail=f"Invalid file extension. Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
             )
     
-    # Check file size
-    file.file.seek(0, 2)
-    size = file.file.tell()
-    file.file.seek(0)
+    # The form parser counted the bytes while streaming the part to disk
+    size = file.size or 0
     
     if size > settings.MAX_UPLOAD_SIZE:
         max_mb = settings.MAX_UPLOAD_SIZE / (1024 * 1024)
@@ -96,11 +92,6 @@ async def _upload_single_file(
     """
     validate_image(file)
     
-    # Get file size before upload
-    file.file.seek(0, 2)
-    file_size = file.file.tell()
-    file.file.seek(0)
-    
     storage = get_storage_service()
     
     try:
@@ -115,7 +106,7 @@ async def _upload_single_file(
             url=url,
             filename=file.filename,
             content_type=file.content_type,
-            size=file_size
+            size=file.size
         )
         
     except Exception as e:
@@ -226,38 +217,19 @@ async def upload_multiple_photos(
     
     logger.info(f"User {current_user.email} uploading {len(files)} photos")
     
-    storage = get_storage_service()
-    uploaded_files = []
-    
+    # Reject the whole request before any upload starts
     for file in files:
-        try:
-            validate_image(file)
-            
-            # Get file size before upload
-            file.file.seek(0, 2)
-            file_size = file.file.tell()
-            file.file.seek(0)
-            
-            url = await storage.upload_file(
-                file=file.file,
-                filename=file.filename,
-                content_type=file.content_type,
-                folder=folder
-            )
-            
-            uploaded_files.append(FileUploadResponse(
-                url=url,
-                filename=file.filename,
-                content_type=file.content_type,
-                size=file_size
-            ))
-            
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(f"Upload failed for {file.filename}: {e}")
-            # Continue with other files
-            continue
+        validate_image(file)
+    
+    uploaded_files = [
+        FileUploadResponse(
+            url=url,
+            filename=file.filename,
+            content_type=file.content_type,
+            size=file.size
+        )
+        for file, url in await upload_each(files, folder)
+    ]
     
     return ApiResponse(
         success=True,
@@ -1,6 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from uuid import UUID
 from pydantic import BaseModel, Field
 
@@ -23,12 +22,11 @@ router = APIRouter()
 
 @router.get("/me", response_model=ApiResponse[User])
 async def get_current_user(
-    current_user_id: str = Depends(get_current_user_id),
+    current_user_id: UUID = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db)
 ):
     """Get current user profile."""
-    result = await db.execute(select(UserModel).where(UserModel.id == UUID(current_user_id)))
-    user = result.scalar_one_or_none()
+    user = await db.get(UserModel, current_user_id)
     
     if not user:
         raise HTTPException(
@@ -46,12 +44,11 @@ async def get_current_user(
 @router.patch("/me", response_model=ApiResponse[User])
 async def update_current_user(
     user_update: UserUpdate,
-    current_user_id: str = Depends(get_current_user_id),
+    current_user_id: UUID = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db)
 ):
     """Update current user profile."""
-    result = await db.execute(select(UserModel).where(UserModel.id == UUID(current_user_id)))
-    user = result.scalar_one_or_none()
+    user = await db.get(UserModel, current_user_id)
     
     if not user:
         raise HTTPException(
@@ -63,8 +60,8 @@ async def update_current_user(
     update_data = user_update.model_dump(exclude_unset=True)
     
     if "password" in update_data:
-        from core.security import get_password_hash
-        update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
+        from core.security import hash_password
+        update_data["hashed_password"] = await hash_password(update_data.pop("password"))
     
     for field, value in update_data.items():
         setattr(user, field, value)
@@ -82,12 +79,12 @@ async def update_current_user(
 @router.post("/me/change-password", response_model=ApiResponse[dict])
 async def change_password(
     password_data: ChangePasswordRequest,
-    current_user_id: str = Depends(get_current_user_id),
+    current_user_id: UUID = Depends(get_current_user_id),
     user_service: UserService = Depends(get_user_service)
 ):
     """Change current user's password."""
     success = await user_service.change_password(
-        user_id=UUID(current_user_id),
+        user_id=current_user_id,
         old_password=password_data.old_password,
         new_password=password_data.new_password
     )
@@ -109,11 +106,10 @@ async def change_password(
 async def get_user(
     user_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user_id: str = Depends(get_current_user_id)
+    current_user_id: UUID = Depends(get_current_user_id)
 ):
     """Get user by ID."""
-    result = await db.execute(select(UserModel).where(UserModel.id == user_id))
-    user = result.scalar_one_or_none()
+    user = await db.get(UserModel, user_id)
     
     if not user:
         raise HTTPException(
@@ -1,4 +1,4 @@
-"""Caching utilities (using in-memory cache for now)."""
+"""Caching utilities backed by Redis, with an in-memory fallback."""
 
 from typing import Optional, Any, Callable
 from functools import wraps
@@ -6,41 +6,158 @@ import asyncio
 from datetime import datetime, timedelta
 import logging
 
+import orjson
+from fastapi.encoders import jsonable_encoder
+from redis.exceptions import RedisError
+
+from core import token_blacklist
+from core.config import settings
+
 logger = logging.getLogger(__name__)
 
-# Simple in-memory cache
+CACHE_PREFIX = "cache"
+
+# Categories and cities change rarely, and every write clears their namespace
+LOOKUP_CACHE_TTL = 300
+
+# In-memory fallback used when Redis is not connected
 _cache = {}
 _cache_ttl = {}
 
 
-def clear_cache():
-    """Clear all cache entries."""
-    global _cache, _cache_ttl
-    _cache.clear()
-    _cache_ttl.clear()
-    logger.info("Cache cleared")
+def _redis():
+    """Get the shared Redis client, or None when Redis is unavailable."""
+    return token_blacklist.redis_client
+
+
+def _namespace(key: str) -> str:
+    """Get the namespace of a cache key (the part before the first colon)."""
+    return key.split(":", 1)[0]
+
+
+def _index_key(namespace: str) -> str:
+    """Get the Redis set that tracks the keys of a namespace."""
+    return f"{CACHE_PREFIX}:{namespace}:__keys__"
+
+
+# Deletes every key tracked by a namespace, and the index set itself, atomically
+CLEAR_NAMESPACE_LUA = """
+local keys = redis.call('SMEMBERS', KEYS[1])
+for i = 1, #keys, 500 do
+    redis.call('DEL', unpack(keys, i, math.min(i + 499, #keys)))
+end
+redis.call('DEL', KEYS[1])
+return #keys
+"""
+_clear_namespace_script = None
+
+
+def _clear_namespace(client, namespace: str) -> None:
+    """Run the namespace delete script, registering it once per client."""
+    global _clear_namespace_script
+    if _clear_namespace_script is None or _clear_namespace_script.registered_client is not client:
+        _clear_namespace_script = client.register_script(CLEAR_NAMESPACE_LUA)
+    _clear_namespace_script(keys=[_index_key(namespace)])
 
 
-def get_from_cache(key: str) -> Optional[Any]:
+def _clear_all(client) -> None:
+    """Delete every cache key, in batches of SCAN results."""
+    batch = []
+    for key in client.scan_iter(match=f"{CACHE_PREFIX}:*", count=500):
+        batch.append(key)
+        if len(batch) >= 500:
+            client.delete(*batch)
+            batch = []
+    if batch:
+        client.delete(*batch)
+
+
+def _write(client, key: str, payload: bytes, ttl_seconds: int) -> None:
+    """Store a value and track it in its namespace, in one round-trip."""
+    index_key = _index_key(_namespace(key))
+    pipe = client.pipeline(transaction=False)
+    pipe.setex(f"{CACHE_PREFIX}:{key}", ttl_seconds, payload)
+    pipe.sadd(index_key, f"{CACHE_PREFIX}:{key}")
+    pipe.expire(index_key, max(ttl_seconds, settings.CACHE_TTL))
+    pipe.execute()
+
+
+# The Redis client is synchronous, so every call runs in a worker thread
+# instead of stalling the event loop.
+
+async def clear_cache(namespace: Optional[str] = None):
+    """Clear all cache entries, or only those of one namespace."""
+    client = _redis()
+    if client is not None:
+        try:
+            if namespace is None:
+                await asyncio.to_thread(_clear_all, client)
+            else:
+                await asyncio.to_thread(_clear_namespace, client, namespace)
+        except RedisError as e:
+            logger.error("Failed to clear cache namespace %s: %s", namespace or "all", e)
+
+    for key in [k for k in _cache if namespace is None or _namespace(k) == namespace]:
+        _cache.pop(key, None)
+        _cache_ttl.pop(key, None)
+
+    logger.info("Cache cleared (%s)", namespace or "all")
+
+
+async def get_from_cache(key: str) -> Optional[Any]:
     """Get value from cache if not expired."""
+    if not settings.CACHE_ENABLED:
+        return None
+
+    client = _redis()
+    if client is not None:
+        try:
+            raw = await asyncio.to_thread(client.get, f"{CACHE_PREFIX}:{key}")
+        except RedisError as e:
+            logger.error("Failed to read cache key %s: %s", key, e)
+            return None
+        if raw is None:
+            return None
+        logger.debug("Cache hit: %s", key)
+        return orjson.loads(raw)
+
     if key not in _cache:
         return None
-    
+
     # Check if expired
     if key in _cache_ttl and datetime.now() > _cache_ttl[key]:
         del _cache[key]
         del _cache_ttl[key]
         return None
-    
-    logger.debug(f"Cache hit: {key}")
+
+    logger.debug("Cache hit: %s", key)
     return _cache[key]
 
 
-def set_to_cache(key: str, value: Any, ttl_seconds: int = 300):
-    """Set value to cache with TTL."""
+async def set_to_cache(key: str, value: Any, ttl_seconds: Optional[int] = None):
+    """
+    Set value to cache with TTL.
+
+    The value is stored in its JSON-compatible form, so a cache hit returns
+    plain dicts and lists rather than the original objects.
+    """
+    if not settings.CACHE_ENABLED:
+        return
+
+    ttl_seconds = ttl_seconds or settings.CACHE_TTL
+    value = jsonable_encoder(value)
+
+    client = _redis()
+    if client is not None:
+        try:
+            await asyncio.to_thread(_write, client, key, orjson.dumps(value), ttl_seconds)
+        except RedisError as e:
+            logger.error("Failed to write cache key %s: %s", key, e)
+        return
+
     _cache[key] = value
     _cache_ttl[key] = datetime.now() + timedelta(seconds=ttl_seconds)
-    logger.debug(f"Cache set: {key} (TTL: {ttl_seconds}s)")
+    logger.debug("Cache set: %s (TTL: %ss)", key, ttl_seconds)
 
 
 def cache_key(*args, **kwargs) -> str:
@@ -50,58 +167,45 @@ def cache_key(*args, **kwargs) -> str:
     return ":".join(key_parts)
 
 
-def cached(ttl_seconds: int = 300, key_prefix: str = ""):
-    """Decorator to cache function results."""
-    
+def cached(
+    ttl_seconds: Optional[int] = None,
+    key_prefix: str = "",
+    key_builder: Optional[Callable[..., str]] = None
+):
+    """
+    Decorator to cache the results of a coroutine function.
+
+    Args:
+        ttl_seconds: Time to live, defaults to settings.CACHE_TTL.
+        key_prefix: Namespace of the cached entries.
+        key_builder: Builds the key from the call arguments. Use it for
+            endpoints, whose arguments include per-request dependencies
+            such as the database session or the current user.
+    """
+
     def decorator(func: Callable):
+        def build_key(*args, **kwargs) -> str:
+            if key_builder is not None:
+                return f"{key_prefix}:{key_builder(*args, **kwargs)}"
+            return f"{key_prefix}:{func.__name__}:{cache_key(*args, **kwargs)}"
+
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
-            # Generate cache key
-            key = f"{key_prefix}:{func.__name__}:{cache_key(*args, **kwargs)}"
-            
+            key = build_key(*args, **kwargs)
+
             # Check cache
-            cached_value = get_from_cache(key)
+            cached_value = await get_from_cache(key)
             if cached_value is not None:
                 return cached_value
-            
+
             # Call function
             result = await func(*args, **kwargs)
-            
-            # Store in cache
-            set_to_cache(key, result, ttl_seconds)
-            
-            return result
-        
-        @wraps(func)
-        def sync_wrapper(*args, **kwargs):
-            # Generate cache key
-            key = f"{key_prefix}:{func.__name__}:{cache_key(*args, **kwargs)}"
-            
-            # Check cache
-            cached_value = get_from_cache(key)
-            if cached_value is not None:
-                return cached_value
-            
-            # Call function
-            result = func(*args, **kwargs)
-            
+
             # Store in cache
-            set_to_cache(key, result, ttl_seconds)
-            
+            await set_to_cache(key, result, ttl_seconds)
+
             return result
-        
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
-        return sync_wrapper
-    
-    return decorator
 
+        return async_wrapper
 
-# For production, consider using Redis:
-# from redis import asyncio as aioredis
-# from fastapi_cache import FastAPICache
-# from fastapi_cache.backends.redis import RedisBackend
-# 
-# async def init_cache():
-#     redis = aioredis.from_url("redis://localhost")
-#     FastAPICache.init(RedisBackend(redis), prefix="petjo:")
+    return decorator
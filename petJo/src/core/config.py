@@ -16,6 +16,11 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: Optional[str] = None
     POSTGRES_HOST: Optional[str] = None
     POSTGRES_PORT: Optional[int] = None
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_ECHO: bool = False  # Log every SQL statement
+    DB_BEHIND_PGBOUNCER: bool = False  # Let PgBouncer (transaction pooling) own the pool
     
     # Redis
     REDIS_URL: Optional[str] = None
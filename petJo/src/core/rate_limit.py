@@ -1,9 +1,24 @@
 """Rate limiting configuration and utilities."""
+from contextvars import ContextVar
+
+from fastapi import HTTPException, Request, status
+from limits import parse
+from limits.storage import MemoryStorage
+from limits.strategies import FixedWindowRateLimiter
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
-# Create limiter instance
-limiter = Limiter(key_func=get_remote_address)
+from core.config import settings
+
+# Create limiter instance. With Redis configured the counters are shared by all
+# workers; the fixed-window strategy increments and sets the expiry in a single
+# atomic call, one round-trip per check.
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=settings.REDIS_URL or "memory://",
+    strategy="fixed-window",
+    in_memory_fallback_enabled=True,
+)
 
 # Rate limit configurations
 RATE_LIMITS = {
@@ -13,3 +28,28 @@ RATE_LIMITS = {
     "search": "30/minute",  # Search endpoints
     "public": "200/minute",  # Public endpoints (higher limit)
 }
+
+# Requests answered from the cache are counted by this process only, which
+# spares them the Redis round-trip of the shared limiter
+_local_limiter = FixedWindowRateLimiter(MemoryStorage())
+_served_from_cache: ContextVar[bool] = ContextVar("served_from_cache", default=False)
+
+
+def served_from_cache() -> bool:
+    """Exemption hook for limiter.limit, true once count_cache_hit has run for the request."""
+    return _served_from_cache.get()
+
+
+def count_cache_hit(request: Request, limit_value: str) -> None:
+    """
+    Count a cache hit against an in-process limit instead of the shared one.
+    
+    Call it from an async dependency of an endpoint decorated with
+    limiter.limit(..., exempt_when=served_from_cache).
+    """
+    if not _local_limiter.hit(parse(limit_value), request.url.path, get_remote_address(request)):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Rate limit exceeded: {limit_value}"
+        )
+    _served_from_cache.set(True)
@@ -1,7 +1,15 @@
 """Security utilities for authentication and password management."""
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
+from uuid import UUID
 
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
@@ -10,12 +18,30 @@ from passlib.context import CryptContext
 from core.config import settings
 from core.token_blacklist import is_token_blacklisted
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context. New hashes are Argon2id; bcrypt hashes still verify
+# and are replaced on the next successful login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=3,
+    argon2__memory_cost=64 * 1024,
+    argon2__parallelism=2,
+)
+
+# Hashing is CPU-bound, so it runs in worker processes started by the app
+# lifespan. Each uvicorn worker gets its own pool, so it takes half the cores;
+# every Argon2 hash already uses two threads and 64 MiB.
+_hash_pool: Optional[ProcessPoolExecutor] = None
 
 # HTTP Bearer token security
 security = HTTPBearer()
 
+# Verified token payloads, so a token sent repeatedly is only checked once a minute.
+# Revocation is unaffected: the blacklist is checked before decoding.
+_decoded_tokens: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_decoded_tokens_lock = threading.Lock()
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password."""
@@ -24,23 +50,76 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     """
-    Hash a password using bcrypt.
+    Hash a password using Argon2id.
     
     Args:
         password: Plain text password to hash.
         
     Returns:
-        Hashed password string.
-        
-    Note:
-        Bcrypt has a 72-byte limit. Password will be truncated if necessary.
+        Hashed password string, prefixed with $argon2id$.
     """
-    # Bcrypt has a 72-byte limit, truncate if necessary
-    if len(password.encode('utf-8')) > 72:
-        password = password.encode('utf-8')[:72].decode('utf-8', errors='ignore')
     return pwd_context.hash(password)
 
 
+def _legacy_bcrypt_password(password: str) -> str:
+    """
+    Get the form of a password that bcrypt hashes were made from.
+    
+    Passwords were cut to 72 bytes and decoded with errors="ignore", which
+    also dropped a multi-byte character split at the cut.
+    """
+    encoded = password.encode('utf-8')
+    if len(encoded) > 72:
+        return encoded[:72].decode('utf-8', errors='ignore')
+    return password
+
+
+def _verify_and_update(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Module-level wrapper so the pool can pickle the call."""
+    if pwd_context.identify(hashed_password) == "bcrypt":
+        # Verify the truncated form, but upgrade to a hash of the full password
+        if not pwd_context.verify(_legacy_bcrypt_password(plain_password), hashed_password):
+            return False, None
+        return True, pwd_context.hash(plain_password)
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+async def hash_password(password: str) -> str:
+    """Hash a password in the process pool (a worker thread when it is not started)."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_pool, get_password_hash, password)
+
+
+async def check_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password in the process pool (a worker thread when it is not started).
+    
+    Returns:
+        Whether the password matches, and a replacement hash when the stored
+        one uses a deprecated scheme or parameters.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_pool, _verify_and_update, plain_password, hashed_password)
+
+
+def start_hash_pool() -> None:
+    """Start the password hashing workers."""
+    global _hash_pool
+    # Spawned, not forked: the parent already runs threads (executor, Redis)
+    _hash_pool = ProcessPoolExecutor(
+        max_workers=max(1, (os.cpu_count() or 1) // 2),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def shutdown_hash_pool() -> None:
+    """Stop the password hashing workers."""
+    global _hash_pool
+    if _hash_pool is not None:
+        _hash_pool.shutdown(wait=False, cancel_futures=True)
+        _hash_pool = None
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -65,8 +144,16 @@ def create_refresh_token(data: dict) -> str:
 
 def decode_token(token: str) -> dict:
     """Decode and verify a JWT token."""
+    with _decoded_tokens_lock:
+        payload = _decoded_tokens.get(token)
+    # A cached payload must not outlive the token itself
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+    
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        with _decoded_tokens_lock:
+            _decoded_tokens[token] = payload
         return payload
     except JWTError:
         raise HTTPException(
@@ -78,8 +165,8 @@ def decode_token(token: str) -> dict:
 
 async def get_current_user_id(
     credentials: HTTPAuthorizationCredentials = Depends(security)
-) -> str:
-    """Get the current user ID from the JWT token."""
+) -> UUID:
+    """Get the current user ID from the JWT token, parsed once for the whole request."""
     token = credentials.credentials
     
     # Check if token is blacklisted
@@ -92,11 +179,10 @@ async def get_current_user_id(
     
     payload = decode_token(token)
     
-    user_id: str = payload.get("sub")
-    if user_id is None:
+    try:
+        return UUID(payload["sub"])
+    except (KeyError, TypeError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
         )
-    
-    return user_id
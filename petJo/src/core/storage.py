@@ -1,17 +1,42 @@
 """Storage service for file uploads - Cloudflare R2 implementation."""
+import asyncio
 import logging
+import shutil
 import uuid
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
-from typing import BinaryIO
+from typing import BinaryIO, List, Optional, Tuple
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from fastapi import UploadFile
 
 from core.config import settings
+from exceptions import ValidationException
 
 logger = logging.getLogger(__name__)
 
+# Photos of one request are uploaded concurrently, at most this many at a time
+MAX_CONCURRENT_UPLOADS = 5
+
+# Photos attached to listings are checked against these before any upload starts
+ALLOWED_PHOTO_TYPES = frozenset({"image/jpeg", "image/png", "image/webp"})
+
+# HTTP connections the shared R2 client keeps open; botocore defaults to 10,
+# fewer than the worker threads that may upload at once
+R2_MAX_POOL_CONNECTIONS = 50
+
+# Uploads are streamed in 8 MB parts, so memory per upload stays bounded by one part.
+# The transfer runs in a worker thread already, so it needs no thread pool of its own.
+UPLOAD_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    use_threads=False,
+)
+
 
 class StorageService(ABC):
     """Abstract storage service interface."""
@@ -43,7 +68,8 @@ class CloudflareR2Storage(StorageService):
             endpoint_url=settings.R2_ENDPOINT_URL,
             aws_access_key_id=settings.R2_ACCESS_KEY_ID,
             aws_secret_access_key=settings.R2_SECRET_ACCESS_KEY,
-            region_name='auto'
+            region_name='auto',
+            config=Config(max_pool_connections=R2_MAX_POOL_CONNECTIONS)
         )
         self.bucket = settings.R2_BUCKET_NAME
         self.public_url = settings.R2_PUBLIC_URL
@@ -81,15 +107,17 @@ class CloudflareR2Storage(StorageService):
             # Generate unique filename
             object_key = self._generate_unique_filename(filename, folder)
             
-            # Upload to R2
-            self.client.upload_fileobj(
+            # Upload to R2 off the event loop; boto3 is blocking
+            await asyncio.to_thread(
+                self.client.upload_fileobj,
                 file,
                 self.bucket,
                 object_key,
                 ExtraArgs={
                     'ContentType': content_type,
                     'CacheControl': 'public, max-age=31536000',  # 1 year cache
-                }
+                },
+                Config=UPLOAD_TRANSFER_CONFIG
             )
             
             # Generate public URL
@@ -117,7 +145,8 @@ class CloudflareR2Storage(StorageService):
             object_key = file_url.replace(f"{self.public_url}/", "")
             
             # Delete from R2
-            self.client.delete_object(
+            await asyncio.to_thread(
+                self.client.delete_object,
                 Bucket=self.bucket,
                 Key=object_key
             )
@@ -172,7 +201,7 @@ class LocalStorage(StorageService):
             # Save file
             with open(file_path, "wb") as f:
                 file.seek(0)
-                f.write(file.read())
+                shutil.copyfileobj(file, f)
             
             # Generate public URL
             public_url = f"{self.base_url}/{relative_path}"
@@ -205,10 +234,14 @@ class LocalStorage(StorageService):
 
 
 # Factory function to get storage service
+@lru_cache(maxsize=1)
 def get_storage_service() -> StorageService:
     """
     Get storage service based on configuration.
     
+    Built once per process, so the R2 client and its connection pool are
+    shared by all requests.
+    
     Returns:
         StorageService instance (R2 or Local)
     """
@@ -218,3 +251,61 @@ def get_storage_service() -> StorageService:
         return LocalStorage()
     else:
         raise ValueError(f"Unknown storage provider: {settings.STORAGE_PROVIDER}")
+
+
+def accepted_photos(photos: Optional[List[UploadFile]], limit: int) -> List[UploadFile]:
+    """
+    Keep the first ``limit`` photos that are images within MAX_UPLOAD_SIZE.
+    
+    Uses the type and size the form parser already recorded, so rejected
+    files never reach storage. Empty parts are ignored; if photos were sent
+    but none is acceptable the request is rejected.
+    """
+    sent = [photo for photo in (photos or [])[:limit] if photo.filename and photo.size]
+    accepted = [
+        photo for photo in sent
+        if photo.content_type in ALLOWED_PHOTO_TYPES and photo.size <= settings.MAX_UPLOAD_SIZE
+    ]
+    if sent and not accepted:
+        max_mb = settings.MAX_UPLOAD_SIZE / (1024 * 1024)
+        raise ValidationException(
+            f"Photos must be JPEG, PNG or WebP images of at most {max_mb:g}MB"
+        )
+    return accepted
+
+
+async def upload_each(photos: List[UploadFile], folder: str) -> List[Tuple[UploadFile, str]]:
+    """
+    Upload photos concurrently, pairing each one that succeeded with its URL.
+    
+    Each file is streamed from the handle the form parser left rewound, so
+    nothing is read into memory first. Failures are logged and skipped, and
+    the pairs keep the order of the photos.
+    """
+    storage = get_storage_service()
+    upload_slots = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
+    
+    async def upload(photo: UploadFile) -> str:
+        async with upload_slots:
+            return await storage.upload_file(
+                file=photo.file,
+                filename=photo.filename,
+                content_type=photo.content_type,
+                folder=folder
+            )
+    
+    results = await asyncio.gather(*(upload(p) for p in photos), return_exceptions=True)
+    uploaded = []
+    for photo, result in zip(photos, results):
+        if isinstance(result, Exception):
+            logger.error("Failed to upload photo %s: %s", photo.filename, result)
+        else:
+            logger.info("Uploaded photo to %s: %s", folder, result)
+            uploaded.append((photo, result))
+    
+    return uploaded
+
+
+async def upload_photos(photos: List[UploadFile], folder: str) -> List[str]:
+    """Upload photos concurrently, returning the URLs of those that succeeded, in order."""
+    return [url for _, url in await upload_each(photos, folder)]
@@ -1,4 +1,5 @@
 """Token blacklist management using Redis."""
+import hashlib
 import logging
 from datetime import datetime, timedelta
 from typing import Optional
@@ -13,10 +14,27 @@ logger = logging.getLogger(__name__)
 # Redis client for token blacklist
 redis_client: Optional[Redis] = None
 
+# Blacklists a refresh token unless it already is, and tracks it for the user,
+# in one atomic step. Returns 1 when the token was consumed, 0 when it was reused.
+CONSUME_REFRESH_TOKEN_LUA = """
+if not redis.call('SET', KEYS[1], '1', 'NX', 'EX', ARGV[1]) then
+    return 0
+end
+redis.call('SADD', KEYS[2], ARGV[2])
+redis.call('EXPIRE', KEYS[2], ARGV[1])
+return 1
+"""
+_consume_refresh_script = None
+
+
+def _token_digest(token: str) -> str:
+    """Key tokens by their SHA-256 digest instead of the full JWT."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
 
 def init_redis():
     """Initialize Redis connection for token blacklist."""
-    global redis_client
+    global redis_client, _consume_refresh_script
     try:
         redis_client = Redis(
             host=settings.REDIS_HOST,
@@ -29,6 +47,7 @@ def init_redis():
         )
         # Test connection
         redis_client.ping()
+        _consume_refresh_script = redis_client.register_script(CONSUME_REFRESH_TOKEN_LUA)
         logger.info("Redis connected successfully for token blacklist")
     except RedisError as e:
         logger.warning(f"Redis connection failed: {e}. Token blacklist will be disabled.")
@@ -50,7 +69,7 @@ async def blacklist_token(token: str, expires_in_seconds: int):
     try:
         # Store token with expiration
         redis_client.setex(
-            f"blacklist:{token}",
+            f"blacklist:{_token_digest(token)}",
             expires_in_seconds,
             "1"
         )
@@ -74,7 +93,7 @@ async def is_token_blacklisted(token: str) -> bool:
         return False
     
     try:
-        result = redis_client.exists(f"blacklist:{token}")
+        result = redis_client.exists(f"blacklist:{_token_digest(token)}")
         return bool(result)
     except RedisError as e:
         logger.error(f"Failed to check token blacklist: {e}")
@@ -97,12 +116,43 @@ async def blacklist_refresh_token(user_id: str, token: str):
     # Also store by user_id for invalidating all user's refresh tokens
     if redis_client is not None:
         try:
-            redis_client.sadd(f"user_tokens:{user_id}", token)
+            redis_client.sadd(f"user_tokens:{user_id}", _token_digest(token))
             redis_client.expire(f"user_tokens:{user_id}", expires_in)
         except RedisError as e:
             logger.error(f"Failed to track user token: {e}")
 
 
+async def consume_refresh_token(user_id: str, token: str) -> bool:
+    """
+    Blacklist a refresh token as it is exchanged, rejecting reuse.
+    
+    The check and the blacklisting happen in a single Lua script, so two
+    concurrent refreshes with the same token cannot both succeed.
+    
+    Args:
+        user_id: The user ID
+        token: The refresh token being exchanged
+        
+    Returns:
+        False if the token was already used or revoked, True otherwise
+    """
+    if redis_client is None or _consume_refresh_script is None:
+        # If Redis is not available, don't block users
+        return True
+    
+    expires_in = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+    digest = _token_digest(token)
+    try:
+        consumed = _consume_refresh_script(
+            keys=[f"blacklist:{digest}", f"user_tokens:{user_id}"],
+            args=[expires_in, digest]
+        )
+        return bool(consumed)
+    except RedisError as e:
+        logger.error("Failed to consume refresh token: %s", e)
+        return True
+
+
 async def invalidate_all_user_tokens(user_id: str):
     """
     Invalidate all tokens for a user (e.g., on password change).
@@ -114,24 +164,27 @@ async def invalidate_all_user_tokens(user_id: str):
         return
     
     try:
-        # Get all tokens for this user
-        tokens = redis_client.smembers(f"user_tokens:{user_id}")
+        # Get the digests of all tokens for this user
+        digests = redis_client.smembers(f"user_tokens:{user_id}")
         
         # Blacklist each token
-        for token in tokens:
-            await blacklist_token(token, settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60)
+        expires_in = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+        pipe = redis_client.pipeline(transaction=False)
+        for digest in digests:
+            pipe.setex(f"blacklist:{digest}", expires_in, "1")
         
         # Clear the user's token set
-        redis_client.delete(f"user_tokens:{user_id}")
+        pipe.delete(f"user_tokens:{user_id}")
+        pipe.execute()
         
-        logger.info(f"Invalidated {len(tokens)} tokens for user {user_id}")
+        logger.info(f"Invalidated {len(digests)} tokens for user {user_id}")
     except RedisError as e:
         logger.error(f"Failed to invalidate user tokens: {e}")
 
 
 def close_redis():
     """Close Redis connection."""
-    global redis_client
+    global redis_client, _consume_refresh_script
     if redis_client is not None:
         try:
             redis_client.close()
@@ -139,3 +192,4 @@ def close_redis():
         except RedisError as e:
             logger.error(f"Error closing Redis connection: {e}")
         redis_client = None
+        _consume_refresh_script = None
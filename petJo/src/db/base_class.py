@@ -1,3 +1,17 @@
+from sqlalchemy import DDL, event
 from sqlalchemy.orm import declarative_base
 
-Base = declarative_base()
+
+class ModelDefaults:
+    """Mapper settings shared by every model."""
+    
+    # Server-generated columns (ids, created_at, ...) come back through RETURNING
+    # on the INSERT itself, so a new object needs no refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
+
+Base = declarative_base(cls=ModelDefaults)
+
+# The trigram search indexes use gin_trgm_ops, so metadata.create_all (dev startup)
+# needs the extension in place first; migrations create it themselves
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
@@ -1,15 +1,38 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 
 from core.config import settings
 
 
+def _engine_options() -> dict:
+    """Pool settings for the engine, or none when PgBouncer does the pooling."""
+    if settings.DB_BEHIND_PGBOUNCER:
+        # Transaction pooling hands each transaction a different server
+        # connection, so prepared statements cannot be cached across them
+        return {
+            "poolclass": NullPool,
+            "connect_args": {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "server_settings": {"application_name": settings.PROJECT_NAME},
+            },
+        }
+    return {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=True,
+    echo=settings.DB_ECHO,
     future=True,
-    pool_pre_ping=True,
+    **_engine_options(),
 )
 
 # Create session factory
@@ -22,10 +45,47 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+def pool_stats() -> dict:
+    """Usage of this worker's connection pool, for monitoring."""
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {"status": pool.status()}
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "status": pool.status(),
+    }
+
+
 async def get_db() -> AsyncSession:
-    """Dependency to get database session."""
+    """Dependency to get database session.
+
+    Pending work is committed when the request succeeds and rolled back if it
+    raises. FastAPI runs this teardown before the response is sent, so the
+    connection is back in the pool by the time the client sees the result.
+    """
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
+async def get_db_readonly() -> AsyncSession:
+    """Dependency to get a database session whose transaction is read-only.
+
+    This is a separate session from get_db's, so the transaction always begins
+    read-only even when another dependency (such as the current user lookup)
+    has already queried through the shared one.
+    """
     async with AsyncSessionLocal() as session:
+        # asyncpg issues this as BEGIN READ ONLY, so it costs no extra round-trip
+        await session.connection(execution_options={"postgresql_readonly": True})
         try:
             yield session
         finally:
-            await session.close()
+            await session.rollback()
@@ -148,12 +148,17 @@ def get_missing_animal_service(
 # ==================== User Authentication Dependencies ====================
 
 async def get_current_user(
-    current_user_id: str = Depends(get_current_user_id),
+    current_user_id: UUID = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db)
 ) -> User:
-    """Get the current authenticated user."""
+    """
+    Get the current authenticated user.
+    
+    get_db is cached per request, so this lookup and the endpoint's
+    repositories share one session and at most one pooled connection.
+    """
     result = await db.execute(
-        select(User).where(User.id == UUID(current_user_id))
+        select(User).where(User.id == current_user_id)
     )
     user = result.scalar_one_or_none()
     
@@ -174,7 +179,7 @@ async def get_current_active_user(
 
 
 async def get_optional_current_user(
-    current_user_id: Optional[str] = Depends(get_current_user_id),
+    current_user_id: Optional[UUID] = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db)
 ) -> Optional[User]:
     """Get current user if authenticated, None otherwise."""
@@ -183,7 +188,7 @@ async def get_optional_current_user(
     
     try:
         result = await db.execute(
-            select(User).where(User.id == UUID(current_user_id))
+            select(User).where(User.id == current_user_id)
         )
         return result.scalar_one_or_none()
     except Exception:
@@ -5,6 +5,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from sqlalchemy.exc import IntegrityError
@@ -13,9 +14,10 @@ from api.v1.api import api_router
 from core.config import settings
 from core.logging import setup_logging
 from core.rate_limit import limiter
+from core.security import shutdown_hash_pool, start_hash_pool
 from core.token_blacklist import close_redis, init_redis
 from db.base import Base
-from db.session import engine
+from db.session import engine, pool_stats
 from exceptions import PetJoException
 from middleware.csrf import CSRFMiddleware
 from middleware.error_handler import (
@@ -40,6 +42,7 @@ async def lifespan(app: FastAPI):
     
     # Initialize Redis for token blacklist
     init_redis()
+    start_hash_pool()
     
     async with engine.begin() as conn:
         # Create tables (in production, use Alembic migrations)
@@ -54,6 +57,7 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down PetJo API...")
     await engine.dispose()
     close_redis()
+    shutdown_hash_pool()
     logger.info("PetJo API shut down successfully")
 
 
@@ -64,6 +68,7 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url=f"{settings.API_V1_STR}/docs",
     redoc_url=f"{settings.API_V1_STR}/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -113,6 +118,12 @@ async def health_check():
     }
 
 
+@app.get("/health/pool", tags=["Health"])
+async def pool_health():
+    """Database connection pool usage of the worker serving the request."""
+    return pool_stats()
+
+
 # Request logging middleware
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, ForeignKey, DateTime, Text, Index
+from sqlalchemy import Column, BigInteger, ForeignKey, DateTime, Text, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -9,19 +9,24 @@ from db.base_class import Base
 class Advertisement(Base):
     __tablename__ = "advertisements"
     __table_args__ = (
-        Index('idx_advertisement_user', 'user_id'),
-        Index('idx_advertisement_status', 'status'),
-        Index('idx_advertisement_created', 'created_at'),
+        Index('idx_advertisement_user_created', 'user_id', text('created_at DESC'), text('id DESC')),
+        Index('idx_advertisement_status_pending', 'id', postgresql_where=text("status = 'pending'")),
+        Index('idx_advertisement_status_approved', 'id', postgresql_where=text("status = 'approved'")),
+        Index('idx_advertisement_status_rejected', 'id', postgresql_where=text("status = 'rejected'")),
+        Index('idx_advertisement_created_id', text('created_at DESC'), text('id DESC')),
+        Index('idx_advertisement_pending_created', text('created_at DESC'), text('id DESC'), postgresql_where=text("status = 'pending'")),
+        Index('idx_advertisement_title_trgm', 'title', postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}),
+        Index('idx_advertisement_description_trgm', 'description', postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'}),
     )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     title = Column(Text, nullable=False)
     description = Column(Text, nullable=False)
     contact_phone = Column(Text, nullable=True)
     status = Column(Text, nullable=False, default="pending", index=True)  # pending, approved, rejected
     admin_notes = Column(Text, nullable=True)  # Admin feedback
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     reviewed_at = Column(DateTime(timezone=True), nullable=True)
 
@@ -1,5 +1,5 @@
 """Pet breeding request model for finding mates."""
-from sqlalchemy import Column, BigInteger, ForeignKey, DateTime, Text, Boolean, Index, Integer
+from sqlalchemy import Column, BigInteger, ForeignKey, DateTime, Text, Boolean, Index, Integer, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -26,6 +26,10 @@ class BreedingRequest(Base):
         Index('idx_breeding_city', 'city_id'),
         Index('idx_breeding_category', 'category_id'),
         Index('idx_breeding_created', 'created_at'),
+        Index('idx_breeding_owner_created', 'owner_id', text('created_at DESC'), text('id DESC')),
+        Index('idx_breeding_title_trgm', 'title', postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}),
+        Index('idx_breeding_description_trgm', 'description', postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'}),
+        Index('idx_breeding_preferred_breed_trgm', 'preferred_breed', postgresql_using='gin', postgresql_ops={'preferred_breed': 'gin_trgm_ops'}),
     )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
@@ -60,8 +64,8 @@ class BreedingRequest(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     expires_at = Column(DateTime(timezone=True), nullable=True)  # When request expires
     
-    # Relationships
-    pet = relationship("Pet", backref="breeding_requests")
-    owner = relationship("User", backref="breeding_requests")
-    category = relationship("Category")
-    city = relationship("City")
+    # Relationships (load explicitly, e.g. via get_with_relations; lazy access raises)
+    pet = relationship("Pet", backref="breeding_requests", lazy="raise")
+    owner = relationship("User", backref="breeding_requests", lazy="raise")
+    category = relationship("Category", lazy="raise")
+    city = relationship("City", lazy="raise")
@@ -8,7 +8,7 @@ class Category(Base):
     __tablename__ = "categories"
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
-    name = Column(Text, nullable=True)
+    name = Column(Text, nullable=True, unique=True)
     image_url = Column(Text, nullable=True)
 
     # Relationships
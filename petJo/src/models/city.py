@@ -8,7 +8,7 @@ class City(Base):
     __tablename__ = "cities"
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
-    name = Column(Text, nullable=True)
+    name = Column(Text, nullable=True, unique=True)
 
     # Relationships
     pets = relationship("Pet", back_populates="city")
@@ -13,10 +13,10 @@ class Favorite(Base):
     )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    pet_id = Column(UUID(as_uuid=True), ForeignKey("pets.id"), nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    pet_id = Column(UUID(as_uuid=True), ForeignKey("pets.id", ondelete="CASCADE"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     user = relationship("User", back_populates="favorites")
-    pet = relationship("Pet", back_populates="favorites")
+    pet = relationship("Pet", back_populates="favorites", lazy="raise")
@@ -1,6 +1,6 @@
 """Missing animal model for lost/found pet reports."""
 from datetime import datetime
-from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime, Float, ForeignKey, BigInteger
+from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime, Float, ForeignKey, BigInteger, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -12,6 +12,14 @@ class MissingAnimal(Base):
     """Model for missing/lost animal reports."""
     
     __tablename__ = "missing_animals"
+    __table_args__ = (
+        Index('idx_missing_owner_created', 'owner_id', text('created_at DESC'), text('id DESC')),
+        Index('idx_missing_pet_name_trgm', 'pet_name', postgresql_using='gin', postgresql_ops={'pet_name': 'gin_trgm_ops'}),
+        Index('idx_missing_breed_trgm', 'breed', postgresql_using='gin', postgresql_ops={'breed': 'gin_trgm_ops'}),
+        Index('idx_missing_color_trgm', 'color', postgresql_using='gin', postgresql_ops={'color': 'gin_trgm_ops'}),
+        Index('idx_missing_description_trgm', 'description', postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'}),
+        Index('idx_missing_features_trgm', 'distinguishing_features', postgresql_using='gin', postgresql_ops={'distinguishing_features': 'gin_trgm_ops'}),
+    )
     
     id = Column(BigInteger, primary_key=True, index=True, autoincrement=True)
     
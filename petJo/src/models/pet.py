@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, BigInteger, ForeignKey, DateTime, Text, Boolean, Index
+from sqlalchemy import Column, String, Integer, BigInteger, ForeignKey, DateTime, Text, Boolean, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -31,10 +31,20 @@ class Pet(Base):
         Index('idx_pet_category', 'category_id'),
         Index('idx_pet_deleted', 'deleted_at'),
         Index('idx_pet_created', 'created_at'),
+        Index('idx_pet_status_alive', 'status', postgresql_where=text('deleted_at IS NULL')),
+        Index('idx_pet_deleted_at_null', 'id', postgresql_where=text('deleted_at IS NULL')),
+        Index(
+            'idx_pets_created_id', text('created_at DESC'), text('id DESC'),
+            postgresql_where=text('deleted_at IS NULL')
+        ),
+        Index(
+            'idx_pets_owner_created_id', 'owner_id', text('created_at DESC'), text('id DESC'),
+            postgresql_where=text('deleted_at IS NULL')
+        ),
     )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    owner_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    owner_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(Text, nullable=False)
     category_id = Column(BigInteger, ForeignKey("categories.id"), nullable=True, index=True)
     breed = Column(Text, nullable=True)
@@ -57,5 +67,5 @@ class Pet(Base):
     owner = relationship("User", back_populates="pets")
     category = relationship("Category", back_populates="pets")
     city = relationship("City", back_populates="pets")
-    photos = relationship("PetPhoto", back_populates="pet", cascade="all, delete-orphan")
-    favorites = relationship("Favorite", back_populates="pet", cascade="all, delete-orphan")
+    photos = relationship("PetPhoto", back_populates="pet", cascade="all, delete-orphan", passive_deletes=True)
+    favorites = relationship("Favorite", back_populates="pet", cascade="all, delete-orphan", passive_deletes=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, ForeignKey, DateTime, Text, Float
+from sqlalchemy import Column, BigInteger, ForeignKey, DateTime, Text, Float, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -8,6 +8,14 @@ from db.base_class import Base
 
 class PetHelpRequest(Base):
     __tablename__ = "pet_help_requests"
+    __table_args__ = (
+        Index('idx_help_created_id', text('created_at DESC'), text('id DESC')),
+        Index('idx_help_owner_created_id', 'owner_id', text('created_at DESC'), text('id DESC')),
+        Index(
+            'idx_help_location', 'location_lat', 'location_lng',
+            postgresql_where=text('location_lat IS NOT NULL AND location_lng IS NOT NULL')
+        ),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     description = Column(Text, nullable=True)
@@ -15,7 +23,7 @@ class PetHelpRequest(Base):
     location_lat = Column(Float, nullable=True)
     location_lng = Column(Float, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    owner_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    owner_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
     phone_number = Column(Text, nullable=True)
     location_address = Column(Text, nullable=True)
 
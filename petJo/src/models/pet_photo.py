@@ -10,7 +10,7 @@ class PetPhoto(Base):
     __tablename__ = "pet_photos"
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
-    pet_id = Column(UUID(as_uuid=True), ForeignKey("pets.id"), nullable=True)
+    pet_id = Column(UUID(as_uuid=True), ForeignKey("pets.id", ondelete="CASCADE"), nullable=True)
     url = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
@@ -10,7 +10,7 @@ class PushToken(Base):
     __tablename__ = "push_tokens"
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
     provider = Column(Text, nullable=True)
     token = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
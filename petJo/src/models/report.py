@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, ForeignKey, DateTime, Text
+from sqlalchemy import Column, BigInteger, ForeignKey, DateTime, Index, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -8,15 +8,18 @@ from db.base_class import Base
 
 class Report(Base):
     __tablename__ = "reports"
+    __table_args__ = (
+        Index('idx_report_target_created', 'target_type', 'target_id', text('created_at DESC')),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
-    reporter_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    reporter_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     target_type = Column(Text, nullable=True)  # pet|advertisement|profile
     target_id = Column(BigInteger, nullable=True)
-    reported_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    reported_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     reason = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
-    # Relationships
-    reporter = relationship("User", foreign_keys=[reporter_id], backref="reports_made")
-    reported_user = relationship("User", foreign_keys=[reported_user_id], backref="reports_received")
+    # Relationships (the report schemas expose only the ids; lazy access raises)
+    reporter = relationship("User", foreign_keys=[reporter_id], backref="reports_made", lazy="raise")
+    reported_user = relationship("User", foreign_keys=[reported_user_id], backref="reports_received", lazy="raise")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime, Index, Text
+from sqlalchemy import Column, String, Boolean, DateTime, Index, Text, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -11,8 +11,10 @@ class User(Base):
     __tablename__ = "users"
     __table_args__ = (
         Index('idx_user_email', 'email'),
+        Index('idx_user_email_lower', text('lower(email)'), unique=True),
         Index('idx_user_active', 'is_active'),
         Index('idx_user_city', 'city'),
+        Index('idx_users_created_id', text('created_at DESC'), text('id DESC')),
     )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -34,9 +36,9 @@ class User(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationships
-    pets = relationship("Pet", back_populates="owner", cascade="all, delete-orphan")
-    favorites = relationship("Favorite", back_populates="user", cascade="all, delete-orphan")
-    advertisements = relationship("Advertisement", back_populates="user", cascade="all, delete-orphan")
-    push_tokens = relationship("PushToken", back_populates="user", cascade="all, delete-orphan")
-    help_requests = relationship("PetHelpRequest", back_populates="requester", cascade="all, delete-orphan")
-    missing_animals = relationship("MissingAnimal", back_populates="owner", cascade="all, delete-orphan")
+    pets = relationship("Pet", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True)
+    favorites = relationship("Favorite", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    advertisements = relationship("Advertisement", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    push_tokens = relationship("PushToken", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    help_requests = relationship("PetHelpRequest", back_populates="requester", cascade="all, delete-orphan", passive_deletes=True)
+    missing_animals = relationship("MissingAnimal", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True)
@@ -13,14 +13,14 @@ from exceptions import PermissionDeniedException, NotFoundException
 
 
 async def check_is_admin(
-    current_user_id: str = Depends(get_current_user_id),
+    current_user_id: UUID = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db)
 ) -> User:
     """Check if current user is an admin."""
     from sqlalchemy import select
     
     result = await db.execute(
-        select(User).where(User.id == UUID(current_user_id))
+        select(User).where(User.id == current_user_id)
     )
     user = result.scalar_one_or_none()
     
@@ -35,7 +35,7 @@ async def check_is_admin(
 
 async def check_pet_owner(
     pet_id: UUID,
-    current_user_id: str,
+    current_user_id: UUID,
     db: AsyncSession
 ) -> bool:
     """Check if user owns the pet."""
@@ -49,12 +49,12 @@ async def check_pet_owner(
     if not pet:
         return False
     
-    return str(pet.owner_id) == str(current_user_id)
+    return pet.owner_id == current_user_id
 
 
 async def require_pet_owner(
     pet_id: UUID,
-    current_user_id: str = Depends(get_current_user_id),
+    current_user_id: UUID = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db)
 ) -> Pet:
     """Require user to be the pet owner."""
@@ -68,7 +68,7 @@ async def require_pet_owner(
     if not pet:
         raise NotFoundException("Pet")
     
-    if str(pet.owner_id) != str(current_user_id):
+    if pet.owner_id != current_user_id:
         raise PermissionDeniedException("access this pet")
     
     return pet
@@ -76,7 +76,7 @@ async def require_pet_owner(
 
 async def can_modify_pet(
     pet_id: int,
-    current_user_id: str,
+    current_user_id: UUID,
     db: AsyncSession
 ) -> bool:
     """Check if user can modify the pet (owner or admin)."""
@@ -84,7 +84,7 @@ async def can_modify_pet(
     
     # Check if user is admin
     result = await db.execute(
-        select(Profile).where(Profile.id == UUID(current_user_id))
+        select(Profile).where(Profile.id == current_user_id)
     )
     profile = result.scalar_one_or_none()
     
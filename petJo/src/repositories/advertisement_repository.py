@@ -1,5 +1,6 @@
 """Repository for advertisement database operations."""
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
@@ -20,36 +21,31 @@ class AdvertisementRepository(BaseRepository[Advertisement]):
         self,
         user_id: UUID,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None
     ) -> List[Advertisement]:
         """Get all advertisements by user ID."""
-        query = (
-            select(self.model)
-            .where(self.model.user_id == user_id)
-            .order_by(self.model.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-        )
+        query = select(self.model).where(self.model.user_id == user_id)
+        query = self.newest_first(query, after).offset(skip).limit(limit)
         result = await self.db.execute(query)
         return list(result.scalars().all())
     
     async def get_all_with_user(
         self,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None,
+        with_total: bool = False
     ) -> List[tuple]:
-        """Get all advertisements with user information."""
-        query = (
-            select(
-                Advertisement,
-                User.email,
-                User.full_name
-            )
-            .join(User, Advertisement.user_id == User.id)
-            .order_by(Advertisement.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-        )
+        """
+        Get all advertisements with user information.
+        
+        Each row holds the advertisement with its user loaded. With
+        with_total, it also carries the number of matching rows, computed
+        by a count(*) OVER () window in the same query.
+        """
+        query = self._with_user_query(with_total)
+        query = self.newest_first(query, after).offset(skip).limit(limit)
         result = await self.db.execute(query)
         return list(result.all())
     
@@ -64,24 +60,45 @@ class AdvertisementRepository(BaseRepository[Advertisement]):
         search_term: Optional[str] = None,
         status: Optional[str] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None
     ) -> List[Advertisement]:
         """Search advertisements by title or description with optional status filter."""
-        query = select(self.model)
+        query = select(self.model).where(*self._search_criteria(search_term, status))
+        query = self.newest_first(query, after).offset(skip).limit(limit)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+    
+    async def count_search(
+        self,
+        search_term: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> int:
+        """Count advertisements matching the same filters as search."""
+        query = (
+            select(func.count())
+            .select_from(self.model)
+            .where(*self._search_criteria(search_term, status))
+        )
+        result = await self.db.execute(query)
+        return result.scalar() or 0
+    
+    def _search_criteria(self, search_term: Optional[str], status: Optional[str]) -> list:
+        """Build the WHERE criteria shared by search and count_search."""
+        criteria = []
         
+        # Served by the pg_trgm GIN indexes on title and description
         if search_term:
             search_pattern = f"%{search_term}%"
-            query = query.where(
+            criteria.append(
                 (self.model.title.ilike(search_pattern)) |
                 (self.model.description.ilike(search_pattern))
             )
         
         if status:
-            query = query.where(self.model.status == status)
+            criteria.append(self.model.status == status)
         
-        query = query.order_by(self.model.created_at.desc()).offset(skip).limit(limit)
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+        return criteria
     
     async def get_pending_count(self) -> int:
         """Count pending advertisements."""
@@ -110,20 +127,44 @@ class AdvertisementRepository(BaseRepository[Advertisement]):
         self,
         status: str,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None,
+        with_total: bool = False
     ) -> List[tuple]:
-        """Get advertisements by status with user information."""
+        """Get advertisements by status with user information, see get_all_with_user."""
+        query = self._with_user_query(with_total).where(Advertisement.status == status)
+        query = self.newest_first(query, after).offset(skip).limit(limit)
+        result = await self.db.execute(query)
+        return list(result.all())
+    
+    async def stream_with_user(
+        self,
+        limit: int = 1000,
+        after: Optional[Tuple[datetime, int]] = None
+    ):
+        """
+        Stream advertisements with their author's email and name.
+        
+        Rows come from a server-side cursor as flat mappings whose keys match
+        AdvertisementWithUser, so they can be serialized one at a time.
+        """
         query = (
             select(
-                Advertisement,
-                User.email,
-                User.full_name
+                *Advertisement.__table__.c,
+                User.email.label("user_email"),
+                User.full_name.label("user_name")
             )
             .join(User, Advertisement.user_id == User.id)
-            .where(Advertisement.status == status)
-            .order_by(Advertisement.created_at.desc())
-            .offset(skip)
-            .limit(limit)
         )
-        result = await self.db.execute(query)
-        return list(result.all())
+        query = self.newest_first(query, after).limit(limit)
+        result = await self.db.stream(query)
+        return result.mappings()
+    
+    def _with_user_query(self, with_total: bool = False):
+        """Select advertisements with their author's email and name eager-loaded."""
+        columns = [Advertisement]
+        if with_total:
+            columns.append(func.count().over().label("total"))
+        return select(*columns).options(
+            joinedload(Advertisement.user).load_only(User.email, User.full_name)
+        )
@@ -1,10 +1,40 @@
-from typing import TypeVar, Generic, Optional, List, Type, Any
+from datetime import datetime
+from typing import TypeVar, Generic, Optional, List, Tuple, Type, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func
+from sqlalchemy import BigInteger, cast, column, select, table, tuple_, update, delete, func
 from sqlalchemy.orm import DeclarativeMeta
 
 ModelType = TypeVar("ModelType", bound=DeclarativeMeta)
 
+_pg_class = table("pg_class", column("oid"), column("reltuples"))
+
+
+def estimated_row_count(model: Type[ModelType]):
+    """
+    Build a scalar expression for the planner's row estimate of a model's table.
+    
+    Reads pg_class.reltuples instead of scanning the table, so it is only as
+    fresh as the last ANALYZE. Tables that were never analyzed report -1 and
+    fall back to an exact count.
+    """
+    reltuples = (
+        select(cast(_pg_class.c.reltuples, BigInteger))
+        .where(_pg_class.c.oid == func.to_regclass(model.__tablename__))
+        .scalar_subquery()
+    )
+    exact = select(func.count()).select_from(model).scalar_subquery()
+    return func.coalesce(func.nullif(reltuples, -1), exact)
+
+
+def count_subquery(model: Type[ModelType], *criteria):
+    """
+    Build a scalar COUNT(*) subquery over a model's table.
+    
+    Several of them in one select return many counts in a single round-trip,
+    each free to use its own (partial) index.
+    """
+    return select(func.count()).select_from(model).where(*criteria).scalar_subquery()
+
 
 class BaseRepository(Generic[ModelType]):
     """Base repository with generic CRUD operations."""
@@ -13,12 +43,15 @@ class BaseRepository(Generic[ModelType]):
         self.model = model
         self.db = db
     
+    def newest_first(self, query, after: Optional[Tuple[datetime, Any]] = None):
+        """Order a query by (created_at, id) descending, resuming after a keyset position."""
+        if after is not None:
+            query = query.where(tuple_(self.model.created_at, self.model.id) < tuple_(*after))
+        return query.order_by(self.model.created_at.desc(), self.model.id.desc())
+    
     async def get_by_id(self, id: Any) -> Optional[ModelType]:
-        """Get a single record by ID."""
-        result = await self.db.execute(
-            select(self.model).where(self.model.id == id)
-        )
-        return result.scalar_one_or_none()
+        """Get a single record by ID, from the identity map when already loaded."""
+        return await self.db.get(self.model, id)
     
     async def get_all(
         self, 
@@ -50,12 +83,50 @@ class BaseRepository(Generic[ModelType]):
         result = await self.db.execute(query)
         return result.scalar()
     
+    async def get_page_with_total(
+        self,
+        query,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[ModelType], int]:
+        """
+        Run a paginated query and count all of its matches in the same round-trip.
+        
+        The total comes from a count(*) OVER () column added to the query; only
+        an empty page past the end needs a separate COUNT.
+        
+        Args:
+            query: Select of the model with its filters and ordering applied.
+            skip: Number of records to skip.
+            limit: Maximum number of records to return.
+            
+        Returns:
+            Tuple of (list of records, total count).
+        """
+        result = await self.db.execute(
+            query.add_columns(func.count().over().label("total")).offset(skip).limit(limit)
+        )
+        rows = result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+        if skip == 0:
+            return [], 0
+        
+        total = await self.db.scalar(
+            select(func.count()).select_from(query.order_by(None).subquery())
+        )
+        return [], total or 0
+    
+    async def estimate_count(self) -> int:
+        """Estimate the total number of records without scanning the table."""
+        result = await self.db.execute(select(estimated_row_count(self.model)))
+        return result.scalar()
+    
     async def create(self, obj_in: dict) -> ModelType:
-        """Create a new record."""
+        """Create a new record; server defaults are loaded by the INSERT's RETURNING."""
         db_obj = self.model(**obj_in)
         self.db.add(db_obj)
         await self.db.commit()
-        await self.db.refresh(db_obj)
         return db_obj
     
     async def update(self, id: Any, obj_in: dict) -> Optional[ModelType]:
@@ -72,6 +143,19 @@ class BaseRepository(Generic[ModelType]):
         await self.db.refresh(db_obj)
         return db_obj
     
+    async def update_returning(self, id: Any, obj_in: dict, *criteria) -> Optional[ModelType]:
+        """Update a record by ID in one statement, returning None if no row matched."""
+        result = await self.db.execute(
+            update(self.model)
+            .where(self.model.id == id, *criteria)
+            .values(**obj_in)
+            .returning(self.model)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        db_obj = result.scalar_one_or_none()
+        await self.db.commit()
+        return db_obj
+    
     async def delete(self, id: Any) -> bool:
         """Delete a record by ID."""
         result = await self.db.execute(
@@ -80,6 +164,18 @@ class BaseRepository(Generic[ModelType]):
         await self.db.commit()
         return result.rowcount > 0
     
+    async def delete_returning(self, id: Any, *criteria) -> Optional[ModelType]:
+        """Delete a record by ID in one statement, returning the deleted row or None."""
+        result = await self.db.execute(
+            delete(self.model)
+            .where(self.model.id == id, *criteria)
+            .returning(self.model)
+            .execution_options(synchronize_session=False)
+        )
+        db_obj = result.scalar_one_or_none()
+        await self.db.commit()
+        return db_obj
+    
     async def soft_delete(self, id: Any) -> Optional[ModelType]:
         """Soft delete a record (if model has deleted_at field)."""
         if not hasattr(self.model, 'deleted_at'):
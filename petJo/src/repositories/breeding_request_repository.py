@@ -5,7 +5,7 @@ from datetime import datetime
 
 from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from models.breeding_request import BreedingRequest
 from repositories.base import BaseRepository
@@ -21,15 +21,13 @@ class BreedingRequestRepository(BaseRepository[BreedingRequest]):
         self, 
         owner_id: UUID, 
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None
     ) -> List[BreedingRequest]:
-        """Get all breeding requests by owner ID."""
+        """Get breeding requests by owner ID, newest first, optionally after a keyset position."""
+        query = select(BreedingRequest).where(BreedingRequest.owner_id == owner_id)
         result = await self.db.execute(
-            select(BreedingRequest)
-            .where(BreedingRequest.owner_id == owner_id)
-            .order_by(BreedingRequest.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+            self.newest_first(query, after).offset(skip).limit(limit)
         )
         return result.scalars().all()
     
@@ -43,18 +41,18 @@ class BreedingRequestRepository(BaseRepository[BreedingRequest]):
         return result.scalars().all()
     
     async def get_with_relations(self, request_id: int) -> Optional[BreedingRequest]:
-        """Get breeding request with pet, owner, category, and city."""
+        """Get breeding request with pet, owner, category, and city in a single joined query."""
         result = await self.db.execute(
             select(BreedingRequest)
             .options(
-                selectinload(BreedingRequest.pet),
-                selectinload(BreedingRequest.owner),
-                selectinload(BreedingRequest.category),
-                selectinload(BreedingRequest.city)
+                joinedload(BreedingRequest.pet),
+                joinedload(BreedingRequest.owner),
+                joinedload(BreedingRequest.category),
+                joinedload(BreedingRequest.city)
             )
             .where(BreedingRequest.id == request_id)
         )
-        return result.scalar_one_or_none()
+        return result.unique().scalar_one_or_none()
     
     async def get_active_requests(
         self,
@@ -64,6 +62,28 @@ class BreedingRequestRepository(BaseRepository[BreedingRequest]):
         city_id: Optional[int] = None
     ) -> List[BreedingRequest]:
         """Get all active breeding requests with optional filters."""
+        query = self._active_requests_query(category_id, city_id).offset(skip).limit(limit)
+        result = await self.db.execute(query)
+        return result.scalars().all()
+    
+    async def get_active_requests_with_total(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        category_id: Optional[int] = None,
+        city_id: Optional[int] = None
+    ) -> Tuple[List[BreedingRequest], int]:
+        """Get a page of active breeding requests and their total count in one query."""
+        return await self.get_page_with_total(
+            self._active_requests_query(category_id, city_id), skip, limit
+        )
+    
+    def _active_requests_query(
+        self,
+        category_id: Optional[int] = None,
+        city_id: Optional[int] = None
+    ):
+        """Build the newest-first select of active requests with optional filters."""
         query = select(BreedingRequest).where(
             BreedingRequest.status == "active"
         )
@@ -73,9 +93,7 @@ class BreedingRequestRepository(BaseRepository[BreedingRequest]):
         if city_id:
             query = query.where(BreedingRequest.city_id == city_id)
         
-        query = query.order_by(BreedingRequest.created_at.desc()).offset(skip).limit(limit)
-        result = await self.db.execute(query)
-        return result.scalars().all()
+        return query.order_by(BreedingRequest.created_at.desc())
     
     async def find_potential_matches(
         self,
@@ -87,8 +105,8 @@ class BreedingRequestRepository(BaseRepository[BreedingRequest]):
         Find potential breeding matches for a request.
         Matches based on: category, city, breed, age range.
         """
-        # Get the original request
-        original = await self.get_by_id(request_id)
+        # Get the original request, from the identity map when already loaded
+        original = await self.db.get(BreedingRequest, request_id)
         if not original:
             return []
         
@@ -115,14 +133,9 @@ class BreedingRequestRepository(BaseRepository[BreedingRequest]):
         result = await self.db.execute(query)
         return result.scalars().all()
     
-    async def search_requests(
-        self,
-        filters: dict,
-        skip: int = 0,
-        limit: int = 100
-    ) -> Tuple[List[BreedingRequest], int]:
+    def _search_conditions(self, filters: dict) -> list:
         """
-        Advanced search for breeding requests with multiple filters.
+        Build the WHERE conditions of an advanced search.
         
         Supported filters:
         - category_id: Filter by pet category
@@ -133,10 +146,6 @@ class BreedingRequestRepository(BaseRepository[BreedingRequest]):
         - health_certified: Filter health certified pets
         - search_term: Search in title, description, breed
         """
-        query = select(BreedingRequest)
-        count_query = select(func.count()).select_from(BreedingRequest)
-        
-        # Apply filters
         conditions = []
         
         if filters.get("category_id"):
@@ -162,6 +171,7 @@ class BreedingRequestRepository(BaseRepository[BreedingRequest]):
         
         if filters.get("search_term"):
             search_term = filters["search_term"]
+            # Each column has a pg_trgm GIN index, so the OR becomes a bitmap index scan
             conditions.append(
                 or_(
                     BreedingRequest.title.ilike(f"%{search_term}%"),
@@ -170,20 +180,33 @@ class BreedingRequestRepository(BaseRepository[BreedingRequest]):
                 )
             )
         
-        if conditions:
-            query = query.where(and_(*conditions))
-            count_query = count_query.where(and_(*conditions))
-        
-        # Get total count
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar()
-        
-        # Get results
-        query = query.order_by(BreedingRequest.created_at.desc()).offset(skip).limit(limit)
+        return conditions
+    
+    async def search_requests(
+        self,
+        filters: dict,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[BreedingRequest]:
+        """Advanced search for breeding requests, newest first (see _search_conditions)."""
+        query = (
+            select(BreedingRequest)
+            .where(and_(*self._search_conditions(filters)))
+            .order_by(BreedingRequest.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
         result = await self.db.execute(query)
-        requests = result.scalars().all()
-        
-        return requests, total
+        return result.scalars().all()
+    
+    async def count_search(self, filters: dict) -> int:
+        """Count the breeding requests matching an advanced search."""
+        result = await self.db.execute(
+            select(func.count())
+            .select_from(BreedingRequest)
+            .where(and_(*self._search_conditions(filters)))
+        )
+        return result.scalar()
     
     async def update_status(
         self,
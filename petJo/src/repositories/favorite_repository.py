@@ -4,7 +4,7 @@ from uuid import UUID
 
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from models.favorite import Favorite
 from repositories.base import BaseRepository
@@ -36,7 +36,8 @@ class FavoriteRepository(BaseRepository[Favorite]):
         """
         query = (
             select(Favorite)
-            .options(selectinload(Favorite.pet))
+            # Many-to-one, so the pets come in the same query as the favorites
+            .options(joinedload(Favorite.pet))
             .where(Favorite.user_id == user_id)
             .order_by(Favorite.created_at.desc())
             .offset(skip)
@@ -69,6 +70,20 @@ class FavoriteRepository(BaseRepository[Favorite]):
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
     
+    async def get_user_pet_ids(self, user_id: UUID) -> List[UUID]:
+        """
+        Get the ids of all pets favorited by a user.
+        
+        Args:
+            user_id: UUID of the user.
+            
+        Returns:
+            List of pet UUIDs.
+        """
+        query = select(Favorite.pet_id).where(Favorite.user_id == user_id)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+    
     async def delete_by_user_and_pet(
         self,
         user_id: UUID,
@@ -1,6 +1,6 @@
 """Repository for missing animal operations."""
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy import select, func, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -15,14 +15,20 @@ class MissingAnimalRepository(BaseRepository[MissingAnimal]):
     def __init__(self, db: AsyncSession):
         super().__init__(MissingAnimal, db)
     
-    async def get_by_owner(self, owner_id: str) -> List[MissingAnimal]:
-        """Get all missing animal reports by owner."""
-        result = await self.db.execute(
+    async def get_by_owner(
+        self,
+        owner_id: str,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[MissingAnimal]:
+        """Get missing animal reports by owner, newest first, optionally after a keyset position."""
+        query = (
             select(MissingAnimal)
             .options(selectinload(MissingAnimal.city))
             .filter(MissingAnimal.owner_id == owner_id)
-            .order_by(MissingAnimal.created_at.desc())
         )
+        query = self.newest_first(query, after).limit(limit)
+        result = await self.db.execute(query)
         return result.scalars().all()
     
     async def get_active_reports(
@@ -37,27 +43,49 @@ class MissingAnimalRepository(BaseRepository[MissingAnimal]):
         query = (
             select(MissingAnimal)
             .options(selectinload(MissingAnimal.city))
-            .filter(MissingAnimal.is_active == True)
+            .filter(*self._active_filters(city_id, animal_type, status))
+            .order_by(MissingAnimal.created_at.desc())
+            .offset(skip)
+            .limit(limit)
         )
         
-        # Apply filters
-        if city_id:
-            query = query.filter(MissingAnimal.city_id == city_id)
-        
-        if animal_type:
-            query = query.filter(MissingAnimal.animal_type == animal_type.lower())
-        
-        if status:
-            query = query.filter(MissingAnimal.status == status)
-        else:
-            # Default: only show missing and sighted (not found/reunited)
-            query = query.filter(MissingAnimal.status.in_(["missing", "sighted"]))
-        
-        query = query.order_by(MissingAnimal.created_at.desc()).offset(skip).limit(limit)
-        
         result = await self.db.execute(query)
         return result.scalars().all()
     
+    async def get_active_reports_with_total(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        city_id: Optional[int] = None,
+        animal_type: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> Tuple[List[MissingAnimal], int]:
+        """Get a page of active reports and their total count in one query."""
+        query = (
+            select(MissingAnimal)
+            .options(selectinload(MissingAnimal.city))
+            .filter(*self._active_filters(city_id, animal_type, status))
+            .order_by(MissingAnimal.created_at.desc())
+        )
+        return await self.get_page_with_total(query, skip, limit)
+    
+    async def stream_active_reports(
+        self,
+        limit: int = 1000,
+        city_id: Optional[int] = None,
+        animal_type: Optional[str] = None,
+        status: Optional[str] = None
+    ):
+        """Stream active reports from a server-side cursor, fetched 100 rows at a time."""
+        query = (
+            select(MissingAnimal)
+            .filter(*self._active_filters(city_id, animal_type, status))
+            .order_by(MissingAnimal.created_at.desc())
+            .limit(limit)
+            .execution_options(yield_per=100)
+        )
+        return await self.db.stream_scalars(query)
+    
     async def count_active_reports(
         self,
         city_id: Optional[int] = None,
@@ -66,22 +94,34 @@ class MissingAnimalRepository(BaseRepository[MissingAnimal]):
     ) -> int:
         """Count active missing animal reports with filters."""
         query = select(func.count(MissingAnimal.id)).filter(
-            MissingAnimal.is_active == True
+            *self._active_filters(city_id, animal_type, status)
         )
         
+        result = await self.db.execute(query)
+        return result.scalar_one()
+    
+    def _active_filters(
+        self,
+        city_id: Optional[int] = None,
+        animal_type: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> list:
+        """Build the criteria shared by the active report listing and its count."""
+        filters = [MissingAnimal.is_active == True]
+        
         if city_id:
-            query = query.filter(MissingAnimal.city_id == city_id)
+            filters.append(MissingAnimal.city_id == city_id)
         
         if animal_type:
-            query = query.filter(MissingAnimal.animal_type == animal_type.lower())
+            filters.append(MissingAnimal.animal_type == animal_type.lower())
         
         if status:
-            query = query.filter(MissingAnimal.status == status)
+            filters.append(MissingAnimal.status == status)
         else:
-            query = query.filter(MissingAnimal.status.in_(["missing", "sighted"]))
+            # Default: only show missing and sighted (not found/reunited)
+            filters.append(MissingAnimal.status.in_(["missing", "sighted"]))
         
-        result = await self.db.execute(query)
-        return result.scalar_one()
+        return filters
     
     async def search_reports(
         self,
@@ -89,10 +129,11 @@ class MissingAnimalRepository(BaseRepository[MissingAnimal]):
         skip: int = 0,
         limit: int = 20,
         city_id: Optional[int] = None
-    ) -> List[MissingAnimal]:
-        """Search missing animal reports by name, breed, description."""
-        search_pattern = f"%{search_term.lower()}%"
+    ) -> Tuple[List[MissingAnimal], int]:
+        """Search missing animal reports by name, breed, description, with the total match count."""
+        search_pattern = f"%{search_term}%"
         
+        # ILIKE on the bare columns can use their pg_trgm GIN indexes, unlike lower(...) LIKE
         query = (
             select(MissingAnimal)
             .options(selectinload(MissingAnimal.city))
@@ -100,11 +141,11 @@ class MissingAnimalRepository(BaseRepository[MissingAnimal]):
                 MissingAnimal.is_active == True,
                 MissingAnimal.status.in_(["missing", "sighted"]),
                 or_(
-                    func.lower(MissingAnimal.pet_name).like(search_pattern),
-                    func.lower(MissingAnimal.breed).like(search_pattern),
-                    func.lower(MissingAnimal.color).like(search_pattern),
-                    func.lower(MissingAnimal.description).like(search_pattern),
-                    func.lower(MissingAnimal.distinguishing_features).like(search_pattern)
+                    MissingAnimal.pet_name.ilike(search_pattern),
+                    MissingAnimal.breed.ilike(search_pattern),
+                    MissingAnimal.color.ilike(search_pattern),
+                    MissingAnimal.description.ilike(search_pattern),
+                    MissingAnimal.distinguishing_features.ilike(search_pattern)
                 )
             )
         )
@@ -112,10 +153,8 @@ class MissingAnimalRepository(BaseRepository[MissingAnimal]):
         if city_id:
             query = query.filter(MissingAnimal.city_id == city_id)
         
-        query = query.order_by(MissingAnimal.created_at.desc()).offset(skip).limit(limit)
-        
-        result = await self.db.execute(query)
-        return result.scalars().all()
+        query = query.order_by(MissingAnimal.created_at.desc())
+        return await self.get_page_with_total(query, skip, limit)
     
     async def get_recent_reports(
         self,
@@ -172,33 +211,27 @@ class MissingAnimalRepository(BaseRepository[MissingAnimal]):
         return result.scalars().all()
     
     async def get_statistics(self, city_id: Optional[int] = None) -> dict:
-        """Get statistics about missing animal reports."""
-        base_query = select(func.count(MissingAnimal.id))
+        """Get statistics about missing animal reports, aggregated in a single query."""
+        cutoff = datetime.utcnow() - timedelta(days=7)
+        is_active = MissingAnimal.is_active == True
+        
+        query = select(
+            # Total active reports
+            func.count().filter(
+                is_active, MissingAnimal.status.in_(["missing", "sighted"])
+            ).label("active_reports"),
+            # Total found
+            func.count().filter(
+                MissingAnimal.status.in_(["found", "reunited"])
+            ).label("total_found"),
+            # Recent (last 7 days)
+            func.count().filter(
+                is_active, MissingAnimal.created_at >= cutoff
+            ).label("recent_reports"),
+        ).select_from(MissingAnimal)
         
         if city_id:
-            base_query = base_query.filter(MissingAnimal.city_id == city_id)
-        
-        # Total active reports
-        active_query = base_query.filter(
-            MissingAnimal.is_active == True,
-            MissingAnimal.status.in_(["missing", "sighted"])
-        )
-        total_active = (await self.db.execute(active_query)).scalar_one()
-        
-        # Total found
-        found_query = base_query.filter(MissingAnimal.status.in_(["found", "reunited"]))
-        total_found = (await self.db.execute(found_query)).scalar_one()
-        
-        # Recent (last 7 days)
-        cutoff = datetime.utcnow() - timedelta(days=7)
-        recent_query = base_query.filter(
-            MissingAnimal.is_active == True,
-            MissingAnimal.created_at >= cutoff
-        )
-        recent_reports = (await self.db.execute(recent_query)).scalar_one()
+            query = query.filter(MissingAnimal.city_id == city_id)
         
-        return {
-            "active_reports": total_active,
-            "total_found": total_found,
-            "recent_reports": recent_reports
-        }
+        row = (await self.db.execute(query)).one()
+        return dict(row._mapping)
@@ -1,14 +1,19 @@
 """Pet help request repository for database operations."""
-from typing import List, Optional
+import math
+from datetime import datetime
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import desc, select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from models.pet_help_request import PetHelpRequest
 from repositories.base import BaseRepository
 
+KM_PER_DEGREE = 111.0
+EARTH_RADIUS_KM = 6371.0
+
 
 class PetHelpRequestRepository(BaseRepository[PetHelpRequest]):
     """Repository for PetHelpRequest model with specific queries."""
@@ -20,25 +25,24 @@ class PetHelpRequestRepository(BaseRepository[PetHelpRequest]):
         self,
         owner_id: UUID,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None
     ) -> List[PetHelpRequest]:
         """
-        Get all help requests by owner ID.
+        Get help requests by owner ID, newest first.
         
         Args:
             owner_id: UUID of the owner.
             skip: Number of records to skip.
             limit: Maximum number of records to return.
+            after: Keyset position (created_at, id) to resume after.
             
         Returns:
             List of pet help requests.
         """
+        query = select(PetHelpRequest).where(PetHelpRequest.owner_id == owner_id)
         result = await self.db.execute(
-            select(PetHelpRequest)
-            .where(PetHelpRequest.owner_id == owner_id)
-            .order_by(desc(PetHelpRequest.created_at))
-            .offset(skip)
-            .limit(limit)
+            self.newest_first(query, after).offset(skip).limit(limit)
         )
         return result.scalars().all()
     
@@ -62,7 +66,8 @@ class PetHelpRequestRepository(BaseRepository[PetHelpRequest]):
     async def get_all_public(
         self,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None
     ) -> List[PetHelpRequest]:
         """
         Get all public help requests.
@@ -70,15 +75,13 @@ class PetHelpRequestRepository(BaseRepository[PetHelpRequest]):
         Args:
             skip: Number of records to skip.
             limit: Maximum number of records to return.
+            after: Keyset position (created_at, id) to resume after.
             
         Returns:
             List of all pet help requests ordered by creation date.
         """
         result = await self.db.execute(
-            select(PetHelpRequest)
-            .order_by(desc(PetHelpRequest.created_at))
-            .offset(skip)
-            .limit(limit)
+            self.newest_first(select(PetHelpRequest), after).offset(skip).limit(limit)
         )
         return result.scalars().all()
     
@@ -88,12 +91,14 @@ class PetHelpRequestRepository(BaseRepository[PetHelpRequest]):
         lng: float,
         radius_km: float = 10.0,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None
     ) -> List[PetHelpRequest]:
         """
         Search help requests by location within a radius.
         
-        Uses Haversine formula approximation for distance calculation.
+        A bounding box served by idx_help_location narrows the candidates,
+        then the Haversine distance drops the corners outside the radius.
         
         Args:
             lat: Latitude of search center.
@@ -101,25 +106,36 @@ class PetHelpRequestRepository(BaseRepository[PetHelpRequest]):
             radius_km: Search radius in kilometers.
             skip: Number of records to skip.
             limit: Maximum number of records to return.
+            after: Keyset position (created_at, id) to resume after.
             
         Returns:
             List of help requests within the radius.
         """
-        # Simple bounding box filter (for better performance with indexes)
-        # Approximate: 1 degree latitude ≈ 111 km
-        lat_delta = radius_km / 111.0
-        lng_delta = radius_km / (111.0 * abs(lat))  # Adjust for latitude
+        # Bounding box: 1 degree of latitude ≈ 111 km, a degree of longitude
+        # shrinks with cos(lat) (clamped so the poles do not divide by zero)
+        lat_delta = radius_km / KM_PER_DEGREE
+        lng_delta = radius_km / (KM_PER_DEGREE * max(math.cos(math.radians(lat)), 0.01))
         
+        # Haversine distance in km from the search center; least() keeps
+        # rounding from pushing asin out of its domain
+        half_dlat = func.radians(PetHelpRequest.location_lat - lat) / 2
+        half_dlng = func.radians(PetHelpRequest.location_lng - lng) / 2
+        haversine = (
+            func.power(func.sin(half_dlat), 2)
+            + math.cos(math.radians(lat))
+            * func.cos(func.radians(PetHelpRequest.location_lat))
+            * func.power(func.sin(half_dlng), 2)
+        )
+        distance_km = 2 * EARTH_RADIUS_KM * func.asin(func.sqrt(func.least(haversine, 1.0)))
+        
+        query = select(PetHelpRequest).where(
+            PetHelpRequest.location_lat.isnot(None),
+            PetHelpRequest.location_lng.isnot(None),
+            PetHelpRequest.location_lat.between(lat - lat_delta, lat + lat_delta),
+            PetHelpRequest.location_lng.between(lng - lng_delta, lng + lng_delta),
+            distance_km <= radius_km
+        )
         result = await self.db.execute(
-            select(PetHelpRequest)
-            .where(
-                PetHelpRequest.location_lat.isnot(None),
-                PetHelpRequest.location_lng.isnot(None),
-                PetHelpRequest.location_lat.between(lat - lat_delta, lat + lat_delta),
-                PetHelpRequest.location_lng.between(lng - lng_delta, lng + lng_delta)
-            )
-            .order_by(desc(PetHelpRequest.created_at))
-            .offset(skip)
-            .limit(limit)
+            self.newest_first(query, after).offset(skip).limit(limit)
         )
         return result.scalars().all()
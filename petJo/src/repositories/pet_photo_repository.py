@@ -1,10 +1,11 @@
 """Pet photo repository for database operations."""
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Text, insert, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from models.pet import Pet
 from models.pet_photo import PetPhoto
 from repositories.base import BaseRepository
 
@@ -42,3 +43,80 @@ class PetPhotoRepository(BaseRepository[PetPhoto]):
         )
         result = await self.db.execute(query)
         return list(result.scalars().all())
+    
+    async def create_many(self, pet_id: UUID, urls: List[str]) -> List[PetPhoto]:
+        """
+        Add several photos to a pet with a single multi-row INSERT.
+        
+        Args:
+            pet_id: UUID of the pet.
+            urls: URLs of the photos, in display order.
+            
+        Returns:
+            List of created photos.
+        """
+        result = await self.db.scalars(
+            insert(PetPhoto).returning(PetPhoto),
+            [{"pet_id": pet_id, "url": url} for url in urls]
+        )
+        photos = list(result.all())
+        await self.db.commit()
+        return photos
+    
+    async def create_for_owner(
+        self,
+        pet_id: UUID,
+        owner_id: UUID,
+        url: str
+    ) -> Optional[PetPhoto]:
+        """
+        Add a photo to a pet in one statement, only if the user owns the pet.
+        
+        Args:
+            pet_id: UUID of the pet.
+            owner_id: UUID of the user adding the photo.
+            url: URL of the photo.
+            
+        Returns:
+            The created photo, or None if the pet does not exist or belongs
+            to someone else.
+        """
+        owned_pet = (
+            select(Pet.id, literal(url, Text))
+            .where(Pet.id == pet_id)
+            .where(Pet.owner_id == owner_id)
+            .where(Pet.deleted_at.is_(None))
+        )
+        result = await self.db.execute(
+            insert(PetPhoto)
+            .from_select(["pet_id", "url"], owned_pet)
+            .returning(PetPhoto)
+        )
+        photo = result.scalar_one_or_none()
+        await self.db.commit()
+        return photo
+    
+    async def delete_for_owner(
+        self,
+        photo_id: int,
+        pet_id: UUID,
+        owner_id: UUID
+    ) -> bool:
+        """
+        Delete a pet photo in one statement, only if the user owns the pet.
+        
+        Args:
+            photo_id: ID of the photo.
+            pet_id: UUID of the pet the photo belongs to.
+            owner_id: UUID of the user deleting the photo.
+            
+        Returns:
+            True if the photo was deleted, False otherwise.
+        """
+        deleted = await self.delete_returning(
+            photo_id,
+            PetPhoto.pet_id == pet_id,
+            Pet.id == PetPhoto.pet_id,
+            Pet.owner_id == owner_id
+        )
+        return deleted is not None
@@ -1,13 +1,15 @@
 """Pet repository for database operations."""
+from datetime import datetime
 from typing import List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from models.pet import Pet
 from repositories.base import BaseRepository
+from utils.filters import PetSearchFilters
 
 
 class PetRepository(BaseRepository[Pet]):
@@ -20,41 +22,58 @@ class PetRepository(BaseRepository[Pet]):
         self, 
         owner_id: UUID, 
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> List[Pet]:
-        """Get all pets by owner ID."""
-        result = await self.db.execute(
+        """Get pets by owner ID, newest first, optionally after a keyset position."""
+        query = (
             select(Pet)
             .where(Pet.owner_id == owner_id)
             .where(Pet.deleted_at.is_(None))
-            .offset(skip)
-            .limit(limit)
+        )
+        result = await self.db.execute(
+            self.newest_first(query, after).offset(skip).limit(limit)
         )
         return result.scalars().all()
     
+    async def get_owned(self, pet_id: UUID, owner_id: UUID) -> Optional[Pet]:
+        """Get a live pet only if it belongs to the owner, in a single query."""
+        result = await self.db.execute(
+            select(Pet)
+            .where(Pet.id == pet_id)
+            .where(Pet.owner_id == owner_id)
+            .where(Pet.deleted_at.is_(None))
+        )
+        return result.scalar_one_or_none()
+    
     async def get_with_relations(self, pet_id: UUID) -> Optional[Pet]:
-        """Get pet with owner, category, city, and photos."""
+        """
+        Get pet with category, city, and photos.
+        
+        Category and city are joined into the pet query and the photos follow
+        in one selectin query, two round-trips in total.
+        """
         result = await self.db.execute(
             select(Pet)
             .options(
-                selectinload(Pet.owner),
-                selectinload(Pet.category),
-                selectinload(Pet.city),
+                joinedload(Pet.category),
+                joinedload(Pet.city),
                 selectinload(Pet.photos)
             )
             .where(Pet.id == pet_id)
             .where(Pet.deleted_at.is_(None))
         )
-        return result.scalar_one_or_none()
+        return result.unique().scalar_one_or_none()
     
     async def get_available_pets(
         self,
         skip: int = 0,
         limit: int = 100,
         city_id: Optional[int] = None,
-        category_id: Optional[int] = None
+        category_id: Optional[int] = None,
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> List[Pet]:
-        """Get available pets with filters."""
+        """Get available pets with filters, newest first, optionally after a keyset position."""
         query = select(Pet).where(
             Pet.status == "available",
             Pet.visibility == "public",
@@ -66,7 +85,7 @@ class PetRepository(BaseRepository[Pet]):
         if category_id:
             query = query.where(Pet.category_id == category_id)
         
-        query = query.offset(skip).limit(limit)
+        query = self.newest_first(query, after).offset(skip).limit(limit)
         result = await self.db.execute(query)
         return result.scalars().all()
     
@@ -74,104 +93,73 @@ class PetRepository(BaseRepository[Pet]):
         self,
         search_term: str,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> List[Pet]:
-        """Search pets by name or breed."""
-        result = await self.db.execute(
+        """Search pets by name or breed, newest first, optionally after a keyset position."""
+        query = (
             select(Pet)
             .where(Pet.deleted_at.is_(None))
             .where(
                 (Pet.name.ilike(f"%{search_term}%")) |
                 (Pet.breed.ilike(f"%{search_term}%"))
             )
-            .offset(skip)
-            .limit(limit)
+        )
+        result = await self.db.execute(
+            self.newest_first(query, after).offset(skip).limit(limit)
         )
         return result.scalars().all()
     
     async def advanced_search(
         self,
-        filters: dict,
+        filters: PetSearchFilters,
         skip: int = 0,
         limit: int = 100
-    ) -> Tuple[List[Pet], int]:
+    ) -> Tuple[List[Pet], bool]:
         """
         Perform advanced search with multiple filters.
         
+        Only the filters that are set become predicates. One extra row is
+        fetched to tell whether another page follows, instead of counting
+        every match.
+        
         Args:
-            filters: Dictionary of filter criteria (search_term, category_id, etc.)
+            filters: Search filters.
             skip: Number of records to skip for pagination.
             limit: Maximum number of records to return.
             
         Returns:
-            Tuple of (list of pets, total count).
+            Tuple of (list of pets, whether more pets follow).
         """
-        # Base query - only non-deleted pets
-        query = select(Pet).where(Pet.deleted_at.is_(None))
-        count_query = select(func.count()).select_from(Pet).where(Pet.deleted_at.is_(None))
-        
-        # Text search
-        if filters.get("search_term"):
-            search_term = filters["search_term"]
-            search_condition = or_(
-                Pet.name.ilike(f"%{search_term}%"),
-                Pet.breed.ilike(f"%{search_term}%"),
-                Pet.description.ilike(f"%{search_term}%")
+        f = filters
+        conditions = [
+            condition for condition in (
+                or_(
+                    Pet.name.ilike(f"%{f.q}%"),
+                    Pet.breed.ilike(f"%{f.q}%"),
+                    Pet.description.ilike(f"%{f.q}%")
+                ) if f.q else None,
+                Pet.category_id == f.category_id if f.category_id else None,
+                Pet.city_id == f.city_id if f.city_id else None,
+                # Without a status filter, only public pets are shown
+                Pet.status == f.status if f.status else Pet.visibility == "public",
+                Pet.gender.ilike(f.gender) if f.gender else None,
+                Pet.age >= f.min_age if f.min_age is not None else None,
+                Pet.age <= f.max_age if f.max_age is not None else None,
+                Pet.vaccinated == f.vaccinated if f.vaccinated is not None else None,
+                Pet.spayed == f.spayed if f.spayed is not None else None,
             )
-            query = query.where(search_condition)
-            count_query = count_query.where(search_condition)
-        
-        # Category filter
-        if filters.get("category_id"):
-            query = query.where(Pet.category_id == filters["category_id"])
-            count_query = count_query.where(Pet.category_id == filters["category_id"])
-        
-        # City filter
-        if filters.get("city_id"):
-            query = query.where(Pet.city_id == filters["city_id"])
-            count_query = count_query.where(Pet.city_id == filters["city_id"])
-        
-        # Status filter
-        if filters.get("status"):
-            query = query.where(Pet.status == filters["status"])
-            count_query = count_query.where(Pet.status == filters["status"])
-        else:
-            # Default: only show public available pets
-            query = query.where(Pet.visibility == "public")
-            count_query = count_query.where(Pet.visibility == "public")
-        
-        # Gender filter
-        if filters.get("gender"):
-            query = query.where(Pet.gender.ilike(filters["gender"]))
-            count_query = count_query.where(Pet.gender.ilike(filters["gender"]))
+            if condition is not None
+        ]
         
-        # Age range filters
-        if filters.get("min_age") is not None:
-            query = query.where(Pet.age >= filters["min_age"])
-            count_query = count_query.where(Pet.age >= filters["min_age"])
-        
-        if filters.get("max_age") is not None:
-            query = query.where(Pet.age <= filters["max_age"])
-            count_query = count_query.where(Pet.age <= filters["max_age"])
-        
-        # Vaccinated filter
-        if filters.get("vaccinated") is not None:
-            query = query.where(Pet.vaccinated == filters["vaccinated"])
-            count_query = count_query.where(Pet.vaccinated == filters["vaccinated"])
-        
-        # Spayed filter
-        if filters.get("spayed") is not None:
-            query = query.where(Pet.spayed == filters["spayed"])
-            count_query = count_query.where(Pet.spayed == filters["spayed"])
-        
-        # Get total count
-        total = await self.db.scalar(count_query)
-        
-        # Add ordering and pagination
-        query = query.order_by(Pet.created_at.desc()).offset(skip).limit(limit)
-        
-        # Execute query
+        query = (
+            select(Pet)
+            .where(Pet.deleted_at.is_(None), *conditions)
+            .order_by(Pet.created_at.desc())
+            .offset(skip)
+            .limit(limit + 1)
+        )
         result = await self.db.execute(query)
         pets = result.scalars().all()
         
-        return pets, total or 0
+        return pets[:limit], len(pets) > limit
@@ -1,6 +1,6 @@
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, select
 from uuid import UUID
 
 from models.user import User
@@ -14,9 +14,9 @@ class UserRepository(BaseRepository[User]):
         super().__init__(User, db)
     
     async def get_by_email(self, email: str) -> Optional[User]:
-        """Get user by email."""
+        """Get user by email, ignoring case (served by idx_user_email_lower)."""
         result = await self.db.execute(
-            select(User).where(User.email == email)
+            select(User).where(func.lower(User.email) == email.lower())
         )
         return result.scalar_one_or_none()
     
@@ -28,9 +28,9 @@ class UserRepository(BaseRepository[User]):
         return result.scalar_one_or_none()
 
     async def email_exists(self, email: str) -> bool:
-        """Check if email already exists."""
+        """Check if email already exists, ignoring case."""
         result = await self.db.execute(
-            select(User.id).where(User.email == email)
+            select(User.id).where(func.lower(User.email) == email.lower())
         )
         user_id = result.scalar_one_or_none()
         return user_id is not None
@@ -1,5 +1,5 @@
 """Category schemas."""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 
 
@@ -24,5 +24,4 @@ class Category(CategoryBase):
     """Category response schema."""
     id: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -21,10 +21,12 @@ class PaginatedResponse(BaseModel, Generic[T]):
     """Paginated response model."""
     
     items: List[T]
-    total: int
+    total: Optional[int] = None
     page: int
     page_size: int
-    pages: int
+    pages: Optional[int] = None
+    has_next: bool = False
+    next_cursor: Optional[str] = None
     
     class Config:
         from_attributes = True
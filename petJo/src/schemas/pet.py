@@ -1,10 +1,13 @@
 from pydantic import BaseModel, ConfigDict, Field, field_validator
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
 
 from utils.validators import validate_age, validate_phone_number
 from core.sanitize import sanitize_text
+from schemas.category import Category
+from schemas.city import City
+from schemas.pet_photo import PetPhoto
 
 
 class PetBase(BaseModel):
@@ -90,6 +93,15 @@ class PetPublic(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class PetDetail(Pet):
+    """Pet with its category, city and photos, as rendered on the pet page."""
+    category: Optional[Category] = None
+    city: Optional[City] = None
+    photos: List[PetPhoto] = []
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
 class PetWithOwner(Pet):
     owner: "ProfilePublic"
     
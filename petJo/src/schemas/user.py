@@ -111,6 +111,14 @@ class ProfileUpdate(BaseModel):
     preferences: Optional[Any] = None
 
 
+class EmailUpdate(BaseModel):
+    email: EmailStr = Field(..., description="New email address")
+
+
+class PasswordUpdate(BaseModel):
+    new_password: str = Field(..., min_length=8, max_length=100, description="New password (min 8 characters)")
+
+
 class Profile(ProfileBase):
     id: UUID
     created_at: datetime
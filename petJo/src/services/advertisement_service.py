@@ -1,5 +1,5 @@
 """Service layer for advertisement business logic."""
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime
 
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.advertisement import Advertisement
 from repositories.advertisement_repository import AdvertisementRepository
+from schemas.advertisement import AdvertisementUpdate
 from services.base import BaseService
 from exceptions import NotFoundException, ForbiddenException
 
@@ -39,10 +40,11 @@ class AdvertisementService(BaseService[Advertisement, AdvertisementRepository]):
         self,
         user_id: UUID,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None
     ) -> List[Advertisement]:
         """Get all advertisements by a user."""
-        return await self.repository.get_by_user_id(user_id, skip, limit)
+        return await self.repository.get_by_user_id(user_id, skip, limit, after)
     
     async def get_all_advertisements(
         self,
@@ -55,10 +57,19 @@ class AdvertisementService(BaseService[Advertisement, AdvertisementRepository]):
     async def get_all_with_users(
         self,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[tuple]:
-        """Get all advertisements with user details (admin only)."""
-        return await self.repository.get_all_with_user(skip, limit)
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None,
+        with_total: bool = False
+    ) -> Tuple[List[Advertisement], Optional[int]]:
+        """
+        Get all advertisements with user details (admin only).
+        
+        Returns:
+            The advertisements with their user loaded, and the number of matching
+            advertisements when with_total is set and the page is not empty.
+        """
+        rows = await self.repository.get_all_with_user(skip, limit, after, with_total)
+        return self._split_total(rows, with_total)
     
     async def get_advertisement_by_id(self, ad_id: int) -> Advertisement:
         """Get advertisement by ID."""
@@ -71,16 +82,20 @@ class AdvertisementService(BaseService[Advertisement, AdvertisementRepository]):
         self,
         ad_id: int,
         user_id: UUID,
-        update_data: dict
+        update_data: AdvertisementUpdate
     ) -> Advertisement:
-        """Update an advertisement (only by owner)."""
+        """Update an advertisement (only by owner) with the fields set in the request."""
         ad = await self.get_advertisement_by_id(ad_id)
         
         # Check ownership
         if ad.user_id != user_id:
             raise ForbiddenException("You can only update your own advertisements")
         
-        return await self.repository.update(ad_id, update_data)
+        values = {field: getattr(update_data, field) for field in update_data.model_fields_set}
+        if not values:
+            return ad
+        
+        return await self.repository.update(ad_id, values)
     
     async def delete_advertisement(
         self,
@@ -106,10 +121,19 @@ class AdvertisementService(BaseService[Advertisement, AdvertisementRepository]):
         search_term: Optional[str] = None,
         status: Optional[str] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None
     ) -> List[Advertisement]:
         """Search advertisements with optional status filter."""
-        return await self.repository.search(search_term, status, skip, limit)
+        return await self.repository.search(search_term, status, skip, limit, after)
+    
+    async def count_search_results(
+        self,
+        search_term: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> int:
+        """Count advertisements matching a search."""
+        return await self.repository.count_search(search_term, status)
     
     async def count_all(self) -> int:
         """Count all advertisements."""
@@ -126,10 +150,21 @@ class AdvertisementService(BaseService[Advertisement, AdvertisementRepository]):
     async def get_pending_with_users(
         self,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[tuple]:
-        """Get pending advertisements with user details (admin only)."""
-        return await self.repository.get_by_status_with_user("pending", skip, limit)
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None,
+        with_total: bool = False
+    ) -> Tuple[List[Advertisement], Optional[int]]:
+        """Get pending advertisements with user details (admin only), see get_all_with_users."""
+        rows = await self.repository.get_by_status_with_user("pending", skip, limit, after, with_total)
+        return self._split_total(rows, with_total)
+    
+    @staticmethod
+    def _split_total(rows: List[tuple], with_total: bool) -> Tuple[List[Advertisement], Optional[int]]:
+        """Separate the advertisements from the window-function total of (advertisement, total) rows."""
+        ads = [row[0] for row in rows]
+        if not with_total or not rows:
+            return ads, None
+        return ads, rows[0].total
     
     async def count_pending(self) -> int:
         """Count pending advertisements."""
@@ -37,10 +37,18 @@ class BaseService(Generic[ModelType, RepositoryType]):
         """Update a record."""
         return await self.repository.update(id, data)
     
+    async def update_returning(self, id: int, data: dict):
+        """Update a record in one statement, returning None if it does not exist."""
+        return await self.repository.update_returning(id, data)
+    
     async def delete(self, id: int) -> bool:
         """Delete a record."""
         return await self.repository.delete(id)
     
+    async def delete_returning(self, id: int):
+        """Delete a record in one statement, returning the deleted record or None."""
+        return await self.repository.delete_returning(id)
+    
     async def soft_delete(self, id: int):
         """Soft delete a record."""
         return await self.repository.soft_delete(id)
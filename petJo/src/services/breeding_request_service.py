@@ -1,10 +1,19 @@
 """Breeding request service for business logic."""
+from datetime import datetime
 from typing import List, Optional, Tuple
 from uuid import UUID
 
+from cachetools import TTLCache
+
+from models.breeding_request import BreedingRequest
 from repositories.breeding_request_repository import BreedingRequestRepository
 from services.base import BaseService
 
+# Search totals only feed the pagination UI, so they may lag by up to
+# SEARCH_TOTAL_TTL seconds. Creating a request drops this worker's totals.
+SEARCH_TOTAL_TTL = 30
+_search_totals: TTLCache = TTLCache(maxsize=512, ttl=SEARCH_TOTAL_TTL)
+
 
 class BreedingRequestService(BaseService[None, BreedingRequestRepository]):
     """Service for BreedingRequest business logic."""
@@ -17,10 +26,11 @@ class BreedingRequestService(BaseService[None, BreedingRequestRepository]):
         self,
         owner_id: UUID,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None
     ):
-        """Get all breeding requests belonging to a user."""
-        return await self.repository.get_by_owner(owner_id, skip, limit)
+        """Get breeding requests belonging to a user, newest first."""
+        return await self.repository.get_by_owner(owner_id, skip, limit, after)
     
     async def get_pet_requests(self, pet_id: UUID):
         """Get all breeding requests for a specific pet."""
@@ -38,6 +48,18 @@ class BreedingRequestService(BaseService[None, BreedingRequestRepository]):
             skip, limit, category_id, city_id
         )
     
+    async def get_active_requests_with_total(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        category_id: Optional[int] = None,
+        city_id: Optional[int] = None
+    ) -> Tuple[List, int]:
+        """Get active breeding requests with optional filters, and their total count."""
+        return await self.repository.get_active_requests_with_total(
+            skip, limit, category_id, city_id
+        )
+    
     async def find_matches(
         self,
         request_id: int,
@@ -69,7 +91,22 @@ class BreedingRequestService(BaseService[None, BreedingRequestRepository]):
         Returns:
             Tuple of (list of requests, total count).
         """
-        return await self.repository.search_requests(filters, skip, limit)
+        requests = await self.repository.search_requests(filters, skip, limit)
+        if skip == 0 and len(requests) < limit:
+            return requests, len(requests)
+        
+        key = frozenset(filters.items())
+        total = _search_totals.get(key)
+        if total is None:
+            total = await self.repository.count_search(filters)
+            _search_totals[key] = total
+        return requests, total
+    
+    async def create(self, data: dict):
+        """Create a breeding request, dropping the cached search totals."""
+        breeding_request = await self.repository.create(data)
+        _search_totals.clear()
+        return breeding_request
     
     async def verify_owner(self, request_id: int, user_id: UUID) -> bool:
         """Verify if user is the owner of the breeding request."""
@@ -83,25 +120,50 @@ class BreedingRequestService(BaseService[None, BreedingRequestRepository]):
         request_id: int,
         status: str,
         user_id: UUID
-    ) -> Optional[any]:
+    ) -> Optional[BreedingRequest]:
         """
         Update the status of a breeding request.
         Only owner can update.
         """
-        if not await self.verify_owner(request_id, user_id):
-            return None
+        return await self.update_if_owner(
+            request_id, user_id, {"status": status, "updated_at": datetime.utcnow()}
+        )
+    
+    async def update_if_owner(
+        self,
+        request_id: int,
+        user_id: UUID,
+        data: dict
+    ) -> Optional[BreedingRequest]:
+        """
+        Update a breeding request in one statement, only if the user owns it.
+        
+        Returns None when the request does not exist or belongs to someone else.
+        """
+        if not data:
+            request = await self.repository.get_by_id(request_id)
+            return request if request and request.owner_id == user_id else None
         
-        return await self.repository.update_status(request_id, status)
+        return await self.repository.update_returning(
+            request_id, data, BreedingRequest.owner_id == user_id
+        )
+    
+    async def delete_if_owner(self, request_id: int, user_id: UUID) -> bool:
+        """Delete a breeding request in one statement, only if the user owns it."""
+        deleted = await self.repository.delete_returning(
+            request_id, BreedingRequest.owner_id == user_id
+        )
+        return deleted is not None
     
-    async def cancel_request(self, request_id: int, user_id: UUID) -> Optional[any]:
+    async def cancel_request(self, request_id: int, user_id: UUID) -> Optional[BreedingRequest]:
         """Cancel a breeding request. Only owner can cancel."""
         return await self.update_status(request_id, "cancelled", user_id)
     
-    async def mark_as_matched(self, request_id: int, user_id: UUID) -> Optional[any]:
+    async def mark_as_matched(self, request_id: int, user_id: UUID) -> Optional[BreedingRequest]:
         """Mark request as matched (found a mate). Only owner can update."""
         return await self.update_status(request_id, "matched", user_id)
     
-    async def mark_as_completed(self, request_id: int, user_id: UUID) -> Optional[any]:
+    async def mark_as_completed(self, request_id: int, user_id: UUID) -> Optional[BreedingRequest]:
         """Mark request as completed (breeding done). Only owner can update."""
         return await self.update_status(request_id, "completed", user_id)
     
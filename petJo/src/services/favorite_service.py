@@ -1,10 +1,29 @@
 """Favorite service for business logic."""
+import logging
 from typing import List
 from uuid import UUID
 
+from redis.exceptions import RedisError
+
+from core import token_blacklist
 from repositories.favorite_repository import FavoriteRepository
 from services.base import BaseService
 
+logger = logging.getLogger(__name__)
+
+# Each user's favorited pet ids are mirrored in a Redis set, loaded on first check
+# and dropped after every committed change. The short TTL bounds staleness from
+# changes the set does not see: cascade deletes of pets or users, and a load
+# that races a concurrent change.
+FAVORITES_SET_TTL = 60
+# Keeps the set of a user without favorites in existence, so it is not reloaded
+EMPTY_MARKER = ""
+
+
+def _favorites_key(user_id: UUID) -> str:
+    """Get the Redis set holding a user's favorited pet ids."""
+    return f"favs:{user_id}"
+
 
 class FavoriteService(BaseService[None, FavoriteRepository]):
     """Service for Favorite business logic."""
@@ -48,10 +67,15 @@ class FavoriteService(BaseService[None, FavoriteRepository]):
         if existing:
             return existing
         
-        return await self.repository.create({
+        favorite = await self.repository.create({
             "user_id": user_id,
             "pet_id": pet_id
         })
+        
+        # The repository has committed; the next check reloads the set
+        self._forget_favorites(user_id)
+        
+        return favorite
     
     async def remove_favorite(
         self,
@@ -68,7 +92,12 @@ class FavoriteService(BaseService[None, FavoriteRepository]):
         Returns:
             True if removed, False if not found.
         """
-        return await self.repository.delete_by_user_and_pet(user_id, pet_id)
+        removed = await self.repository.delete_by_user_and_pet(user_id, pet_id)
+        
+        if removed:
+            self._forget_favorites(user_id)
+        
+        return removed
     
     async def is_favorited(
         self,
@@ -78,6 +107,9 @@ class FavoriteService(BaseService[None, FavoriteRepository]):
         """
         Check if pet is favorited by user.
         
+        Answered from the user's Redis set when it is loaded; otherwise the
+        set is loaded from the database once.
+        
         Args:
             user_id: UUID of the user.
             pet_id: UUID of the pet.
@@ -85,4 +117,36 @@ class FavoriteService(BaseService[None, FavoriteRepository]):
         Returns:
             True if favorited, False otherwise.
         """
-        return await self.repository.is_favorited(user_id, pet_id)
+        client = token_blacklist.redis_client
+        if client is None:
+            return await self.repository.is_favorited(user_id, pet_id)
+        
+        key = _favorites_key(user_id)
+        try:
+            pipe = client.pipeline(transaction=False)
+            pipe.exists(key)
+            pipe.sismember(key, str(pet_id))
+            loaded, is_member = pipe.execute()
+            if loaded:
+                return bool(is_member)
+            
+            pet_ids = [str(id) for id in await self.repository.get_user_pet_ids(user_id)]
+            pipe = client.pipeline()
+            pipe.sadd(key, EMPTY_MARKER, *pet_ids)
+            pipe.expire(key, FAVORITES_SET_TTL)
+            pipe.execute()
+            return str(pet_id) in pet_ids
+        except RedisError as e:
+            logger.error("Failed to check favorites of user %s in Redis: %s", user_id, e)
+            return await self.repository.is_favorited(user_id, pet_id)
+    
+    @staticmethod
+    def _forget_favorites(user_id: UUID) -> None:
+        """Drop a user's Redis set so it is reloaded from the database."""
+        client = token_blacklist.redis_client
+        if client is None:
+            return
+        try:
+            client.delete(_favorites_key(user_id))
+        except RedisError as e:
+            logger.error("Failed to drop favorites of user %s from Redis: %s", user_id, e)
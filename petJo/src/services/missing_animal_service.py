@@ -1,6 +1,8 @@
 """Service layer for missing animal operations."""
 import logging
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
 from fastapi import HTTPException, status
 
 from repositories.missing_animal_repository import MissingAnimalRepository
@@ -18,27 +20,35 @@ class MissingAnimalService:
     
     async def create_report(
         self,
-        owner_id: str,
-        report_data: MissingAnimalCreate
+        owner_id: UUID,
+        report_data: MissingAnimalCreate,
+        photo_urls: Optional[List[str]] = None
     ) -> MissingAnimal:
-        """Create a new missing animal report."""
-        logger.info(f"Creating missing animal report for owner: {owner_id}")
+        """Create a new missing animal report; the first photo is its main photo."""
+        logger.info("Creating missing animal report for owner: %s", owner_id)
         
         # Prepare data
         data = report_data.model_dump()
         data["owner_id"] = owner_id
+        if photo_urls:
+            data["photo_urls"] = ",".join(photo_urls)
         
         # Normalize animal type
         if data.get("animal_type"):
             data["animal_type"] = data["animal_type"].lower()
         
         report = await self.repository.create(data)
-        logger.info(f"Missing animal report created: {report.id}")
+        logger.info("Missing animal report created: %s", report.id)
         return report
     
-    async def get_user_reports(self, owner_id: str) -> List[MissingAnimal]:
-        """Get all missing animal reports for a user."""
-        return await self.repository.get_by_owner(owner_id)
+    async def get_user_reports(
+        self,
+        owner_id: UUID,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[MissingAnimal]:
+        """Get missing animal reports for a user, newest first."""
+        return await self.repository.get_by_owner(owner_id, limit=limit, after=after)
     
     async def get_public_reports(
         self,
@@ -57,6 +67,23 @@ class MissingAnimalService:
             status=status
         )
     
+    async def get_public_reports_with_total(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        city_id: Optional[int] = None,
+        animal_type: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> Tuple[List[MissingAnimal], int]:
+        """Get public missing animal reports with filters, and their total count."""
+        return await self.repository.get_active_reports_with_total(
+            skip=skip,
+            limit=limit,
+            city_id=city_id,
+            animal_type=animal_type,
+            status=status
+        )
+    
     async def count_reports(
         self,
         city_id: Optional[int] = None,
@@ -76,8 +103,8 @@ class MissingAnimalService:
         skip: int = 0,
         limit: int = 20,
         city_id: Optional[int] = None
-    ) -> List[MissingAnimal]:
-        """Search missing animal reports."""
+    ) -> Tuple[List[MissingAnimal], int]:
+        """Search missing animal reports, returning a page and the total match count."""
         if not search_term or len(search_term.strip()) < 2:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -94,7 +121,7 @@ class MissingAnimalService:
     async def update_report(
         self,
         report_id: int,
-        owner_id: str,
+        owner_id: UUID,
         update_data: MissingAnimalUpdate
     ) -> MissingAnimal:
         """Update a missing animal report."""
@@ -107,7 +134,7 @@ class MissingAnimalService:
             )
         
         # Verify ownership
-        if str(report.owner_id) != owner_id:
+        if report.owner_id != owner_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to update this report"
@@ -121,13 +148,13 @@ class MissingAnimalService:
             data["animal_type"] = data["animal_type"].lower()
         
         updated_report = await self.repository.update(report_id, data)
-        logger.info(f"Missing animal report updated: {report_id}")
+        logger.info("Missing animal report updated: %s", report_id)
         return updated_report
     
     async def update_status(
         self,
         report_id: int,
-        owner_id: str,
+        owner_id: UUID,
         new_status: str
     ) -> MissingAnimal:
         """Update the status of a missing animal report."""
@@ -140,7 +167,7 @@ class MissingAnimalService:
             )
         
         # Verify ownership
-        if str(report.owner_id) != owner_id:
+        if report.owner_id != owner_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to update this report"
@@ -155,13 +182,13 @@ class MissingAnimalService:
             )
         
         updated_report = await self.repository.update_status(report_id, new_status)
-        logger.info(f"Missing animal report {report_id} status updated to: {new_status}")
+        logger.info("Missing animal report %s status updated to: %s", report_id, new_status)
         return updated_report
     
     async def deactivate_report(
         self,
         report_id: int,
-        owner_id: str
+        owner_id: UUID
     ) -> MissingAnimal:
         """Deactivate/close a missing animal report."""
         report = await self.repository.get(report_id)
@@ -173,14 +200,14 @@ class MissingAnimalService:
             )
         
         # Verify ownership
-        if str(report.owner_id) != owner_id:
+        if report.owner_id != owner_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to close this report"
             )
         
         updated_report = await self.repository.update(report_id, {"is_active": False})
-        logger.info(f"Missing animal report deactivated: {report_id}")
+        logger.info("Missing animal report deactivated: %s", report_id)
         return updated_report
     
     async def get_recent_reports(
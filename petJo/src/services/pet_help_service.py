@@ -1,7 +1,9 @@
 """Pet help request service for business logic."""
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from uuid import UUID
 
+from models.pet_help_request import PetHelpRequest
 from repositories.pet_help_repository import PetHelpRequestRepository
 from services.base import BaseService
 
@@ -25,37 +27,41 @@ class PetHelpRequestService(BaseService[None, PetHelpRequestRepository]):
         self,
         owner_id: UUID,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None
     ):
         """
-        Get all help requests belonging to a user.
+        Get help requests belonging to a user, newest first.
         
         Args:
             owner_id: UUID of the user.
             skip: Number of records to skip.
             limit: Maximum number of records to return.
+            after: Keyset position (created_at, id) to resume after.
             
         Returns:
             List of user's help requests.
         """
-        return await self.repository.get_by_owner(owner_id, skip, limit)
+        return await self.repository.get_by_owner(owner_id, skip, limit, after)
     
     async def get_all_public_requests(
         self,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None
     ):
         """
-        Get all public help requests.
+        Get all public help requests, newest first.
         
         Args:
             skip: Number of records to skip.
             limit: Maximum number of records to return.
+            after: Keyset position (created_at, id) to resume after.
             
         Returns:
             List of all help requests.
         """
-        return await self.repository.get_all_public(skip, limit)
+        return await self.repository.get_all_public(skip, limit, after)
     
     async def search_by_location(
         self,
@@ -63,10 +69,11 @@ class PetHelpRequestService(BaseService[None, PetHelpRequestRepository]):
         lng: float,
         radius_km: float = 10.0,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None
     ):
         """
-        Search help requests by location.
+        Search help requests by location, newest first.
         
         Args:
             lat: Latitude of search center.
@@ -74,12 +81,13 @@ class PetHelpRequestService(BaseService[None, PetHelpRequestRepository]):
             radius_km: Search radius in kilometers.
             skip: Number of records to skip.
             limit: Maximum number of records to return.
+            after: Keyset position (created_at, id) to resume after.
             
         Returns:
             List of help requests within radius.
         """
         return await self.repository.search_by_location(
-            lat, lng, radius_km, skip, limit
+            lat, lng, radius_km, skip, limit, after
         )
     
     async def verify_owner(self, help_id: int, user_id: UUID) -> bool:
@@ -97,3 +105,46 @@ class PetHelpRequestService(BaseService[None, PetHelpRequestRepository]):
         if not help_request:
             return False
         return str(help_request.owner_id) == str(user_id)
+    
+    async def update_if_owner(
+        self,
+        help_id: int,
+        user_id: UUID,
+        data: dict
+    ) -> Optional[PetHelpRequest]:
+        """
+        Update a help request in one statement, only if the user owns it.
+        
+        Args:
+            help_id: ID of the help request.
+            user_id: UUID of the user.
+            data: Fields to update.
+            
+        Returns:
+            Updated help request, or None if it does not exist or belongs
+            to someone else.
+        """
+        if not data:
+            help_request = await self.repository.get_by_id(help_id)
+            return help_request if help_request and help_request.owner_id == user_id else None
+        
+        return await self.repository.update_returning(
+            help_id, data, PetHelpRequest.owner_id == user_id
+        )
+    
+    async def delete_if_owner(self, help_id: int, user_id: UUID) -> bool:
+        """
+        Delete a help request in one statement, only if the user owns it.
+        
+        Args:
+            help_id: ID of the help request.
+            user_id: UUID of the user.
+            
+        Returns:
+            True if the request was deleted, False if it does not exist or
+            belongs to someone else.
+        """
+        deleted = await self.repository.delete_returning(
+            help_id, PetHelpRequest.owner_id == user_id
+        )
+        return deleted is not None
@@ -1,7 +1,8 @@
 """Pet photo service for business logic."""
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
+from models.pet_photo import PetPhoto
 from repositories.pet_photo_repository import PetPhotoRepository
 from services.base import BaseService
 
@@ -27,3 +28,54 @@ class PetPhotoService(BaseService[None, PetPhotoRepository]):
             List of pet photos.
         """
         return await self.repository.get_pet_photos(pet_id, skip, limit)
+    
+    async def add_photos(self, pet_id: UUID, urls: List[str]) -> List:
+        """
+        Add several photos to a pet in one statement.
+        
+        Args:
+            pet_id: UUID of the pet.
+            urls: URLs of the photos, in display order.
+            
+        Returns:
+            List of created photos.
+        """
+        return await self.repository.create_many(pet_id, urls)
+    
+    async def add_if_pet_owner(
+        self,
+        pet_id: UUID,
+        user_id: UUID,
+        url: str
+    ) -> Optional[PetPhoto]:
+        """
+        Add a photo to a pet, only if the user owns the pet.
+        
+        Args:
+            pet_id: UUID of the pet.
+            user_id: UUID of the user.
+            url: URL of the photo.
+            
+        Returns:
+            The created photo, or None if the user does not own the pet.
+        """
+        return await self.repository.create_for_owner(pet_id, user_id, url)
+    
+    async def delete_if_pet_owner(
+        self,
+        photo_id: int,
+        pet_id: UUID,
+        user_id: UUID
+    ) -> bool:
+        """
+        Delete a pet photo, only if the user owns the pet.
+        
+        Args:
+            photo_id: ID of the photo.
+            pet_id: UUID of the pet.
+            user_id: UUID of the user.
+            
+        Returns:
+            True if the photo was deleted, False otherwise.
+        """
+        return await self.repository.delete_for_owner(photo_id, pet_id, user_id)
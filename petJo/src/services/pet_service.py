@@ -1,9 +1,12 @@
 """Pet service for business logic."""
+from datetime import datetime
 from typing import List, Optional, Tuple
 from uuid import UUID
 
+from models.pet import Pet
 from repositories.pet_repository import PetRepository
 from services.base import BaseService
+from utils.filters import PetSearchFilters
 
 
 class PetService(BaseService[None, PetRepository]):
@@ -17,10 +20,11 @@ class PetService(BaseService[None, PetRepository]):
         self, 
         owner_id: UUID, 
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, UUID]] = None
     ):
-        """Get all pets belonging to a user."""
-        return await self.repository.get_by_owner(owner_id, skip, limit)
+        """Get pets belonging to a user, newest first."""
+        return await self.repository.get_by_owner(owner_id, skip, limit, after)
     
     async def search_available_pets(
         self,
@@ -28,52 +32,64 @@ class PetService(BaseService[None, PetRepository]):
         limit: int = 100,
         city_id: Optional[int] = None,
         category_id: Optional[int] = None,
-        search_term: Optional[str] = None
+        search_term: Optional[str] = None,
+        after: Optional[Tuple[datetime, UUID]] = None
     ):
-        """Search and filter available pets."""
+        """Search and filter available pets, newest first."""
         if search_term:
-            return await self.repository.search_pets(search_term, skip, limit)
+            return await self.repository.search_pets(search_term, skip, limit, after)
         
         return await self.repository.get_available_pets(
-            skip, limit, city_id, category_id
+            skip, limit, city_id, category_id, after
         )
     
-    async def verify_owner(self, pet_id: UUID, user_id: UUID) -> bool:
-        """Verify if user is the owner of the pet."""
-        pet = await self.repository.get_by_id(pet_id)
-        if not pet:
-            return False
-        return str(pet.owner_id) == str(user_id)
+    async def update_if_owner(
+        self,
+        pet_id: UUID,
+        user_id: UUID,
+        data: dict
+    ) -> Optional[Pet]:
+        """
+        Update a pet in one statement, only if the user owns it.
+        
+        Returns None when the pet does not exist, is deleted or belongs to
+        someone else.
+        """
+        if not data:
+            return await self.repository.get_owned(pet_id, user_id)
+        
+        return await self.repository.update_returning(
+            pet_id, data, Pet.owner_id == user_id, Pet.deleted_at.is_(None)
+        )
+    
+    async def delete_if_owner(self, pet_id: UUID, user_id: UUID) -> bool:
+        """Soft delete a pet in one statement, only if the user owns it."""
+        pet = await self.update_if_owner(pet_id, user_id, {"deleted_at": datetime.utcnow()})
+        return pet is not None
     
-    async def publish_pet(self, pet_id: UUID, user_id: UUID) -> Optional[any]:
+    async def publish_pet(self, pet_id: UUID, user_id: UUID) -> Optional[Pet]:
         """Make a pet listing public."""
-        if not await self.verify_owner(pet_id, user_id):
-            return None
-        
-        return await self.repository.update(pet_id, {"visibility": "public"})
+        return await self.update_if_owner(pet_id, user_id, {"visibility": "public"})
     
-    async def unpublish_pet(self, pet_id: UUID, user_id: UUID) -> Optional[any]:
+    async def unpublish_pet(self, pet_id: UUID, user_id: UUID) -> Optional[Pet]:
         """Make a pet listing private."""
-        if not await self.verify_owner(pet_id, user_id):
-            return None
-        
-        return await self.repository.update(pet_id, {"visibility": "private"})
+        return await self.update_if_owner(pet_id, user_id, {"visibility": "private"})
     
     async def advanced_search(
         self,
-        filters: dict,
+        filters: PetSearchFilters,
         skip: int = 0,
         limit: int = 100
-    ) -> Tuple[List, int]:
+    ) -> Tuple[List, bool]:
         """
         Perform advanced search with multiple filters.
         
         Args:
-            filters: Dictionary of filter criteria.
+            filters: Search filters.
             skip: Number of records to skip.
             limit: Maximum number of records to return.
             
         Returns:
-            Tuple of (list of pets, total count).
+            Tuple of (list of pets, whether more pets follow).
         """
         return await self.repository.advanced_search(filters, skip, limit)
@@ -3,7 +3,7 @@ from uuid import UUID
 
 from repositories.user_repository import UserRepository
 from services.base import BaseService
-from core.security import verify_password, get_password_hash
+from core.security import check_password, hash_password
 from core.config import settings
 
 
@@ -21,14 +21,23 @@ class UserService(BaseService[None, UserRepository]):
         if not user.hashed_password:
             return None
         
-        if not verify_password(password, user.hashed_password):
+        verified, new_hash = await check_password(password, user.hashed_password)
+        if not verified:
             return None
         
         if not user.is_active:
             return None
         
+        # Upgrade legacy bcrypt hashes while the plain password is at hand
+        if new_hash:
+            user = await self.repository.update_returning(user.id, {"hashed_password": new_hash})
+        
         return user
     
+    async def get_by_email(self, email: str):
+        """Get a user by email, or None."""
+        return await self.repository.get_by_email(email)
+    
     async def create_user(self, email: str, password: str, full_name: Optional[str] = None):
         """Create a new user with hashed password."""
         from exceptions import EmailAlreadyExistsException
@@ -38,7 +47,7 @@ class UserService(BaseService[None, UserRepository]):
         
         user_data = {
             "email": email,
-            "hashed_password": get_password_hash(password),
+            "hashed_password": await hash_password(password),
             "full_name": full_name,
             "is_active": True,
             "is_superuser": False
@@ -50,12 +59,16 @@ class UserService(BaseService[None, UserRepository]):
         """Change user password."""
         user = await self.repository.get_by_id(user_id)
         
-        if not user or not verify_password(old_password, user.hashed_password):
+        if not user or not user.hashed_password:
+            return False
+        
+        verified, _ = await check_password(old_password, user.hashed_password)
+        if not verified:
             return False
         
         await self.repository.update(
             user_id, 
-            {"hashed_password": get_password_hash(new_password)}
+            {"hashed_password": await hash_password(new_password)}
         )
         return True
     
@@ -122,7 +135,7 @@ class UserService(BaseService[None, UserRepository]):
         
         user_data = {
             "email": email,
-            "hashed_password": get_password_hash(password),
+            "hashed_password": await hash_password(password),
             "full_name": full_name or "Super Admin",
             "is_active": True,
             "is_superuser": True
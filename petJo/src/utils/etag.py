@@ -0,0 +1,25 @@
+"""Conditional GET support."""
+
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request, Response, status
+
+
+def etag_response(request: Request, content: Any) -> Response:
+    """
+    Serialize content to JSON and tag it with a weak ETag of the body.
+    
+    A request whose If-None-Match already holds the tag gets an empty 304
+    instead of the body.
+    """
+    body = orjson.dumps(content)
+    etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
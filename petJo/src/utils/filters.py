@@ -1,7 +1,9 @@
 """Filtering utilities."""
 
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from utils.helpers import async_safe
 
 
 class PetFilter(BaseModel):
@@ -25,6 +27,30 @@ class PetFilter(BaseModel):
         return {k: v for k, v in self.model_dump().items() if v is not None and k != 'search'}
 
 
+# Use with Depends() instead of the class itself
+pet_filter_params = async_safe(PetFilter)
+
+
+class PetSearchFilters(BaseModel):
+    """Filter parameters for the advanced pet search."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    q: Optional[str] = Field(None, description="Search query for name, breed, or description")
+    category_id: Optional[int] = Field(None, description="Filter by category ID")
+    city_id: Optional[int] = Field(None, description="Filter by city ID")
+    status: Optional[str] = Field(None, description="Filter by status (available, adopted, lost, found, help)")
+    gender: Optional[str] = Field(None, description="Filter by gender (male, female)")
+    min_age: Optional[int] = Field(None, ge=0, description="Minimum age in months")
+    max_age: Optional[int] = Field(None, ge=0, description="Maximum age in months")
+    vaccinated: Optional[bool] = Field(None, description="Filter by vaccination status")
+    spayed: Optional[bool] = Field(None, description="Filter by spayed/neutered status")
+
+
+# Use with Depends() instead of the class itself
+pet_search_params = async_safe(PetSearchFilters)
+
+
 class SortParams(BaseModel):
     """Sorting parameters."""
     
@@ -1,10 +1,16 @@
 """Helper utilities."""
 
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar
 from datetime import datetime, timedelta
 import hashlib
+import inspect
 import secrets
 
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+
+T = TypeVar("T")
+
 
 def generate_token(length: int = 32) -> str:
     """Generate a random token."""
@@ -45,3 +51,25 @@ def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
 def build_file_url(base_url: str, file_path: str) -> str:
     """Build complete file URL."""
     return f"{base_url.rstrip('/')}/{file_path.lstrip('/')}"
+
+
+def async_safe(model: Callable[..., T]) -> Callable[..., Any]:
+    """
+    Wrap a class-based dependency in a coroutine with the same signature.
+
+    FastAPI runs plain callables such as Depends(PaginationParams) in the
+    anyio threadpool; the wrapper exposes the same query parameters but is
+    resolved directly on the event loop. Constraints of the model's fields
+    are reported as query errors (422), like those of plain Query parameters.
+    """
+    async def dependency(**params: Any) -> T:
+        try:
+            return model(**params)
+        except ValidationError as e:
+            raise RequestValidationError(
+                [{**error, "loc": ("query", *error["loc"])} for error in e.errors()]
+            )
+
+    dependency.__signature__ = inspect.signature(model)
+    dependency.__name__ = f"{model.__name__}_dependency"
+    return dependency
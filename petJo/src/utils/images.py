@@ -0,0 +1,30 @@
+"""Image processing utilities."""
+
+import io
+from typing import BinaryIO
+
+from PIL import Image, ImageOps
+
+WEBP_QUALITY = 82
+
+
+def to_webp(source: BinaryIO, max_side: int) -> io.BytesIO:
+    """
+    Downscale an image to fit within max_side pixels and encode it as WebP.
+
+    CPU-bound; call it through asyncio.to_thread from request handlers.
+
+    Raises:
+        OSError: If the source is not a readable image.
+        PIL.Image.DecompressionBombError: If the image is implausibly large.
+    """
+    with Image.open(source) as img:
+        # Apply the camera orientation, which re-encoding would otherwise drop
+        img = ImageOps.exif_transpose(img)
+        img.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA")
+        out = io.BytesIO()
+        img.save(out, "WEBP", quality=WEBP_QUALITY, method=4)
+    out.seek(0)
+    return out
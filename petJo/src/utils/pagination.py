@@ -1,9 +1,15 @@
 """Pagination utilities."""
 
-from typing import TypeVar, Generic, List
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from typing import Any, Callable, TypeVar, Generic, List, Optional, Tuple
+from uuid import UUID
 from pydantic import BaseModel, Field
 from math import ceil
 
+from exceptions import ValidationException
+from utils.helpers import async_safe
+
 T = TypeVar('T')
 
 
@@ -24,14 +30,26 @@ class PaginationParams(BaseModel):
         return self.page_size
 
 
+class CursorPaginationParams(BaseModel):
+    """Keyset pagination parameters."""
+    
+    cursor: Optional[str] = Field(default=None, description="Cursor returned by the previous page")
+    limit: int = Field(default=20, ge=1, le=100, description="Items per page")
+
+
+# Use these with Depends() instead of the classes themselves
+pagination_params = async_safe(PaginationParams)
+cursor_pagination_params = async_safe(CursorPaginationParams)
+
+
 class PaginatedResponse(BaseModel, Generic[T]):
-    """Generic paginated response."""
+    """Generic paginated response. Listings that skip counting leave total and total_pages unset."""
     
     items: List[T]
-    total: int
+    total: Optional[int] = None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
     has_next: bool
     has_prev: bool
     
@@ -41,14 +59,32 @@ class PaginatedResponse(BaseModel, Generic[T]):
 
 def paginate(
     items: List[T],
-    total: int,
+    total: Optional[int],
     page: int,
-    page_size: int
+    page_size: int,
+    has_more: Optional[bool] = None
 ) -> PaginatedResponse[T]:
-    """Create a paginated response."""
+    """
+    Create a paginated response.
+    
+    Pass total=None with has_more, found by fetching one row past the page,
+    to build a page without counting all matches.
+    
+    The items are not validated again: they are either already dumped or
+    validated by the endpoint's response model.
+    """
+    if total is None:
+        return PaginatedResponse.model_construct(
+            items=items,
+            page=page,
+            page_size=page_size,
+            has_next=bool(has_more),
+            has_prev=page > 1
+        )
+    
     total_pages = ceil(total / page_size) if total > 0 else 0
     
-    return PaginatedResponse(
+    return PaginatedResponse.model_construct(
         items=items,
         total=total,
         page=page,
@@ -57,3 +93,37 @@ def paginate(
         has_next=page < total_pages,
         has_prev=page > 1
     )
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """Keyset-paginated response."""
+    
+    items: List[T]
+    next_cursor: Optional[str] = None
+    
+    class Config:
+        from_attributes = True
+
+
+def encode_cursor(created_at: datetime, id: Any) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor."""
+    raw = f"{created_at.isoformat()}|{id}"
+    return urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str, id_type: Callable[[str], Any] = UUID) -> Tuple[datetime, Any]:
+    """Decode a cursor produced by encode_cursor."""
+    try:
+        created_at, id = urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), id_type(id)
+    except ValueError:
+        raise ValidationException("Invalid pagination cursor")
+
+
+def cursor_page(items: List[T], limit: int) -> CursorPage[T]:
+    """Create a keyset page from up to ``limit + 1`` rows ordered newest first."""
+    has_next = len(items) > limit
+    items = items[:limit]
+    next_cursor = encode_cursor(items[-1].created_at, items[-1].id) if has_next else None
+    
+    return CursorPage.model_construct(items=items, next_cursor=next_cursor)
@@ -0,0 +1,37 @@
+"""Response helpers for endpoints that serialize their payload themselves."""
+
+from typing import Any, Callable, List, Optional
+
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+
+from schemas.common import ApiResponse
+
+
+def fast_response(data: Any, message: Optional[str] = None) -> ORJSONResponse:
+    """
+    Serialize an already-validated payload straight to JSON.
+
+    Used by listings instead of a response_model, which would validate the
+    page a second time; their schema is declared via `responses`.
+    """
+    return ORJSONResponse(
+        ApiResponse.model_construct(success=True, data=data, message=message).model_dump()
+    )
+
+
+def items_serializer(schema: Any, exclude_none: bool = False) -> Callable[[Any], list]:
+    """
+    Build a function that converts ORM rows to JSON-ready dicts of a schema.
+
+    The TypeAdapter is compiled once, and each call validates a whole list
+    of rows in a single pass.
+    """
+    adapter = TypeAdapter(List[schema])
+
+    def serialize(rows) -> list:
+        return adapter.dump_python(
+            adapter.validate_python(rows, from_attributes=True), mode="json", exclude_none=exclude_none
+        )
+
+    return serialize